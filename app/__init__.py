@@ -1,10 +1,31 @@
 # app/__init__.py
 
-# Import key modules for easy access when the app package is imported
-from .parser import ResumeParser
-from .extractor import ResumeExtractor
-from .scorer import ResumeScorer
-from .recommender import ResumeRecommender
-from .matcher import ResumeMatcher
-
-# Optionally, initialize common functionality for the app package
\ No newline at end of file
+import importlib
+
+# Key classes for easy access, imported on first attribute access (PEP 562) so that
+# e.g. scoring code does not pay for the parser and NLP dependencies it never uses
+_LAZY_EXPORTS = {
+    "ResumeParser": ".parser",
+    "ResumeExtractor": ".extractor",
+    "ResumeScorer": ".scorer",
+    "ResumeRecommender": ".recommender",
+    "ResumeMatcher": ".matcher",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the module defining an exported class the first time the class is used."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip this function
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazy exports alongside the attributes already loaded."""
+    return sorted(set(globals()) | set(__all__))
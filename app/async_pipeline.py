@@ -0,0 +1,304 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterator, Iterable, List, Optional, Union
+
+from .parser import ResumeParser
+from .extractor import ResumeExtractor
+from .recommender import ResumeRecommender
+from .job_profile import JobProfile
+from .pipeline import DEFAULT_SKILL_KEYWORDS, score_extracted
+
+STAGES = ("parse", "extract", "score")
+
+# Marks the end of a stage queue
+_DONE = object()
+
+
+class StageStats:
+    """Throughput and input-queue depth of one pipeline stage."""
+
+    def __init__(self, name: str, queue: Optional[asyncio.Queue] = None):
+        """
+        Initialize the StageStats.
+
+        Args:
+            name (str): Stage name.
+            queue (asyncio.Queue, optional): The stage's input queue, for live depth.
+        """
+        self.name = name
+        self.queue = queue
+        self.items = 0
+        self.busy_seconds = 0.0
+        self.depth_samples = 0
+        self.depth_total = 0
+        self.max_depth = 0
+
+    def sample_depth(self):
+        """Record the current depth of the input queue; called whenever the stage takes work."""
+        if self.queue is None:
+            return
+        depth = self.queue.qsize()
+        self.depth_samples += 1
+        self.depth_total += depth
+        self.max_depth = max(self.max_depth, depth)
+
+    def add(self, items: int, seconds: float):
+        """Count finished items and the time spent on them."""
+        self.items += items
+        self.busy_seconds += seconds
+
+    def summary(self, elapsed: float) -> dict:
+        """
+        Summarize the stage.
+
+        Args:
+            elapsed (float): Wall time of the run so far.
+
+        Returns:
+            dict: Items, busy time, throughput and queue depth statistics.
+        """
+        return {
+            "items": self.items,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "items_per_second": round(self.items / elapsed, 2) if elapsed else 0.0,
+            "queue_depth": self.queue.qsize() if self.queue is not None else 0,
+            "queue_capacity": self.queue.maxsize if self.queue is not None else 0,
+            "mean_queue_depth": round(self.depth_total / self.depth_samples, 2) if self.depth_samples else 0.0,
+            "max_queue_depth": self.max_depth,
+        }
+
+
+class PipelineStats:
+    """Per-stage statistics for an asynchronous batch run."""
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.started = time.perf_counter()
+        self.stages = {name: StageStats(name) for name in STAGES}
+
+    def bottleneck(self) -> Optional[str]:
+        """
+        Name the stage that limits throughput.
+
+        Work piles up in front of the slowest stage, so this is the stage whose
+        input queue was fullest on average.
+
+        Returns:
+            str: Stage name, or None before any work was observed.
+        """
+        sampled = [stage for stage in self.stages.values() if stage.depth_samples]
+        if not sampled:
+            return None
+        return max(sampled, key=lambda stage: stage.depth_total / stage.depth_samples).name
+
+    def summary(self) -> dict:
+        """
+        Summarize the run.
+
+        Returns:
+            dict: Wall time, per-stage statistics and the likely bottleneck stage.
+        """
+        elapsed = time.perf_counter() - self.started
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "stages": {name: stage.summary(elapsed) for name, stage in self.stages.items()},
+            "bottleneck": self.bottleneck(),
+        }
+
+
+def _parse(file_path: str, use_cache: bool, backend: str) -> tuple:
+    """Extract the text of one resume in a pool worker, returning (text, seconds)."""
+    start = time.perf_counter()
+    text = ResumeParser(file_path, use_cache=use_cache, backend=backend).extract_text()
+    return text, time.perf_counter() - start
+
+
+def _extract(texts: List[str], skill_keywords: list, nlp) -> List[dict]:
+    """Run NER and field extraction over one batch of texts."""
+    return list(ResumeExtractor.extract_batch(texts, skill_keywords, batch_size=len(texts), nlp=nlp))
+
+
+async def analyze_batch_async(file_paths: Iterable[str], job_description: Union[str, JobProfile],
+                              skill_keywords: Optional[list] = None, use_cache: bool = True,
+                              backend: str = "auto", parse_workers: Optional[int] = None,
+                              use_processes: bool = False, queue_size: int = 16, nlp_batch_size: int = 8,
+                              nlp=None, stats: Optional[PipelineStats] = None) -> AsyncIterator[dict]:
+    """
+    Analyze many resumes with parsing, NER and scoring running concurrently.
+
+    Files are parsed on a pool while texts parsed earlier go through NER on a
+    dedicated thread, in batches of whatever has arrived. Every stage reads
+    from a bounded queue, so a slow stage holds the others back instead of
+    letting parsed texts pile up in memory.
+
+    Args:
+        file_paths (iterable): Resume files; may be a generator.
+        job_description (str or JobProfile): Job description text or a prebuilt profile.
+        skill_keywords (list, optional): Skills to look for (default: DEFAULT_SKILL_KEYWORDS).
+        use_cache (bool): Reuse cached extracted text (default: True).
+        backend (str): ResumeParser backend (default: "auto").
+        parse_workers (int, optional): Files parsed at once (default: CPU count).
+        use_processes (bool): Parse in worker processes instead of threads, for
+            CPU-bound in-process backends such as pdfminer (default: False).
+        queue_size (int): Capacity of each stage's input queue (default: 16).
+        nlp_batch_size (int): Most texts per nlp.pipe call (default: 8).
+        nlp (spacy.language.Language, optional): Pipeline for NER (default: the registry's NER pipeline).
+        stats (PipelineStats, optional): Collector updated as the run progresses.
+
+    Yields:
+        dict: "file" plus the fields returned by pipeline.analyze_resume, or
+            "file" and an "error" message, in completion order.
+    """
+    skill_keywords = skill_keywords if skill_keywords is not None else DEFAULT_SKILL_KEYWORDS
+    job_profile = JobProfile.coerce(job_description)
+    parse_workers = parse_workers or os.cpu_count() or 1
+    stats = stats if stats is not None else PipelineStats()
+    loop = asyncio.get_running_loop()
+
+    paths = asyncio.Queue(maxsize=queue_size)
+    texts = asyncio.Queue(maxsize=queue_size)
+    extracted = asyncio.Queue(maxsize=queue_size)
+    results = asyncio.Queue(maxsize=queue_size)
+    for name, queue in zip(STAGES, (paths, texts, extracted)):
+        stats.stages[name].queue = queue
+
+    pool_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    parse_pool = pool_class(max_workers=parse_workers)
+    # One thread keeps NER off the event loop; spaCy pipelines are not shared across threads
+    nlp_pool = ThreadPoolExecutor(max_workers=1)
+    # Work handed to the pools and not yet finished, cancelled if the run ends early
+    submitted = set()
+
+    def run_in(pool, func, *args) -> asyncio.Future:
+        future = pool.submit(func, *args)
+        submitted.add(future)
+        wrapped = asyncio.wrap_future(future, loop=loop)
+        # Done callbacks of the wrapper run on the event loop, like the cleanup below
+        wrapped.add_done_callback(lambda _: submitted.discard(future))
+        return wrapped
+
+    async def feed():
+        try:
+            for file_path in file_paths:
+                await paths.put(file_path)
+        finally:
+            for _ in range(parse_workers):
+                await paths.put(_DONE)
+
+    async def parse():
+        stage = stats.stages["parse"]
+        while True:
+            stage.sample_depth()
+            file_path = await paths.get()
+            if file_path is _DONE:
+                await texts.put(_DONE)
+                return
+            try:
+                text, seconds = await run_in(parse_pool, _parse, file_path, use_cache, backend)
+            except Exception as e:
+                await results.put({"file": file_path, "error": f"parse: {e}"})
+                continue
+            stage.add(1, seconds)
+            await texts.put((file_path, text))
+
+    async def extract():
+        stage = stats.stages["extract"]
+        remaining_parsers = parse_workers
+        while remaining_parsers:
+            stage.sample_depth()
+            batch = []
+            item = await texts.get()
+            # Take whatever else is already waiting, up to one batch
+            while True:
+                if item is _DONE:
+                    remaining_parsers -= 1
+                else:
+                    batch.append(item)
+                if len(batch) >= nlp_batch_size or not remaining_parsers or texts.empty():
+                    break
+                item = texts.get_nowait()
+            if not batch:
+                continue
+
+            start = time.perf_counter()
+            try:
+                records = await run_in(nlp_pool, _extract, [text for _, text in batch], skill_keywords, nlp)
+            except Exception as e:
+                for file_path, _ in batch:
+                    await results.put({"file": file_path, "error": f"extract: {e}"})
+                continue
+            stage.add(len(batch), time.perf_counter() - start)
+            for (file_path, _), record in zip(batch, records):
+                await extracted.put((file_path, record))
+        await extracted.put(_DONE)
+
+    async def score():
+        stage = stats.stages["score"]
+        while True:
+            stage.sample_depth()
+            item = await extracted.get()
+            if item is _DONE:
+                await results.put(_DONE)
+                return
+            file_path, extracted_data = item
+            start = time.perf_counter()
+            try:
+                result = score_extracted(extracted_data, job_profile)
+                result["recommendations"] = ResumeRecommender(extracted_data, job_profile).get_recommendations()
+            except Exception as e:
+                result = {"error": f"score: {e}"}
+            stage.add(1, time.perf_counter() - start)
+            await results.put(dict(file=file_path, **result))
+
+    tasks = [loop.create_task(feed()), loop.create_task(extract()), loop.create_task(score())]
+    tasks += [loop.create_task(parse()) for _ in range(parse_workers)]
+    try:
+        while True:
+            result = await results.get()
+            if result is _DONE:
+                break
+            yield result
+        # Surface failures of the stage tasks themselves
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Executor.shutdown(cancel_futures=True) needs Python 3.9
+        for future in list(submitted):
+            future.cancel()
+        parse_pool.shutdown(wait=False)
+        nlp_pool.shutdown(wait=False)
+
+
+def analyze_batch(file_paths: Iterable[str], job_description: Union[str, JobProfile],
+                  stats: Optional[PipelineStats] = None, **options) -> List[dict]:
+    """
+    Run analyze_batch_async to completion from synchronous code.
+
+    Args:
+        file_paths (iterable): Resume files.
+        job_description (str or JobProfile): Job description text or a prebuilt profile.
+        stats (PipelineStats, optional): Collector updated as the run progresses.
+        **options: Further keyword arguments for analyze_batch_async.
+
+    Returns:
+        list: One result per file, in completion order.
+    """
+    async def collect():
+        return [result async for result in analyze_batch_async(file_paths, job_description, stats=stats, **options)]
+
+    return asyncio.run(collect())
+
+
+# Example usage
+if __name__ == "__main__":
+    from .ingest import find_resume_files
+
+    run_stats = PipelineStats()
+    for analysis in analyze_batch(find_resume_files("data/sample_resumes"),
+                                  "We are looking for a Data Scientist with skills in Python and NLP.",
+                                  stats=run_stats, parse_workers=2):
+        print(analysis["file"], analysis.get("total_score"), analysis.get("error"))
+    print("Stats:", run_stats.summary())
@@ -0,0 +1,290 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+
+from utils.instrumentation import instrumented
+from .job_profile import JobProfile
+from .ranking import keyword_matrix, round_scores, skill_matrix
+from .taxonomy import SkillTaxonomy
+
+# Resumes scored per block; a block's dense scores take block_size x jobs x 8 bytes
+DEFAULT_BLOCK_SIZE = 2048
+
+
+def round_matrix(scores: np.ndarray) -> np.ndarray:
+    """Round a score matrix to two decimals exactly as Python's round() does."""
+    return round_scores(scores.ravel()).reshape(scores.shape)
+
+
+def _top_k_columns(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Return the row indices of the top_k largest values in each column, ties by lower row."""
+    return np.argsort(-scores, axis=0, kind="stable")[:top_k]
+
+
+class BulkMatcher:
+    """Compute ResumeMatcher match scores for every resume against every job at once."""
+
+    def __init__(self, jobs: Sequence[Union[str, JobProfile]], skill_weight: float = 0.7, keyword_weight: float = 0.3):
+        """
+        Initialize the BulkMatcher.
+
+        The jobs are tokenized once into a sparse job x skill matrix (1 per
+        distinct keyword, or per canonical skill ID with a taxonomy) and a sparse
+        job x keyword matrix (each keyword's repeat count), over the union of all
+        jobs' terms.
+
+        Args:
+            jobs (sequence): Job description texts or prebuilt JobProfiles.
+            skill_weight (float): ResumeMatcher skill weight (default: 0.7).
+            keyword_weight (float): ResumeMatcher keyword weight (default: 0.3).
+        """
+        self.job_profiles = [JobProfile.coerce(job) for job in jobs]
+        self.job_names = [str(index) for index in range(len(self.job_profiles))]
+        self.skill_weight = skill_weight
+        self.keyword_weight = keyword_weight
+
+        taxonomies = {id(profile.taxonomy) for profile in self.job_profiles}
+        if len(taxonomies) > 1:
+            raise ValueError("All job profiles must share the same taxonomy, or have none.")
+        self.taxonomy = self.job_profiles[0].taxonomy if self.job_profiles else None
+
+        if self.taxonomy is not None:
+            job_skills = [self.taxonomy.skill_ids_of(profile.skill_bits) for profile in self.job_profiles]
+        else:
+            job_skills = [profile.keyword_set for profile in self.job_profiles]
+        self.skill_vocabulary = {skill: column for column, skill in enumerate(sorted(set().union(*job_skills)))}
+        self.keywords = sorted(set().union(*(profile.keyword_counts for profile in self.job_profiles)))
+
+        # Transposed once, so each block is a single sparse product per matrix
+        self.job_skills = skill_matrix(job_skills, self.skill_vocabulary).T.tocsr()
+        self.skill_counts = np.array([len(skills) for skills in job_skills], dtype=np.float64)
+        columns = {keyword: column for column, keyword in enumerate(self.keywords)}
+        indptr = [0]
+        indices = []
+        data = []
+        for profile in self.job_profiles:
+            indices.extend(columns[keyword] for keyword in profile.keyword_counts)
+            data.extend(profile.keyword_counts.values())
+            indptr.append(len(indices))
+        self.job_keywords = sparse.csr_matrix(
+            (np.array(data, dtype=np.float64), indices, indptr), shape=(len(self.job_profiles), len(self.keywords))
+        ).T.tocsr()
+        self.keyword_totals = np.array([len(profile.keywords) for profile in self.job_profiles], dtype=np.float64)
+
+    @classmethod
+    def from_catalog(cls, catalog: Dict[str, List[str]], taxonomy: Optional[SkillTaxonomy] = None,
+                     **weights) -> "BulkMatcher":
+        """
+        Build a matcher for every role of a data/job_keywords.json-style catalog.
+
+        Roles are built with JobProfile.for_role, so their skills and the resumes'
+        extracted skills are compared as canonical taxonomy IDs rather than as
+        split, lowercased words that multi-word or capitalized skills never match.
+
+        Args:
+            catalog (dict): Mapping of role name to the skills it asks for.
+            taxonomy (SkillTaxonomy, optional): Taxonomy holding every role of the
+                catalog, e.g. with synonyms (default: compiled from the catalog alone).
+            **weights: skill_weight and keyword_weight for BulkMatcher.
+
+        Returns:
+            BulkMatcher: A matcher whose job_names are the roles.
+        """
+        if taxonomy is None:
+            taxonomy = SkillTaxonomy.build(catalog)
+        missing = [role for role in catalog if role not in taxonomy.roles]
+        if missing:
+            raise ValueError(f"Roles missing from the taxonomy: {', '.join(missing)}")
+        matcher = cls([JobProfile.for_role(role, taxonomy) for role in catalog], **weights)
+        matcher.job_names = list(catalog)
+        return matcher
+
+    def __len__(self) -> int:
+        """Return the number of jobs."""
+        return len(self.job_profiles)
+
+    @instrumented("bulk.encode")
+    def encode(self, resumes: Sequence[dict]) -> Tuple[sparse.csr_matrix, sparse.csr_matrix]:
+        """
+        Build the resume x skill and resume x keyword matrices once for a candidate pool.
+
+        Args:
+            resumes (sequence): Extracted data dicts with "skills" and "text".
+
+        Returns:
+            tuple: Binary sparse skill and keyword matrices, one row per resume.
+
+        Raises:
+            ValueError: If a resume has no "text", whose keyword scores would silently be 0.
+        """
+        missing = sum(1 for resume in resumes if "text" not in resume)
+        if missing:
+            raise ValueError(f"{missing} of {len(resumes)} resumes have no text to match keywords against; "
+                             "ingest them with --include-text.")
+        skill_lists = [resume.get("skills", []) for resume in resumes]
+        if self.taxonomy is not None:
+            skill_lists = [self.taxonomy.skill_ids(skills) for skills in skill_lists]
+        skills = skill_matrix(skill_lists, self.skill_vocabulary)
+        keywords = keyword_matrix([resume.get("text", "") for resume in resumes], self.keywords)
+        return skills, keywords
+
+    def score_block(self, skills: sparse.csr_matrix, keywords: sparse.csr_matrix) -> np.ndarray:
+        """
+        Compute unrounded match scores for a block of encoded resumes.
+
+        Args:
+            skills (scipy.sparse.csr_matrix): Rows of the skill matrix from encode().
+            keywords (scipy.sparse.csr_matrix): The same rows of the keyword matrix.
+
+        Returns:
+            numpy.ndarray: resumes x jobs scores; rounding an entry to two decimals
+                gives ResumeMatcher.calculate_total_match_score() for that pair.
+        """
+        # Match counts are small integers, so dividing them gives exactly ResumeMatcher's ratios
+        skill_scores = np.divide((skills @ self.job_skills).toarray(), self.skill_counts,
+                                 out=np.zeros((skills.shape[0], len(self))), where=self.skill_counts > 0)
+        keyword_scores = np.divide((keywords @ self.job_keywords).toarray(), self.keyword_totals,
+                                   out=np.zeros((keywords.shape[0], len(self))), where=self.keyword_totals > 0)
+        return (self.skill_weight * skill_scores) + (self.keyword_weight * keyword_scores)
+
+    def iter_blocks(self, resumes: Sequence[dict], block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Yield the full score matrix one block of resumes at a time.
+
+        Args:
+            resumes (sequence): Extracted data dicts.
+            block_size (int): Resumes per block (default: DEFAULT_BLOCK_SIZE).
+
+        Yields:
+            tuple: (index of the block's first resume, scores from score_block()).
+        """
+        skills, keywords = self.encode(resumes)
+        for start in range(0, len(resumes), block_size):
+            yield start, self.score_block(skills[start:start + block_size], keywords[start:start + block_size])
+
+    @instrumented("bulk.match")
+    def match(self, resumes: Union[Sequence[dict], Tuple[sparse.csr_matrix, sparse.csr_matrix]], top_k: int = 10, block_size: int = DEFAULT_BLOCK_SIZE,
+              workers: Optional[int] = None) -> Dict[str, Union[np.ndarray, float, int]]:
+        """
+        Find the best jobs for every resume and the best resumes for every job.
+
+        Blocks of resumes are scored on a thread pool (the sparse products and
+        sorts release the GIL), with at most two blocks per worker held in
+        memory, so the full resumes x jobs matrix never exists at once.
+        Rankings use the unrounded scores, ties going to the lower index.
+
+        Args:
+            resumes (sequence or tuple): Extracted data dicts, or the matrices
+                returned by encode() to match an already encoded pool again.
+            top_k (int): Matches kept per resume and per job (default: 10).
+            block_size (int): Resumes per block (default: DEFAULT_BLOCK_SIZE).
+            workers (int, optional): Threads scoring blocks (default: CPU count).
+
+        Returns:
+            dict: "resume_jobs"/"resume_scores" (resumes x k job indices and match
+                scores, best first), "job_resumes"/"job_scores" (jobs x k),
+                plus "pairs", "encode_seconds", "seconds" (scoring and ranking) and
+                "pairs_per_sec" (pairs over scoring seconds). Scores are rounded as
+                ResumeMatcher rounds them.
+        """
+        started = time.perf_counter()
+        if len(resumes) == 2 and sparse.issparse(resumes[0]):
+            skills, keywords = resumes
+        else:
+            skills, keywords = self.encode(resumes)
+        encode_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        n_resumes, n_jobs = skills.shape[0], len(self)
+        resume_k, job_k = min(top_k, n_jobs), min(top_k, n_resumes)
+
+        resume_jobs = np.zeros((n_resumes, resume_k), dtype=np.int64)
+        resume_scores = np.zeros((n_resumes, resume_k))
+        job_resumes = np.zeros((0, n_jobs), dtype=np.int64)
+        job_scores = np.zeros((0, n_jobs))
+
+        def score(start: int):
+            block = self.score_block(skills[start:start + block_size], keywords[start:start + block_size])
+            order = np.argsort(-block, axis=1, kind="stable")[:, :resume_k]
+            best = _top_k_columns(block, job_k)
+            return (start, order, np.take_along_axis(block, order, axis=1),
+                    best + start, np.take_along_axis(block, best, axis=0))
+
+        workers = workers or os.cpu_count() or 1
+        max_in_flight = workers * 2
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            starts = iter(range(0, n_resumes, block_size))
+            pending = set()
+            while True:
+                for start in starts:
+                    pending.add(executor.submit(score, start))
+                    if len(pending) >= max_in_flight:
+                        break
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    start, order, order_scores, best, best_scores = future.result()
+                    resume_jobs[start:start + len(order)] = order
+                    resume_scores[start:start + len(order)] = order_scores
+                    # Merge with the best resumes so far; blocks finish in any order
+                    job_resumes = np.concatenate([job_resumes, best])
+                    job_scores = np.concatenate([job_scores, best_scores])
+                    keep = np.lexsort((job_resumes, -job_scores), axis=0)[:job_k]
+                    job_resumes = np.take_along_axis(job_resumes, keep, axis=0)
+                    job_scores = np.take_along_axis(job_scores, keep, axis=0)
+
+        seconds = time.perf_counter() - started
+        pairs = n_resumes * n_jobs
+        return {
+            "resume_jobs": resume_jobs,
+            "resume_scores": round_matrix(resume_scores),
+            "job_resumes": job_resumes.T.copy(),
+            "job_scores": round_matrix(job_scores.T),
+            "pairs": pairs,
+            "encode_seconds": encode_seconds,
+            "seconds": seconds,
+            "pairs_per_sec": pairs / seconds if seconds else 0.0,
+        }
+
+    def top_jobs(self, result: dict, resume_index: int) -> List[dict]:
+        """
+        List one resume's best jobs from a match() result.
+
+        Args:
+            result (dict): Output of match().
+            resume_index (int): Index of the resume in the matched pool.
+
+        Returns:
+            list: Dicts with the job "index", its name "job" and the "match_score", best first.
+        """
+        return [
+            {"index": int(job), "job": self.job_names[job], "match_score": float(score)}
+            for job, score in zip(result["resume_jobs"][resume_index], result["resume_scores"][resume_index])
+        ]
+
+
+# Example usage
+if __name__ == "__main__":
+    resumes = [
+        {"skills": ["python", "nlp"], "text": "John Doe is skilled in Python and NLP."},
+        {"skills": ["java"], "text": "Jane Roe builds Java services with Spring."},
+        {"skills": ["python", "sql"], "text": "Sam Poe analyzes data with Python and SQL."},
+    ]
+    jobs = [
+        "We are looking for a Data Scientist with python and nlp experience.",
+        "Backend engineer: java and spring.",
+        "Data analyst fluent in sql and python.",
+    ]
+
+    matcher = BulkMatcher(jobs)
+    matcher.job_names = ["Data Scientist", "Backend Engineer", "Data Analyst"]
+    result = matcher.match(resumes, top_k=2)
+    for index in range(len(resumes)):
+        print(f"Resume {index}:", matcher.top_jobs(result, index))
+    print("Best resumes per job:", result["job_resumes"].tolist())
+    print(f"{result['pairs_per_sec']:.0f} pairs/sec")
@@ -0,0 +1,223 @@
+import json
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+# Keeps tokens such as "c++", "c#" and "node.js" intact
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens for corpus statistics.
+
+    Args:
+        text (str): Input text.
+
+    Returns:
+        list: Tokens in order of appearance.
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class CorpusStats:
+    """Document frequencies fit once over a resume corpus, for TF-IDF and BM25 scoring."""
+
+    VOCABULARY_FILE = "vocabulary.json"
+    META_FILE = "meta.json"
+    TFIDF_IDF_FILE = "tfidf_idf.npy"
+    BM25_IDF_FILE = "bm25_idf.npy"
+
+    def __init__(self, vocabulary: Dict[str, int], tfidf_idf: np.ndarray, bm25_idf: np.ndarray,
+                 n_documents: int, average_length: float, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize the CorpusStats. Use fit() or load() rather than calling this directly.
+
+        Args:
+            vocabulary (dict): Mapping of token to column index.
+            tfidf_idf (np.ndarray): Smoothed TF-IDF inverse document frequency per column.
+            bm25_idf (np.ndarray): BM25 inverse document frequency per column.
+            n_documents (int): Number of documents the statistics were fit on.
+            average_length (float): Mean document length in tokens.
+            k1 (float): BM25 term-frequency saturation (default: 1.5).
+            b (float): BM25 length normalization (default: 0.75).
+        """
+        self.vocabulary = vocabulary
+        self.tfidf_idf = tfidf_idf
+        self.bm25_idf = bm25_idf
+        self.n_documents = n_documents
+        self.average_length = average_length
+        self.k1 = k1
+        self.b = b
+        # Terms never seen while fitting get the idf of a document frequency of zero
+        self.unseen_tfidf_idf = math.log((1 + n_documents) / 1) + 1
+        self.unseen_bm25_idf = math.log(1 + (n_documents + 0.5) / 0.5)
+        # Job descriptions are scored against many resumes, so their vectors are memoized
+        self._job_cache = {}
+
+    @classmethod
+    def fit(cls, texts: Iterable[str], k1: float = 1.5, b: float = 0.75) -> "CorpusStats":
+        """
+        Compute document frequencies over a corpus of resume texts.
+
+        Args:
+            texts (iterable): Raw resume texts; may be a generator.
+            k1 (float): BM25 term-frequency saturation (default: 1.5).
+            b (float): BM25 length normalization (default: 0.75).
+
+        Returns:
+            CorpusStats: The fitted statistics.
+        """
+        document_frequency = Counter()
+        n_documents = 0
+        total_length = 0
+        for text in texts:
+            tokens = tokenize(text)
+            document_frequency.update(set(tokens))
+            total_length += len(tokens)
+            n_documents += 1
+
+        vocabulary = {term: column for column, term in enumerate(sorted(document_frequency))}
+        df = np.array([document_frequency[term] for term in vocabulary], dtype=np.float64)
+        tfidf_idf = np.log((1 + n_documents) / (1 + df)) + 1
+        bm25_idf = np.log(1 + (n_documents - df + 0.5) / (df + 0.5))
+        average_length = total_length / n_documents if n_documents else 0.0
+        return cls(vocabulary, tfidf_idf, bm25_idf, n_documents, average_length, k1=k1, b=b)
+
+    def save(self, directory: str):
+        """
+        Persist the statistics so they can be memory-mapped by load().
+
+        Args:
+            directory (str): Output directory.
+        """
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / self.TFIDF_IDF_FILE, np.asarray(self.tfidf_idf))
+        np.save(path / self.BM25_IDF_FILE, np.asarray(self.bm25_idf))
+        with open(path / self.VOCABULARY_FILE, "w", encoding="utf-8") as file:
+            json.dump(self.vocabulary, file)
+        with open(path / self.META_FILE, "w", encoding="utf-8") as file:
+            json.dump({
+                "n_documents": self.n_documents,
+                "average_length": self.average_length,
+                "k1": self.k1,
+                "b": self.b,
+            }, file)
+
+    @classmethod
+    def load(cls, directory: str) -> "CorpusStats":
+        """
+        Load statistics saved by save(), memory-mapping the idf arrays.
+
+        Args:
+            directory (str): Directory written by save().
+
+        Returns:
+            CorpusStats: The loaded statistics.
+        """
+        path = Path(directory)
+        with open(path / cls.VOCABULARY_FILE, "r", encoding="utf-8") as file:
+            vocabulary = json.load(file)
+        with open(path / cls.META_FILE, "r", encoding="utf-8") as file:
+            meta = json.load(file)
+        return cls(
+            vocabulary,
+            np.load(path / cls.TFIDF_IDF_FILE, mmap_mode="r"),
+            np.load(path / cls.BM25_IDF_FILE, mmap_mode="r"),
+            meta["n_documents"],
+            meta["average_length"],
+            k1=meta["k1"],
+            b=meta["b"],
+        )
+
+    def _tfidf_vector(self, text: str) -> Dict[str, float]:
+        """Build an L2-normalized sparse TF-IDF vector keyed by token."""
+        counts = Counter(tokenize(text))
+        vector = {}
+        for term, count in counts.items():
+            column = self.vocabulary.get(term)
+            idf = self.tfidf_idf[column] if column is not None else self.unseen_tfidf_idf
+            vector[term] = count * float(idf)
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        return {term: weight / norm for term, weight in vector.items()} if norm else {}
+
+    def _job_query(self, job_description: str) -> tuple:
+        """Return the TF-IDF vector and (term, BM25 idf) pairs of a job description, memoized."""
+        query = self._job_cache.get(job_description)
+        if query is None:
+            bm25_terms = []
+            for term in set(tokenize(job_description)):
+                column = self.vocabulary.get(term)
+                bm25_terms.append((term, float(self.bm25_idf[column]) if column is not None else self.unseen_bm25_idf))
+            query = (self._tfidf_vector(job_description), bm25_terms)
+            if len(self._job_cache) >= 256:
+                self._job_cache.clear()
+            self._job_cache[job_description] = query
+        return query
+
+    def tfidf_similarity(self, resume_text: str, job_description: str) -> float:
+        """
+        Cosine similarity of the TF-IDF vectors of a resume and a job description.
+
+        Args:
+            resume_text (str): Raw resume text.
+            job_description (str): Text of the job description.
+
+        Returns:
+            float: Similarity (0 to 1).
+        """
+        job_vector = self._job_query(job_description)[0]
+        resume_vector = self._tfidf_vector(resume_text)
+        if len(resume_vector) < len(job_vector):
+            job_vector, resume_vector = resume_vector, job_vector
+        return sum(weight * resume_vector.get(term, 0.0) for term, weight in job_vector.items())
+
+    def bm25_score(self, resume_text: str, job_description: str) -> float:
+        """
+        BM25 score of a resume for the job description's terms, normalized to 0..1.
+
+        The raw score is divided by its upper bound, sum(idf * (k1 + 1)), which a
+        resume would approach by repeating every job term many times.
+
+        Args:
+            resume_text (str): Raw resume text.
+            job_description (str): Text of the job description.
+
+        Returns:
+            float: Normalized BM25 score (0 to 1).
+        """
+        query_terms = self._job_query(job_description)[1]
+        if not query_terms:
+            return 0.0
+        tokens = tokenize(resume_text)
+        counts = Counter(tokens)
+        length_norm = 1 - self.b + self.b * (len(tokens) / self.average_length if self.average_length else 1.0)
+
+        score = 0.0
+        upper_bound = 0.0
+        for term, idf in query_terms:
+            upper_bound += idf * (self.k1 + 1)
+            frequency = counts.get(term)
+            if frequency:
+                score += idf * frequency * (self.k1 + 1) / (frequency + self.k1 * length_norm)
+        return score / upper_bound if upper_bound else 0.0
+
+
+# Example usage
+if __name__ == "__main__":
+    corpus = [
+        "John Doe is skilled in Python, Machine Learning, and NLP.",
+        "Jane Roe builds Java services and REST APIs with the team.",
+        "Experienced Node.js and C++ developer working with the cloud.",
+    ]
+    stats = CorpusStats.fit(corpus)
+    job_description = "We need a Python developer with NLP experience."
+
+    for text in corpus:
+        print(f"tfidf={stats.tfidf_similarity(text, job_description):.3f} "
+              f"bm25={stats.bm25_score(text, job_description):.3f}  {text}")
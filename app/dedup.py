@@ -0,0 +1,203 @@
+import re
+import zlib
+from typing import Hashable, List, Optional, Tuple
+
+import numpy as np
+
+# Odd 64-bit multipliers combining the hashes of a shingle's words, one per position
+SHINGLE_MULTIPLIERS = np.array([
+    0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0x27D4EB2F165667C5,
+    0xFF51AFD7ED558CCD, 0xC4CEB9FE1A85EC53, 0x94D049BB133111EB, 0xBF58476D1CE4E5B9,
+], dtype=np.uint64)
+
+# Shingles hashed per numpy step, so very long texts don't allocate num_perm x shingles at once
+SHINGLE_CHUNK = 2048
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def shingle_hashes(text: str, shingle_size: int = 5) -> np.ndarray:
+    """
+    Hash the word shingles of a text.
+
+    Each word is hashed once with CRC32 (not hash(), so signatures computed in
+    different worker processes agree), and each run of shingle_size word hashes
+    is combined with SHINGLE_MULTIPLIERS in one vectorized pass.
+
+    Args:
+        text (str): Resume text.
+        shingle_size (int): Words per shingle, at most len(SHINGLE_MULTIPLIERS) (default: 5).
+
+    Returns:
+        numpy.ndarray: Distinct shingle hashes as uint64; empty if the text has
+            fewer than shingle_size words.
+    """
+    words = WORD_PATTERN.findall(text.lower())
+    count = len(words) - shingle_size + 1
+    if count <= 0:
+        return np.empty(0, dtype=np.uint64)
+    word_hashes = np.fromiter(map(zlib.crc32, map(str.encode, words)), dtype=np.uint64, count=len(words))
+    shingles = np.zeros(count, dtype=np.uint64)
+    for position in range(shingle_size):
+        shingles += word_hashes[position:position + count] * SHINGLE_MULTIPLIERS[position]
+    return np.unique(shingles)
+
+
+class MinHasher:
+    """MinHash signatures of resume text for estimating Jaccard similarity of word shingles."""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        """
+        Initialize the MinHasher.
+
+        Args:
+            num_perm (int): Hash functions per signature (default: 128).
+            shingle_size (int): Words per shingle (default: 5).
+            seed (int): Seed for the hash functions; signatures are only comparable
+                between hashers with the same settings (default: 1).
+        """
+        if not 0 < shingle_size <= len(SHINGLE_MULTIPLIERS):
+            raise ValueError(f"shingle_size must be between 1 and {len(SHINGLE_MULTIPLIERS)}.")
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # Multiply-shift hash functions: the top 32 bits of (a * x + b) mod 2**64, with a odd
+        generator = np.random.RandomState(seed)
+        self.a = generator.randint(0, 1 << 62, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self.b = generator.randint(0, 1 << 62, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text (str): Resume text.
+
+        Returns:
+            numpy.ndarray: num_perm minimum hash values as uint32, or None for texts too short to shingle.
+        """
+        hashes = shingle_hashes(text, self.shingle_size)
+        if not len(hashes):
+            return None
+        signature = np.full(self.num_perm, np.iinfo(np.uint64).max, dtype=np.uint64)
+        for start in range(0, len(hashes), SHINGLE_CHUNK):
+            permuted = self.a[:, None] * hashes[None, start:start + SHINGLE_CHUNK]
+            permuted += self.b[:, None]
+            permuted >>= np.uint64(32)
+            np.minimum(signature, permuted.min(axis=1), out=signature)
+        return signature.astype(np.uint32)
+
+
+def similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """Estimate the Jaccard similarity of two texts from their MinHash signatures."""
+    return float(np.count_nonzero(first == second)) / len(first)
+
+
+class LSHIndex:
+    """Locality-sensitive hashing over MinHash signatures for sublinear near-duplicate lookup."""
+
+    def __init__(self, num_perm: int = 128, bands: int = 16, threshold: float = 0.8):
+        """
+        Initialize the LSHIndex.
+
+        Signatures are cut into bands; two texts become candidates when any band
+        is identical, which happens with high probability once their similarity
+        passes roughly (1 / bands) ** (1 / rows). Candidates are then checked
+        against the threshold on the full signature.
+
+        Args:
+            num_perm (int): Signature length; must be divisible by bands (default: 128).
+            bands (int): Number of bands (default: 16, i.e. 8 rows each).
+            threshold (float): Smallest estimated similarity reported as a duplicate (default: 0.8).
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands}).")
+        self.rows = num_perm // bands
+        self.bands = bands
+        self.threshold = threshold
+        self.buckets = [{} for _ in range(bands)]
+        self.signatures = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed signatures."""
+        return len(self.signatures)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        """Return the bucket key of each band."""
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+    def add(self, key: Hashable, signature: np.ndarray):
+        """
+        Index a signature.
+
+        Args:
+            key (hashable): Identifier returned by query(), e.g. the file path.
+            signature (numpy.ndarray): MinHash signature.
+        """
+        self.signatures[key] = signature
+        for buckets, band_key in zip(self.buckets, self._band_keys(signature)):
+            buckets.setdefault(band_key, []).append(key)
+
+    def remove(self, key: Hashable):
+        """
+        Drop a signature from the index.
+
+        Args:
+            key (hashable): Identifier passed to add().
+        """
+        signature = self.signatures.pop(key, None)
+        if signature is None:
+            return
+        for buckets, band_key in zip(self.buckets, self._band_keys(signature)):
+            bucket = buckets[band_key]
+            bucket.remove(key)
+            if not bucket:
+                del buckets[band_key]
+
+    def query(self, signature: np.ndarray) -> List[Tuple[Hashable, float]]:
+        """
+        Find indexed signatures similar to this one.
+
+        Args:
+            signature (numpy.ndarray): MinHash signature.
+
+        Returns:
+            list: (key, estimated similarity) pairs at or above the threshold, most similar first.
+        """
+        candidates = set()
+        for buckets, band_key in zip(self.buckets, self._band_keys(signature)):
+            candidates.update(buckets.get(band_key, ()))
+        matches = []
+        for key in candidates:
+            score = similarity(signature, self.signatures[key])
+            if score >= self.threshold:
+                matches.append((key, score))
+        matches.sort(key=lambda match: -match[1])
+        return matches
+
+    def find_duplicate(self, signature: np.ndarray) -> Optional[Tuple[Hashable, float]]:
+        """
+        Return the most similar indexed signature, if any passes the threshold.
+
+        Args:
+            signature (numpy.ndarray): MinHash signature.
+
+        Returns:
+            tuple: (key, estimated similarity), or None.
+        """
+        matches = self.query(signature)
+        return matches[0] if matches else None
+
+
+# Example usage
+if __name__ == "__main__":
+    original = ("John Doe, data scientist. Five years of experience building NLP pipelines in Python. "
+                "Led a team of four engineers at Acme Corp and shipped a recommendation engine.")
+    edited = original + " References available on request."
+    unrelated = "Jane Roe, Java developer. Builds payment services and mentors junior engineers at Globex."
+
+    hasher = MinHasher()
+    index = LSHIndex()
+    index.add("original.pdf", hasher.signature(original))
+    index.add("unrelated.pdf", hasher.signature(unrelated))
+    print("Edited copy matches:", index.query(hasher.signature(edited)))
+    print("Estimated similarity:", similarity(hasher.signature(original), hasher.signature(edited)))
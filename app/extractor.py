@@ -1,33 +1,169 @@
-import spacy
 import re
+from typing import Iterable, Optional
+from models import get_spacy_model
+from utils.instrumentation import instrumented
+from .sections import ResumeSections
+from .skill_matcher import get_skill_matcher
+
+EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+EMAIL_LOCAL_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-")
+
+# The lookahead lets the regex engine skip positions that cannot start a phone number
+PHONE_PATTERN = re.compile(r"(?=[(\d])\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}")
+
+# Characters at the top of a resume searched for the candidate's name before the rest
+HEADER_WINDOW = 1000
+
+
+def iter_emails(text: str):
+    """
+    Yield the email addresses in a text, as EMAIL_PATTERN.finditer would.
+
+    Args:
+        text (str): Text to search.
+
+    Yields:
+        str: Each email address, in order of appearance.
+    """
+    for start, end in iter_email_spans(text):
+        yield text[start:end]
+
+
+def iter_email_spans(text: str, pos: int = 0):
+    """
+    Yield the offsets of the email addresses in a text, as EMAIL_PATTERN.finditer(text, pos) would.
+
+    Rather than trying the pattern at every position, jump between "@" signs
+    with str.find and match from the start of the run of address characters
+    before each one, so the cost grows with the number of "@" signs.
+
+    Args:
+        text (str): Text to search.
+        pos (int): Offset to start searching at (default: 0).
+
+    Yields:
+        tuple: (start, end) of each email address, in order of appearance.
+    """
+    floor = pos
+    at = text.find("@", pos)
+    while at != -1:
+        start = at
+        while start > floor and text[start - 1] in EMAIL_LOCAL_CHARS:
+            start -= 1
+        match = EMAIL_PATTERN.match(text, start) if start < at else None
+        if match:
+            yield match.span()
+            floor = match.end()
+            at = text.find("@", floor)
+        else:
+            at = text.find("@", at + 1)
+
+
+def _text_size(extractor, *args, **kwargs) -> int:
+    """Size in UTF-8 bytes of the text an extraction method processes, for instrumentation."""
+    return len(extractor.text.encode("utf-8"))
 
 
 class ResumeExtractor:
     """Class to extract key information from resume text."""
 
-    def __init__(self, text: str):
+    # Only named-entity recognition is needed to find the candidate's name
+    NAME_COMPONENTS = ("ner",)
+
+    def __init__(self, text: str, nlp=None):
         """
         Initialize the ResumeExtractor.
 
         Args:
             text (str): The raw text extracted from a resume.
+            nlp (spacy.language.Language, optional): Pipeline to use for NER.
+                Defaults to the shared NER-only pipeline from the model registry.
         """
         self.text = text
-        self.nlp = spacy.load("en_core_web_sm")
+        self._nlp = nlp
+        self._sections = None
 
-    def extract_name(self) -> str:
+    @property
+    def nlp(self):
+        """spaCy pipeline used by this extractor, fetched from the registry on first use."""
+        if self._nlp is None:
+            self._nlp = get_spacy_model(components=self.NAME_COMPONENTS)
+        return self._nlp
+
+    @property
+    def sections(self) -> ResumeSections:
+        """Sections of the resume text, segmented on first use."""
+        if self._sections is None:
+            self._sections = ResumeSections.segment(self.text)
+        return self._sections
+
+    def extract_sections(self) -> list:
+        """
+        Split the resume into sections.
+
+        Returns:
+            list: [name, start, body_start, end] per section, suitable for the
+                "sections" entry of extracted data.
+        """
+        return self.sections.to_list()
+
+    def section_text(self, sections: Optional[Iterable[str]]) -> str:
+        """
+        Return the text of the named sections, or the whole text.
+
+        Args:
+            sections (iterable, optional): Section names; None means the whole text.
+
+        Returns:
+            str: The sections' text, or the whole text if none of them were found.
+        """
+        if sections is None:
+            return self.text
+        return self.sections.text_of(sections) or self.text
+
+    @instrumented("extract.name", size=_text_size)
+    def extract_name(self, sections: Optional[Iterable[str]] = None) -> str:
         """
         Extract the name from the resume text.
 
+        NER runs on the header first, since that is where the name almost always
+        is, and only continues into the rest of the text if no person was found.
+
+        Args:
+            sections (iterable, optional): Sections to search before anything else,
+                e.g. ("header",) (default: start with the first HEADER_WINDOW characters).
+
         Returns:
             str: The extracted name, or None if not found.
         """
-        doc = self.nlp(self.text)
-        for ent in doc.ents:
-            if ent.label_ == "PERSON":
-                return ent.text
-        return None
+        if sections is not None and self.sections.find(sections):
+            name = self._first_person(self.nlp(self.sections.text_of(sections)))
+            if name is not None:
+                return name
+        header = self.header(self.text)
+        name = self._first_person(self.nlp(header))
+        if name is None and len(header) < len(self.text):
+            name = self._first_person(self.nlp(self.text[len(header):]))
+        return name
+
+    @staticmethod
+    def header(text: str, window: int = HEADER_WINDOW) -> str:
+        """
+        Return the top of a resume, cut at a line break so no entity is split.
+
+        Args:
+            text (str): Raw resume text.
+            window (int): Maximum number of characters (default: HEADER_WINDOW).
 
+        Returns:
+            str: The header; the whole text if it is shorter than the window.
+        """
+        if len(text) <= window:
+            return text
+        cut = text.rfind("\n", 0, window)
+        return text[:cut + 1] if cut > 0 else text[:window]
+
+    @instrumented("extract.email", size=_text_size)
     def extract_email(self) -> str:
         """
         Extract the email address from the resume text.
@@ -35,10 +171,9 @@ class ResumeExtractor:
         Returns:
             str: The extracted email address, or None if not found.
         """
-        email_pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-        match = re.search(email_pattern, self.text)
-        return match.group() if match else None
+        return next(iter_emails(self.text), None)
 
+    @instrumented("extract.phone", size=_text_size)
     def extract_phone(self) -> str:
         """
         Extract the phone number from the resume text.
@@ -46,25 +181,102 @@ class ResumeExtractor:
         Returns:
             str: The extracted phone number, or None if not found.
         """
-        phone_pattern = r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"
-        match = re.search(phone_pattern, self.text)
+        match = PHONE_PATTERN.search(self.text)
         return match.group() if match else None
 
-    def extract_skills(self, skill_keywords: list) -> list:
+    @instrumented("extract.contact", size=_text_size)
+    def extract_contact(self) -> dict:
+        """
+        Extract every email address and phone number in the text.
+
+        Phone numbers take the only regex scan of the whole text; email addresses
+        are found by jumping between "@" signs (see iter_emails()).
+
+        Returns:
+            dict: "emails" and "phones" in order of appearance without duplicates,
+                plus the first of each as "email" and "phone" (None if absent).
+        """
+        emails = list(dict.fromkeys(iter_emails(self.text)))
+        phones = list(dict.fromkeys(match.group() for match in PHONE_PATTERN.finditer(self.text)))
+        return {
+            "email": emails[0] if emails else None,
+            "phone": phones[0] if phones else None,
+            "emails": emails,
+            "phones": phones,
+        }
+
+    @instrumented("extract.skills", size=_text_size)
+    def extract_skills(self, skill_keywords: list, sections: Optional[Iterable[str]] = None) -> list:
         """
         Extract skills from the resume text based on a predefined list.
 
         Args:
             skill_keywords (list): A list of skill keywords to match.
+            sections (iterable, optional): Only search these sections, e.g.
+                sections.SKILL_SECTIONS; the whole text is searched if none of them
+                are found (default: search the whole text).
 
         Returns:
             list: A list of extracted skills found in the resume.
         """
-        skills_found = []
-        for skill in skill_keywords:
-            if re.search(rf"\b{re.escape(skill)}\b", self.text, re.IGNORECASE):
-                skills_found.append(skill)
-        return skills_found
+        return get_skill_matcher(skill_keywords).match(self.section_text(sections))
+
+    def extract_skill_matches(self, skill_keywords: list) -> dict:
+        """
+        Locate every occurrence of the given skills in the resume text.
+
+        Args:
+            skill_keywords (list): A list of skill keywords to match.
+
+        Returns:
+            dict: Mapping of each found skill to a list of (start, end) offsets.
+        """
+        return get_skill_matcher(skill_keywords).find_all(self.text)
+
+    @classmethod
+    def extract_batch(cls, texts, skill_keywords: list, n_process: int = 1, batch_size: int = 32, nlp=None):
+        """
+        Extract name, email, phone and skills from many resume texts.
+
+        Texts are streamed through ``nlp.pipe`` so only one batch of Docs is
+        held in memory at a time, regardless of how many texts are passed in.
+        As in extract_name(), only each header is piped; the rest of a text is
+        processed only when its header names no one.
+
+        Args:
+            texts (iterable): Raw resume texts; may be a generator.
+            skill_keywords (list): A list of skill keywords to match.
+            n_process (int): Number of worker processes for NER (default: 1).
+            batch_size (int): Number of texts per ``nlp.pipe`` batch (default: 32).
+            nlp (spacy.language.Language, optional): Pipeline to use for NER.
+                Defaults to the shared NER-only pipeline from the model registry.
+
+        Yields:
+            dict: Extracted name, email, phone and skills, in input order.
+        """
+        if nlp is None:
+            nlp = get_spacy_model(components=cls.NAME_COMPONENTS)
+        headers = ((cls.header(text), text) for text in texts)
+        for doc, text in nlp.pipe(headers, as_tuples=True, n_process=n_process, batch_size=batch_size):
+            name = cls._first_person(doc)
+            if name is None and len(doc.text) < len(text):
+                name = cls._first_person(nlp(text[len(doc.text):]))
+            extractor = cls(text, nlp=nlp)
+            contact = extractor.extract_contact()
+            yield {
+                "name": name,
+                "email": contact["email"],
+                "phone": contact["phone"],
+                "skills": extractor.extract_skills(skill_keywords),
+            }
+
+    @staticmethod
+    def _first_person(doc) -> str:
+        """Return the text of the first PERSON entity in a Doc, or None."""
+        for ent in doc.ents:
+            if ent.label_ == "PERSON":
+                return ent.text
+        return None
 
 
 # Example usage
@@ -85,4 +297,5 @@ if __name__ == "__main__":
     print("Name:", extractor.extract_name())
     print("Email:", extractor.extract_email())
     print("Phone:", extractor.extract_phone())
+    print("Contact:", extractor.extract_contact())
     print("Skills:", extractor.extract_skills(skill_keywords))
\ No newline at end of file
@@ -0,0 +1,404 @@
+import os
+import threading
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .job_profile import JobProfile
+from .matcher import ResumeMatcher
+from .parser import ResumeParser
+from .pipeline import DEFAULT_SKILL_KEYWORDS, STAGES, AnalysisCancelled, ScoreWeights, extract_resume
+from .recommender import ResumeRecommender
+from .scorer import ResumeScorer
+from .taxonomy import SkillTaxonomy
+
+# Sub-scores that do not depend on the weights, in the order pools store them
+COMPONENTS = ("skill_score", "structure_score", "keyword_score")
+
+
+def score_components(extracted_data: dict, job_profile: JobProfile) -> Tuple[float, float, float]:
+    """
+    Compute the weight-independent sub-scores of a resume for a job.
+
+    Args:
+        extracted_data (dict): Extracted resume fields.
+        job_profile (JobProfile): The job to score against.
+
+    Returns:
+        tuple: Skill, structure and keyword scores, as in COMPONENTS.
+    """
+    return (
+        job_profile.skill_match_score(extracted_data.get("skills", [])),
+        ResumeScorer.structure_score(extracted_data),
+        ResumeMatcher(extracted_data, job_profile).calculate_keyword_match_score(),
+    )
+
+
+def blend_scores(components: Tuple[float, float, float], weights: ScoreWeights) -> dict:
+    """
+    Blend sub-scores into the total and match scores.
+
+    Uses the same arithmetic as ResumeScorer.calculate_total_score and
+    ResumeMatcher.calculate_total_match_score, so the results are identical.
+
+    Args:
+        components (tuple): Skill, structure and keyword scores.
+        weights (ScoreWeights): Score weights.
+
+    Returns:
+        dict: "total_score" and "match_score".
+    """
+    skill_score, structure_score, keyword_score = components
+    return {
+        "total_score": round((weights.skill_weight * skill_score) + (weights.structure_weight * structure_score), 2),
+        "match_score": round((weights.match_skill_weight * skill_score) + (weights.keyword_weight * keyword_score), 2),
+    }
+
+
+class _LRUCache:
+    """A small thread-safe least-recently-used mapping."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable):
+        """Return the cached value, or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value):
+        """Cache a value, evicting the least recently used entries past max_entries."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+class _Pool:
+    """The sub-scores of every resume analyzed against one job, as arrays for vectorized blending."""
+
+    def __init__(self):
+        self.keys = []
+        self.positions = {}
+        self.rows = []
+        self._components = None
+
+    def set(self, key: Hashable, extracted_data: dict, components: tuple, recommendations: dict):
+        """Record a resume's latest analysis for this job."""
+        position = self.positions.get(key)
+        if position is None:
+            self.positions[key] = len(self.keys)
+            self.keys.append(key)
+            self.rows.append((extracted_data, components, recommendations))
+        else:
+            self.rows[position] = (extracted_data, components, recommendations)
+        self._components = None
+
+    def components(self) -> np.ndarray:
+        """Return the resumes x COMPONENTS array, rebuilt only after changes."""
+        if self._components is None:
+            self._components = np.array([row[1] for row in self.rows], dtype=np.float64).reshape(-1, len(COMPONENTS))
+        return self._components
+
+
+class IncrementalAnalyzer:
+    """The analysis pipeline with every stage's results kept, rerunning only stages whose inputs changed."""
+
+    def __init__(self, use_cache: bool = True, max_texts: int = 64, max_entries: int = 100000, max_jobs: int = 32):
+        """
+        Initialize the IncrementalAnalyzer.
+
+        Parsed text is keyed by the file's path, size and modification time,
+        extracted fields additionally by the extraction settings, and sub-scores
+        and recommendations additionally by the job. Weights only enter the
+        final blend, so changing them recomputes nothing else.
+
+        Args:
+            use_cache (bool): Also reuse the on-disk text cache across runs (default: True).
+            max_texts (int): Parsed texts kept in memory (default: 64).
+            max_entries (int): Extracted resumes and resume x job analyses kept (default: 100000).
+            max_jobs (int): Jobs whose pools rescore() and rank() can re-blend (default: 32).
+        """
+        self.use_cache = use_cache
+        self._texts = _LRUCache(max_texts)
+        self._fields = _LRUCache(max_entries)
+        self._analyses = _LRUCache(max_entries)
+        self._profiles = _LRUCache(max_entries)
+        self._pools = _LRUCache(max_jobs)
+        self._pools_lock = threading.Lock()
+        # Stages actually computed, e.g. to check that a weight change reran nothing
+        self.stage_runs = Counter()
+
+    @staticmethod
+    def file_key(file_path: str) -> tuple:
+        """Identify a file's current content by its path, size and modification time."""
+        stat = os.stat(file_path)
+        return os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns
+
+    def job_profile(self, job_description: Union[str, JobProfile], taxonomy: Optional[SkillTaxonomy] = None) -> JobProfile:
+        """
+        Return a JobProfile, tokenizing each distinct job description once.
+
+        Args:
+            job_description (str or JobProfile): Job description text or a prebuilt profile.
+            taxonomy (SkillTaxonomy, optional): Taxonomy for a newly built profile.
+
+        Returns:
+            JobProfile: The profile.
+        """
+        if isinstance(job_description, JobProfile):
+            return job_description
+        key = (job_description, id(taxonomy))
+        profile = self._profiles.get(key)
+        if profile is None:
+            profile = JobProfile(job_description, taxonomy=taxonomy)
+            self._profiles.put(key, profile)
+        return profile
+
+    @staticmethod
+    def job_key(job_profile: JobProfile) -> tuple:
+        """Identify a job by everything its scores depend on."""
+        return job_profile.text, job_profile.keywords, job_profile.skill_bits, id(job_profile.taxonomy)
+
+    def analyze(self, file_path: str, job_description: Union[str, JobProfile], skill_keywords: Optional[list] = None,
+                use_sections: bool = False, taxonomy: Optional[SkillTaxonomy] = None,
+                weights: Optional[ScoreWeights] = None, progress: Optional[Callable[[str, int, int], None]] = None,
+                cancel_event: Optional[threading.Event] = None) -> dict:
+        """
+        Analyze a resume like pipeline.analyze_resume, reusing every stage whose inputs are unchanged.
+
+        Args:
+            file_path (str): Path to the resume file.
+            job_description (str or JobProfile): Job description text or a prebuilt profile.
+            skill_keywords (list, optional): Skills to look for (default: DEFAULT_SKILL_KEYWORDS).
+            use_sections (bool): Search only SKILL_SECTIONS for skills and record sections (default: False).
+            taxonomy (SkillTaxonomy, optional): Extract and compare skills as canonical taxonomy IDs.
+            weights (ScoreWeights, optional): Score weights (default: the scorer and matcher defaults).
+            progress (callable, optional): Called as progress(stage, index, total) before each stage.
+            cancel_event (threading.Event, optional): When set, the analysis stops before the next stage.
+
+        Returns:
+            dict: The fields returned by pipeline.analyze_resume, with identical values.
+        """
+        skill_keywords = skill_keywords if skill_keywords is not None else DEFAULT_SKILL_KEYWORDS
+
+        def enter(stage: str):
+            if cancel_event is not None and cancel_event.is_set():
+                raise AnalysisCancelled(f"Analysis cancelled before the {stage} stage.")
+            if progress is not None:
+                progress(stage, STAGES.index(stage), len(STAGES))
+
+        file_key = self.file_key(file_path)
+        fields_key = (file_key, tuple(skill_keywords), use_sections, id(taxonomy))
+        enter("parse")
+        extracted_data = self._fields.get(fields_key)
+        if extracted_data is None:
+            resume_text = self._texts.get(file_key)
+            if resume_text is None:
+                resume_text = ResumeParser(file_path, use_cache=self.use_cache).extract_text()
+                self.stage_runs["parse"] += 1
+                self._texts.put(file_key, resume_text)
+
+            enter("extract")
+            self.stage_runs["extract"] += 1
+            extracted_data = extract_resume(resume_text, skill_keywords, use_sections, taxonomy)
+            self._fields.put(fields_key, extracted_data)
+        else:
+            enter("extract")
+
+        enter("score")
+        return self.score(file_path, extracted_data, self.job_profile(job_description, taxonomy), weights,
+                          fields_key=fields_key, before_recommend=lambda: enter("recommend"))
+
+    def score(self, key: Hashable, extracted_data: dict, job_description: Union[str, JobProfile],
+              weights: Optional[ScoreWeights] = None, fields_key: Optional[Hashable] = None,
+              before_recommend: Optional[Callable[[], None]] = None) -> dict:
+        """
+        Score already extracted fields, reusing the sub-scores and recommendations for a seen job.
+
+        Also the entry point for resumes extracted elsewhere, e.g. ingest records.
+
+        Args:
+            key (hashable): Identifies the resume in rescore() and rank(), e.g. its file path.
+            extracted_data (dict): Extracted resume fields.
+            job_description (str or JobProfile): Job description text or a prebuilt profile.
+            weights (ScoreWeights, optional): Score weights (default: the scorer and matcher defaults).
+            fields_key (hashable, optional): Identifies the extracted fields' inputs; by
+                default the fields are assumed to belong to key and never change.
+            before_recommend (callable, optional): Called before the recommend stage.
+
+        Returns:
+            dict: The fields returned by pipeline.analyze_resume.
+        """
+        weights = weights if weights is not None else ScoreWeights()
+        job_profile = self.job_profile(job_description)
+        job_key = self.job_key(job_profile)
+        analysis_key = (fields_key if fields_key is not None else key, job_key)
+        analysis = self._analyses.get(analysis_key)
+        if analysis is None:
+            self.stage_runs["score"] += 1
+            components = score_components(extracted_data, job_profile)
+            if before_recommend is not None:
+                before_recommend()
+            self.stage_runs["recommend"] += 1
+            recommendations = ResumeRecommender(extracted_data, job_profile).get_recommendations()
+            analysis = (components, recommendations)
+            self._analyses.put(analysis_key, analysis)
+        elif before_recommend is not None:
+            before_recommend()
+        components, recommendations = analysis
+
+        with self._pools_lock:
+            pool = self._pools.get(job_key)
+            if pool is None:
+                pool = _Pool()
+                self._pools.put(job_key, pool)
+            pool.set(key, extracted_data, components, recommendations)
+        return self._result(extracted_data, components, recommendations, blend_scores(components, weights))
+
+    @staticmethod
+    def _result(extracted_data: dict, components: tuple, recommendations: dict, blended: dict) -> dict:
+        """Assemble an analyze_resume-shaped result."""
+        return {
+            "extracted_data": extracted_data,
+            "skill_score": components[0],
+            "structure_score": components[1],
+            "total_score": blended["total_score"],
+            "match_score": blended["match_score"],
+            "recommendations": recommendations,
+        }
+
+    def _pool(self, job_description: Union[str, JobProfile], taxonomy: Optional[SkillTaxonomy]) -> Optional[_Pool]:
+        """Return the pool of resumes analyzed against a job, if any."""
+        with self._pools_lock:
+            return self._pools.get(self.job_key(self.job_profile(job_description, taxonomy)))
+
+    def blend(self, job_description: Union[str, JobProfile], weights: Optional[ScoreWeights] = None,
+              taxonomy: Optional[SkillTaxonomy] = None) -> Dict[str, np.ndarray]:
+        """
+        Blend the cached sub-scores of every resume analyzed against a job, with no other stage rerun.
+
+        Only the max_jobs most recently analyzed jobs keep their pools; other jobs
+        have no resumes.
+
+        Args:
+            job_description (str or JobProfile): The job, as passed to analyze() or score().
+            weights (ScoreWeights, optional): Score weights (default: the scorer and matcher defaults).
+            taxonomy (SkillTaxonomy, optional): The taxonomy passed to analyze(), if any.
+
+        Returns:
+            dict: "keys" (as passed to score(), or file paths), the COMPONENTS arrays and
+                the rounded "total_score" and "match_score" arrays.
+        """
+        # Deferred: ranking pulls in scipy, which the GUI should not pay for at startup
+        from .ranking import round_scores
+
+        weights = weights if weights is not None else ScoreWeights()
+        pool = self._pool(job_description, taxonomy)
+        if pool is None:
+            components = np.zeros((0, len(COMPONENTS)))
+            keys = []
+        else:
+            with self._pools_lock:
+                components = pool.components()
+                keys = list(pool.keys)
+        skill, structure, keyword = components.T
+        return {
+            "keys": keys,
+            **{name: components[:, column] for column, name in enumerate(COMPONENTS)},
+            "total_score": round_scores((weights.skill_weight * skill) + (weights.structure_weight * structure)),
+            "match_score": round_scores((weights.match_skill_weight * skill) + (weights.keyword_weight * keyword)),
+        }
+
+    def rank(self, job_description: Union[str, JobProfile], weights: Optional[ScoreWeights] = None,
+             top_k: int = 10, by: str = "match_score", taxonomy: Optional[SkillTaxonomy] = None) -> List[dict]:
+        """
+        Re-rank every resume analyzed against a job under new weights.
+
+        Args:
+            job_description (str or JobProfile): The job, as passed to analyze() or score().
+            weights (ScoreWeights, optional): Score weights (default: the scorer and matcher defaults).
+            top_k (int): Number of resumes to return (default: 10).
+            by (str): "match_score" or "total_score" (default: "match_score").
+            taxonomy (SkillTaxonomy, optional): The taxonomy passed to analyze(), if any.
+
+        Returns:
+            list: Dicts with the resume "key" and its scores, best first; ties keep analysis order.
+        """
+        if by not in ("match_score", "total_score"):
+            raise ValueError(f"Cannot rank by {by}; use 'match_score' or 'total_score'.")
+        scores = self.blend(job_description, weights, taxonomy)
+        keys = scores.pop("keys")
+        order = np.argsort(-scores[by], kind="stable")[:top_k]
+        return [
+            {"key": keys[index], **{name: float(values[index]) for name, values in scores.items()}}
+            for index in order
+        ]
+
+    def rescore(self, job_description: Union[str, JobProfile], weights: Optional[ScoreWeights] = None,
+                taxonomy: Optional[SkillTaxonomy] = None) -> Dict[Hashable, dict]:
+        """
+        Return full results for every resume analyzed against a job under new weights.
+
+        Args:
+            job_description (str or JobProfile): The job, as passed to analyze() or score().
+            weights (ScoreWeights, optional): Score weights (default: the scorer and matcher defaults).
+            taxonomy (SkillTaxonomy, optional): The taxonomy passed to analyze(), if any.
+
+        Returns:
+            dict: Resume key -> result shaped like pipeline.analyze_resume's.
+        """
+        pool = self._pool(job_description, taxonomy)
+        if pool is None:
+            return {}
+        scores = self.blend(job_description, weights, taxonomy)
+        with self._pools_lock:
+            rows = list(pool.rows)
+        return {
+            key: self._result(extracted_data, components, recommendations, {
+                "total_score": float(scores["total_score"][position]),
+                "match_score": float(scores["match_score"][position]),
+            })
+            for position, (key, (extracted_data, components, recommendations)) in enumerate(zip(scores["keys"], rows))
+        }
+
+    def clear(self):
+        """Drop every cached stage result."""
+        for cache in (self._texts, self._fields, self._analyses, self._profiles):
+            cache.clear()
+        with self._pools_lock:
+            self._pools.clear()
+
+
+# Example usage
+if __name__ == "__main__":
+    analyzer = IncrementalAnalyzer()
+    job_description = "We are looking for a Data Scientist with skills in Python and NLP."
+
+    result = analyzer.analyze("data/sample_resumes/John-Smith.docx", job_description)
+    print("First analysis:", result["total_score"], result["match_score"], dict(analyzer.stage_runs))
+
+    # Only the final blend runs again
+    weights = ScoreWeights(skill_weight=0.8, structure_weight=0.2)
+    result = analyzer.analyze("data/sample_resumes/John-Smith.docx", job_description, weights=weights)
+    print("Reweighted:", result["total_score"], result["match_score"], dict(analyzer.stage_runs))
+
+    # Parsing and extraction are reused for a new job description
+    analyzer.analyze("data/sample_resumes/John-Smith.docx", "Java developer with Spring experience.")
+    print("New job:", dict(analyzer.stage_runs))
+    print("Ranking:", analyzer.rank(job_description, weights))
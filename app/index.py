@@ -0,0 +1,262 @@
+import heapq
+import json
+import sqlite3
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+from data import load_stopwords
+from utils.instrumentation import instrumented
+from .job_profile import JobProfile
+
+# Resolved from the package rather than the working directory, so the index opens from anywhere
+STOPWORDS_PATH = Path(__file__).resolve().parents[1] / "data" / "stopwords.txt"
+
+# Sorts after every character, so [keyword, keyword + TERM_END) is the range of terms starting with keyword
+TERM_END = "\U0010ffff"
+
+
+class ResumeIndex:
+    """Persistent SQLite-backed inverted index of extracted resumes."""
+
+    DEFAULT_PATH = "output/resume_index.sqlite3"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS resumes (
+            resume_id TEXT PRIMARY KEY,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS terms (
+            term_id INTEGER PRIMARY KEY,
+            term TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS postings (
+            term_id INTEGER NOT NULL,
+            resume_id TEXT NOT NULL,
+            PRIMARY KEY (term_id, resume_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS postings_by_resume ON postings (resume_id);
+        CREATE TABLE IF NOT EXISTS skills (
+            skill TEXT NOT NULL,
+            resume_id TEXT NOT NULL,
+            PRIMARY KEY (skill, resume_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS skills_by_resume ON skills (resume_id);
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, stopwords: Optional[Iterable[str]] = None):
+        """
+        Open or create the index.
+
+        Args:
+            path (str): SQLite database file, or ":memory:" for a throwaway index.
+            stopwords (iterable, optional): Words dropped from text job descriptions in
+                search() (default: data/stopwords.txt).
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(self.SCHEMA)
+        # Dropped from text job descriptions: nearly every resume contains them
+        self.stopwords = set(stopwords) if stopwords is not None else load_stopwords(STOPWORDS_PATH)
+
+    @staticmethod
+    def terms_for(text: str) -> set:
+        """
+        Split resume text into index terms.
+
+        Job keywords never contain whitespace, so search() finds a keyword through
+        the terms starting with it.
+
+        Args:
+            text (str): Raw resume text.
+
+        Returns:
+            set: Distinct lowercased whitespace-delimited terms.
+        """
+        return set(text.lower().split())
+
+    def add(self, resume_id: str, extracted_data: dict):
+        """
+        Add a resume, replacing any previous version with the same ID.
+
+        Args:
+            resume_id (str): Stable identifier, e.g. the file path or a content hash.
+            extracted_data (dict): Extracted fields plus the raw "text".
+        """
+        self.add_many([(resume_id, extracted_data)])
+
+    def add_many(self, items: Iterable[Tuple[str, dict]]):
+        """
+        Add or replace many resumes in a single transaction.
+
+        Args:
+            items (iterable): (resume_id, extracted_data) pairs.
+        """
+        with self.connection:
+            for resume_id, extracted_data in items:
+                self._delete(resume_id)
+                stored = {key: value for key, value in extracted_data.items() if key != "text"}
+                self.connection.execute(
+                    "INSERT INTO resumes (resume_id, data) VALUES (?, ?)", (resume_id, json.dumps(stored))
+                )
+                terms = self.terms_for(extracted_data.get("text", ""))
+                self.connection.executemany("INSERT OR IGNORE INTO terms (term) VALUES (?)", ((term,) for term in terms))
+                self.connection.executemany(
+                    "INSERT INTO postings (term_id, resume_id) SELECT term_id, ? FROM terms WHERE term = ?",
+                    ((resume_id, term) for term in terms),
+                )
+                self.connection.executemany(
+                    "INSERT OR IGNORE INTO skills (skill, resume_id) VALUES (?, ?)",
+                    ((skill, resume_id) for skill in set(extracted_data.get("skills") or [])),
+                )
+
+    def remove(self, resume_id: str) -> bool:
+        """
+        Remove a resume from the index.
+
+        Args:
+            resume_id (str): Identifier passed to add().
+
+        Returns:
+            bool: True if the resume was indexed, False otherwise.
+        """
+        with self.connection:
+            return self._delete(resume_id)
+
+    def _delete(self, resume_id: str) -> bool:
+        """Delete a resume's rows inside the caller's transaction."""
+        self.connection.execute("DELETE FROM postings WHERE resume_id = ?", (resume_id,))
+        self.connection.execute("DELETE FROM skills WHERE resume_id = ?", (resume_id,))
+        return self.connection.execute("DELETE FROM resumes WHERE resume_id = ?", (resume_id,)).rowcount > 0
+
+    def compact(self):
+        """Drop terms no longer referenced by any resume and reclaim disk space."""
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM terms WHERE NOT EXISTS (SELECT 1 FROM postings WHERE postings.term_id = terms.term_id)"
+            )
+        self.connection.execute("VACUUM")
+
+    def get(self, resume_id: str) -> Optional[dict]:
+        """
+        Return the stored extracted data of a resume.
+
+        Args:
+            resume_id (str): Identifier passed to add().
+
+        Returns:
+            dict: Extracted fields (without the raw text), or None if not indexed.
+        """
+        row = self.connection.execute("SELECT data FROM resumes WHERE resume_id = ?", (resume_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def __len__(self) -> int:
+        """Return the number of indexed resumes."""
+        return self.connection.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    def _keyword_hits(self, job_profile: JobProfile) -> dict:
+        """Count job keyword occurrences per resume using posting lists."""
+        hits = {}
+        for keyword, count in job_profile.keyword_counts.items():
+            # A range scan of the term index: only the terms starting with the keyword are read
+            rows = self.connection.execute(
+                "SELECT DISTINCT postings.resume_id FROM terms JOIN postings ON postings.term_id = terms.term_id "
+                "WHERE terms.term >= ? AND terms.term < ?",
+                (keyword, keyword + TERM_END),
+            )
+            for (resume_id,) in rows:
+                hits[resume_id] = hits.get(resume_id, 0) + count
+        return hits
+
+    def _skill_hits(self, job_profile: JobProfile) -> dict:
+        """Count distinct job keywords listed among each resume's skills."""
+        keywords = list(job_profile.keyword_set)
+        hits = {}
+        # Stay well below SQLite's limit on bound parameters per statement
+        for start in range(0, len(keywords), 500):
+            chunk = keywords[start:start + 500]
+            rows = self.connection.execute(
+                f"SELECT resume_id, COUNT(*) FROM skills WHERE skill IN ({', '.join('?' * len(chunk))}) GROUP BY resume_id",
+                chunk,
+            )
+            for resume_id, count in rows:
+                hits[resume_id] = hits.get(resume_id, 0) + count
+        return hits
+
+    @instrumented("index.search")
+    def search(self, job_description: Union[str, JobProfile], top_k: int = 10,
+               skill_weight: float = 0.7, keyword_weight: float = 0.3) -> List[dict]:
+        """
+        Find the indexed resumes that best match a job description.
+
+        Scores equal ResumeMatcher.calculate_total_match_score on the stored resume
+        for the same JobProfile, except that a keyword must start a whitespace-delimited
+        word of the resume ("python" matches "python," but not "cpython"). Each keyword
+        is a range lookup in the term index, and only resumes sharing at least one
+        keyword or skill with the job are scored. Stopwords, which nearly every resume
+        contains, are dropped from a job description given as text.
+
+        Args:
+            job_description (str or JobProfile): Job description text, or a prebuilt
+                profile used as is.
+            top_k (int): Number of resumes to return (default: 10).
+            skill_weight (float): Weight for skill matching (default: 0.7).
+            keyword_weight (float): Weight for keyword matching (default: 0.3).
+
+        Returns:
+            list: Dicts with "resume_id", "score", "skill_score", "keyword_score" and
+                the stored "data", best first.
+        """
+        if not isinstance(job_description, JobProfile):
+            job_description = JobProfile(job_description, stopwords=self.stopwords)
+        job_profile = job_description
+        if job_profile.taxonomy is not None:
+            # The skills table holds skills as written, so it cannot be matched by canonical ID
+            raise ValueError("ResumeIndex.search does not support taxonomy job profiles.")
+        if not job_profile.keywords:
+            return []
+
+        keyword_hits = self._keyword_hits(job_profile)
+        skill_hits = self._skill_hits(job_profile)
+
+        candidates = []
+        for resume_id in keyword_hits.keys() | skill_hits.keys():
+            skill_score = skill_hits.get(resume_id, 0) / len(job_profile.keyword_set)
+            keyword_score = keyword_hits.get(resume_id, 0) / len(job_profile.keywords)
+            score = round((skill_weight * skill_score) + (keyword_weight * keyword_score), 2)
+            candidates.append((score, skill_score, keyword_score, resume_id))
+
+        best = heapq.nsmallest(top_k, candidates, key=lambda candidate: (-candidate[0], candidate[3]))
+        return [
+            {
+                "resume_id": resume_id,
+                "score": score,
+                "skill_score": skill_score,
+                "keyword_score": keyword_score,
+                "data": self.get(resume_id),
+            }
+            for score, skill_score, keyword_score, resume_id in best
+        ]
+
+    def close(self):
+        """Close the underlying database connection."""
+        self.connection.close()
+
+
+# Example usage
+if __name__ == "__main__":
+    index = ResumeIndex(":memory:")
+    index.add("john", {
+        "name": "John Doe",
+        "skills": ["python", "nlp"],
+        "text": "John Doe is skilled in Python, Machine Learning, and NLP.",
+    })
+    index.add("jane", {
+        "name": "Jane Roe",
+        "skills": ["java"],
+        "text": "Jane Roe builds Java services and REST APIs.",
+    })
+
+    for hit in index.search("Looking for a python developer with nlp experience", top_k=5):
+        print(hit)
@@ -0,0 +1,443 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from utils.file_utils import FileUtils
+from utils.instrumentation import get_instrumentation
+from .parser import ResumeParser
+from .extractor import ResumeExtractor
+from .sections import SKILL_SECTIONS
+from .dedup import LSHIndex, MinHasher
+
+
+def find_resume_files(directory: str, recursive: bool = True) -> List[str]:
+    """
+    List the supported resume files in a directory.
+
+    Args:
+        directory (str): Directory to walk.
+        recursive (bool): Descend into subdirectories (default: True).
+
+    Returns:
+        list: Sorted paths of valid resume files.
+    """
+    root = Path(directory)
+    if not root.is_dir():
+        raise NotADirectoryError(f"Not a directory: {directory}")
+    candidates = root.rglob("*") if recursive else root.iterdir()
+    return sorted(
+        str(path) for path in candidates
+        if FileUtils.is_valid_file(str(path), extensions=list(ResumeParser.SUPPORTED_FORMATS))
+    )
+
+
+def _warm_worker(metrics: bool = False):
+    """
+    Load the shared NER pipeline once when a worker process starts.
+
+    Args:
+        metrics (bool): Record metrics for the parent to merge, as the parent does (default: False).
+    """
+    instrumentation = get_instrumentation()
+    # A forked worker starts with a copy of the parent's totals; only its own work goes back
+    instrumentation.reset()
+    instrumentation.enabled = metrics
+    try:
+        ResumeExtractor("").nlp
+    except Exception:
+        # Report model problems per file instead of killing the pool
+        pass
+
+
+def _in_worker(task, *args) -> dict:
+    """Run a task returning a record in a pool worker, attaching the metrics it recorded."""
+    record = task(*args)
+    instrumentation = get_instrumentation()
+    if instrumentation.enabled:
+        record["metrics"] = instrumentation.collect()
+    return record
+
+
+def _merge_worker_metrics(record: dict) -> dict:
+    """Fold the metrics a worker attached to a record into this process's metrics."""
+    metrics = record.pop("metrics", None)
+    if metrics is not None:
+        get_instrumentation().merge(metrics)
+    return record
+
+
+def extract_fields(text: str, skill_keywords: list, use_sections: bool = False) -> dict:
+    """
+    Extract the contact details, name, skills and (optionally) sections of a resume text.
+
+    Args:
+        text (str): Extracted resume text.
+        skill_keywords (list): A list of skill keywords to match.
+        use_sections (bool): Record section offsets and search only SKILL_SECTIONS
+            for skills (default: False).
+
+    Returns:
+        dict: "name", "email", "phone", "skills" and, with use_sections, "sections".
+    """
+    extractor = ResumeExtractor(text)
+    contact = extractor.extract_contact()
+    fields = {
+        "name": extractor.extract_name(),
+        "email": contact["email"],
+        "phone": contact["phone"],
+        "skills": extractor.extract_skills(skill_keywords, sections=SKILL_SECTIONS if use_sections else None),
+    }
+    if use_sections:
+        fields["sections"] = extractor.extract_sections()
+    return fields
+
+
+def process_file(file_path: str, skill_keywords: list, use_cache: bool = True,
+                 backend: str = "auto", include_text: bool = False, use_sections: bool = False) -> dict:
+    """
+    Parse and extract one resume, capturing failures instead of raising.
+
+    Args:
+        file_path (str): Path to the resume file.
+        skill_keywords (list): A list of skill keywords to match.
+        use_cache (bool): Reuse cached extracted text (default: True).
+        backend (str): ResumeParser backend (default: "auto").
+        include_text (bool): Include the extracted text in the record (default: False).
+        use_sections (bool): Record section offsets and search only SKILL_SECTIONS
+            for skills (default: False).
+
+    Returns:
+        dict: Extracted fields and per-stage timings, or an "error" message.
+    """
+    record = parse_file(file_path, use_cache, backend)
+    if "error" not in record:
+        record = extract_record(record, skill_keywords, include_text, use_sections)
+    return record
+
+
+def parse_file(file_path: str, use_cache: bool = True, backend: str = "auto",
+               hasher: Optional[MinHasher] = None) -> dict:
+    """
+    Parse one resume, capturing failures instead of raising.
+
+    Args:
+        file_path (str): Path to the resume file.
+        use_cache (bool): Reuse cached extracted text (default: True).
+        backend (str): ResumeParser backend (default: "auto").
+        hasher (MinHasher, optional): Also compute the text's MinHash "signature".
+
+    Returns:
+        dict: "file", "text" and "timings", or "file" and an "error" message.
+    """
+    record = {"file": file_path, "timings": {}}
+    try:
+        start = time.perf_counter()
+        record["text"] = ResumeParser(file_path, use_cache=use_cache, backend=backend).extract_text()
+        record["timings"]["parse"] = time.perf_counter() - start
+        if hasher is not None:
+            start = time.perf_counter()
+            record["signature"] = hasher.signature(record["text"])
+            record["timings"]["signature"] = time.perf_counter() - start
+    except Exception as e:
+        record["error"] = f"parse: {e}"
+    return record
+
+
+def extract_record(record: dict, skill_keywords: list, include_text: bool = False,
+                   use_sections: bool = False) -> dict:
+    """
+    Add extracted fields to a record from parse_file(), capturing failures instead of raising.
+
+    Args:
+        record (dict): Parsed record with "text".
+        skill_keywords (list): A list of skill keywords to match.
+        include_text (bool): Keep the extracted text in the record (default: False).
+        use_sections (bool): Record section offsets and search only SKILL_SECTIONS
+            for skills (default: False).
+
+    Returns:
+        dict: The record with extracted fields and timings, or an "error" message.
+    """
+    text = record["text"] if include_text else record.pop("text")
+    try:
+        start = time.perf_counter()
+        record.update(extract_fields(text, skill_keywords, use_sections))
+        record["timings"]["extract"] = time.perf_counter() - start
+    except Exception as e:
+        record["error"] = f"extract: {e}"
+    return record
+
+
+def reuse_record(record: dict, original: dict, skill_keywords: list, include_text: bool = False,
+                 use_sections: bool = False) -> Optional[dict]:
+    """
+    Complete a parsed near-duplicate, reusing the NER result of the resume it duplicates.
+
+    Only the candidate's name comes from the original, and only when it appears in
+    the duplicate's own text: two candidates filling in the same template are near
+    duplicates too. Contact details, skills and section offsets are cheap and always
+    come from the duplicate's text.
+
+    Args:
+        record (dict): Parsed record with "text", "duplicate_of" and "similarity".
+        original (dict): Finished record of the original resume.
+        skill_keywords (list): A list of skill keywords to match.
+        include_text (bool): Keep the extracted text in the record (default: False).
+        use_sections (bool): Record section offsets and search only SKILL_SECTIONS
+            for skills (default: False).
+
+    Returns:
+        dict: The completed record, or None when the duplicate names a different
+            candidate and needs a full extraction.
+    """
+    name = original.get("name")
+    if name and name not in record["text"]:
+        return None
+    text = record["text"] if include_text else record.pop("text")
+    start = time.perf_counter()
+    extractor = ResumeExtractor(text)
+    contact = extractor.extract_contact()
+    record.update({
+        "name": name,
+        "email": contact["email"],
+        "phone": contact["phone"],
+        "skills": extractor.extract_skills(skill_keywords, sections=SKILL_SECTIONS if use_sections else None),
+    })
+    if use_sections:
+        record["sections"] = extractor.extract_sections()
+    record["timings"]["extract"] = time.perf_counter() - start
+    return record
+
+
+class IngestStats:
+    """Running totals for a bulk ingestion run."""
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.started = time.perf_counter()
+        self.files = 0
+        self.failures = 0
+        self.duplicates = 0
+        self.seconds_saved = 0.0
+        self.stage_seconds = {}
+
+    def add(self, record: dict, seconds_saved: float = 0.0):
+        """
+        Fold one processed record into the totals.
+
+        Args:
+            record (dict): Record returned by process_file().
+            seconds_saved (float): Extraction time skipped by reusing a duplicate's
+                results (default: 0.0).
+        """
+        self.files += 1
+        if "error" in record:
+            self.failures += 1
+        if "duplicate_of" in record:
+            self.duplicates += 1
+            self.seconds_saved += seconds_saved
+        for stage, seconds in record.get("timings", {}).items():
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    def summary(self) -> dict:
+        """
+        Summarize throughput and per-stage timings.
+
+        Returns:
+            dict: Files processed, failures, near-duplicates reused, wall time,
+                files/sec and mean seconds per stage.
+        """
+        elapsed = time.perf_counter() - self.started
+        succeeded = max(self.files - self.failures, 1)
+        return {
+            "files": self.files,
+            "failures": self.failures,
+            "duplicates": self.duplicates,
+            "dedup_ratio": round(self.duplicates / self.files, 4) if self.files else 0.0,
+            "extract_seconds_saved": round(self.seconds_saved, 3),
+            "elapsed_seconds": round(elapsed, 3),
+            "files_per_second": round(self.files / elapsed, 2) if elapsed else 0.0,
+            "stage_seconds_total": {stage: round(total, 3) for stage, total in self.stage_seconds.items()},
+            "stage_seconds_mean": {stage: round(total / succeeded, 4) for stage, total in self.stage_seconds.items()},
+        }
+
+
+def ingest_directory(directory: str, skill_keywords: list, workers: Optional[int] = None,
+                     use_cache: bool = True, backend: str = "auto", include_text: bool = False,
+                     stats: Optional[IngestStats] = None, use_sections: bool = False,
+                     dedup: bool = False, dedup_threshold: float = 0.8) -> Iterator[dict]:
+    """
+    Parse every resume in a directory on a process pool, yielding records as they complete.
+
+    At most a few tasks per worker are in flight, so memory stays flat no matter
+    how many files the directory holds.
+
+    Args:
+        directory (str): Directory holding resumes.
+        skill_keywords (list): A list of skill keywords to match.
+        workers (int, optional): Number of worker processes (default: CPU count).
+        use_cache (bool): Reuse cached extracted text (default: True).
+        backend (str): ResumeParser backend (default: "auto").
+        include_text (bool): Include the extracted text in each record (default: False).
+        stats (IngestStats, optional): Collector updated as records complete.
+        use_sections (bool): Record section offsets and search only SKILL_SECTIONS
+            for skills (default: False).
+        dedup (bool): Skip named-entity recognition for near-duplicates of resumes already
+            seen in this run; see ingest_deduplicated() (default: False).
+        dedup_threshold (float): Estimated Jaccard similarity of word shingles at which
+            two resumes count as duplicates (default: 0.8).
+
+    Yields:
+        dict: One record per file, in completion order.
+    """
+    if dedup:
+        yield from ingest_deduplicated(directory, skill_keywords, workers, use_cache, backend, include_text,
+                                       stats, use_sections, dedup_threshold)
+        return
+
+    files = iter(find_resume_files(directory))
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 4
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker,
+                             initargs=(get_instrumentation().enabled,)) as executor:
+        pending = set()
+        while True:
+            for file_path in files:
+                pending.add(executor.submit(_in_worker, process_file, file_path, skill_keywords, use_cache,
+                                            backend, include_text, use_sections))
+                if len(pending) >= max_in_flight:
+                    break
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                record = _merge_worker_metrics(future.result())
+                if stats is not None:
+                    stats.add(record)
+                yield record
+
+
+def ingest_deduplicated(directory: str, skill_keywords: list, workers: Optional[int] = None,
+                        use_cache: bool = True, backend: str = "auto", include_text: bool = False,
+                        stats: Optional[IngestStats] = None, use_sections: bool = False,
+                        threshold: float = 0.8) -> Iterator[dict]:
+    """
+    Ingest a directory like ingest_directory(), extracting each near-duplicate resume only once.
+
+    Workers parse files and compute MinHash signatures of the text. The parent
+    looks each signature up in an LSH index of the resumes seen so far; new
+    resumes go back to the pool for extraction, while duplicates are completed
+    with the original's name and carry "duplicate_of" and "similarity".
+    A duplicate of a resume still being extracted waits for it; if that
+    extraction fails, the duplicates are extracted themselves.
+
+    Args:
+        directory (str): Directory holding resumes.
+        skill_keywords (list): A list of skill keywords to match.
+        workers (int, optional): Number of worker processes (default: CPU count).
+        use_cache (bool): Reuse cached extracted text (default: True).
+        backend (str): ResumeParser backend (default: "auto").
+        include_text (bool): Include the extracted text in each record (default: False).
+        stats (IngestStats, optional): Collector updated as records complete, including
+            the dedup ratio and the extraction time saved.
+        use_sections (bool): Record section offsets and search only SKILL_SECTIONS
+            for skills (default: False).
+        threshold (float): Estimated similarity at which resumes are duplicates (default: 0.8).
+
+    Yields:
+        dict: One record per file, in completion order.
+    """
+    files = iter(find_resume_files(directory))
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 4
+    hasher = MinHasher()
+    index = LSHIndex(num_perm=hasher.num_perm, threshold=threshold)
+    # Originals whose extraction finished, and duplicates waiting for an original still in flight
+    extracted = {}
+    waiting = {}
+
+    def finish(record: dict, seconds_saved: float = 0.0) -> dict:
+        if stats is not None:
+            stats.add(record, seconds_saved)
+        return record
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker,
+                             initargs=(get_instrumentation().enabled,)) as executor:
+        pending = {}
+
+        def submit_extract(record: dict):
+            future = executor.submit(_in_worker, extract_record, record, skill_keywords, include_text, use_sections)
+            pending[future] = "extract"
+
+        def reuse_or_extract(duplicate: dict, original: dict) -> Iterator[dict]:
+            reused = reuse_record(duplicate, original, skill_keywords, include_text, use_sections)
+            if reused is None:
+                # A different candidate on the same template: extract it like any new resume
+                del duplicate["duplicate_of"], duplicate["similarity"]
+                submit_extract(duplicate)
+            else:
+                yield finish(reused, max(original["timings"]["extract"] - reused["timings"]["extract"], 0.0))
+
+        while True:
+            for file_path in files:
+                pending[executor.submit(_in_worker, parse_file, file_path, use_cache, backend, hasher)] = "parse"
+                if len(pending) >= max_in_flight:
+                    break
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind = pending.pop(future)
+                record = _merge_worker_metrics(future.result())
+                file_path = record["file"]
+
+                if kind == "extract":
+                    if "error" in record:
+                        index.remove(file_path)
+                        for duplicate in waiting.pop(file_path, ()):
+                            del duplicate["duplicate_of"], duplicate["similarity"]
+                            submit_extract(duplicate)
+                    else:
+                        # Keep only what duplicates reuse, not the text
+                        original = extracted[file_path] = {
+                            field: record.get(field) for field in ("name", "timings")
+                        }
+                        for duplicate in waiting.pop(file_path, ()):
+                            yield from reuse_or_extract(duplicate, original)
+                    yield finish(record)
+                    continue
+
+                if "error" in record:
+                    yield finish(record)
+                    continue
+                signature = record.pop("signature")
+                start = time.perf_counter()
+                match = index.find_duplicate(signature) if signature is not None else None
+                record["timings"]["dedup"] = time.perf_counter() - start
+                if match is None:
+                    if signature is not None:
+                        index.add(file_path, signature)
+                    submit_extract(record)
+                    continue
+
+                original_path, similarity = match
+                record["duplicate_of"] = original_path
+                record["similarity"] = round(similarity, 4)
+                original = extracted.get(original_path)
+                if original is None:
+                    waiting.setdefault(original_path, []).append(record)
+                else:
+                    yield from reuse_or_extract(record, original)
+
+
+# Example usage
+if __name__ == "__main__":
+    from data import load_skill_keywords
+
+    run_stats = IngestStats()
+    for result in ingest_directory("data/sample_resumes", load_skill_keywords(), workers=2, stats=run_stats):
+        print(result)
+    print("Summary:", run_stats.summary())
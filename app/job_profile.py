@@ -0,0 +1,189 @@
+from collections import Counter
+from typing import Iterable, List, Optional, Union
+
+from .taxonomy import SkillTaxonomy, popcount
+
+
+def extract_keywords(text: str) -> list:
+    """
+    Extract keywords from a given text.
+
+    Args:
+        text (str): Input text.
+
+    Returns:
+        list: List of keywords.
+    """
+    return [word.strip().lower() for word in text.split() if len(word) > 2]
+
+
+class JobProfile:
+    """A job description tokenized once and shared across every resume it is scored against."""
+
+    def __init__(self, job_description: str, stopwords: Optional[Iterable[str]] = None,
+                 taxonomy: Optional[SkillTaxonomy] = None):
+        """
+        Initialize the JobProfile.
+
+        Args:
+            job_description (str): Text of the job description.
+            stopwords (iterable, optional): Words to drop from the keywords, e.g.
+                data.load_stopwords(). Nothing is dropped by default, which keeps
+                scores identical to tokenizing the raw description.
+            taxonomy (SkillTaxonomy, optional): Compare skills as canonical skill IDs,
+                so synonyms and spelling variants match. By default skills are
+                compared with the description's lowercased words.
+        """
+        self.text = job_description
+        self.taxonomy = taxonomy
+        self.set_skill_bits(taxonomy.text_bitset(job_description) if taxonomy is not None else 0)
+        keywords = extract_keywords(job_description)
+        if stopwords:
+            stopwords = set(stopwords)
+            keywords = [keyword for keyword in keywords if keyword not in stopwords]
+
+        # Keywords keep their duplicates: the keyword score counts each occurrence
+        self.keywords = tuple(keywords)
+        self.keyword_set = frozenset(keywords)
+        self.keyword_counts = Counter(keywords)
+
+    @classmethod
+    def coerce(cls, job_description: Union[str, "JobProfile"],
+               taxonomy: Optional[SkillTaxonomy] = None) -> "JobProfile":
+        """
+        Return a JobProfile, building one if given a raw job description.
+
+        Args:
+            job_description (str or JobProfile): Job description text or a prebuilt profile.
+            taxonomy (SkillTaxonomy, optional): Taxonomy for a newly built profile;
+                a prebuilt profile keeps its own.
+
+        Returns:
+            JobProfile: The profile.
+        """
+        if isinstance(job_description, cls):
+            return job_description
+        return cls(job_description, taxonomy=taxonomy)
+
+    @classmethod
+    def for_role(cls, role: str, taxonomy: SkillTaxonomy) -> "JobProfile":
+        """
+        Build a profile from a role's precomputed skill bitset rather than a description.
+
+        Args:
+            role (str): Role name from data/job_keywords.json.
+            taxonomy (SkillTaxonomy): The compiled taxonomy.
+
+        Returns:
+            JobProfile: A profile whose text lists the role's skills.
+        """
+        # Separated by spaces only: keywords are whitespace-split, so "python," would
+        # only match a resume that puts a comma right after the skill
+        profile = cls(f"{role} " + " ".join(taxonomy.role_skills(role)))
+        profile.taxonomy = taxonomy
+        profile.set_skill_bits(taxonomy.roles[role])
+        return profile
+
+    def set_skill_bits(self, skill_bits: int):
+        """
+        Set the taxonomy skills the job asks for, with the lookups derived from them.
+
+        Args:
+            skill_bits (int): Bitset of canonical skill IDs.
+        """
+        self.skill_bits = skill_bits
+        self.skill_count = popcount(skill_bits)
+        # (bit, name) per job skill, so missing skills are listed without decoding whole bitsets
+        self.skill_items = (
+            [(1 << skill_id, self.taxonomy.skills[skill_id]) for skill_id in self.taxonomy.skill_ids_of(skill_bits)]
+            if skill_bits else []
+        )
+
+    def resume_bits(self, resume_skills: Iterable[str]) -> int:
+        """
+        Encode a resume's skills as a taxonomy bitset; requires a taxonomy.
+
+        Encode once and pass the bitset to skill_match_score() and missing_skills()
+        when scoring one resume against many profiles.
+
+        Args:
+            resume_skills (iterable or int): Skills extracted from the resume, or a bitset.
+
+        Returns:
+            int: Bitset of the recognised skills' IDs.
+        """
+        if isinstance(resume_skills, int):
+            return resume_skills
+        return self.taxonomy.bitset(resume_skills)
+
+    def skill_match_score(self, resume_skills: Iterable[str]) -> float:
+        """
+        Score the fraction of distinct job keywords present among the resume's skills.
+
+        Args:
+            resume_skills (iterable): Skills extracted from the resume; with a taxonomy,
+                also a bitset from resume_bits().
+
+        Returns:
+            float: Skill match score (0 to 1).
+        """
+        if self.taxonomy is not None:
+            if not self.skill_count:
+                return 0.0
+            return popcount(self.skill_bits & self.resume_bits(resume_skills)) / self.skill_count
+        if not self.keyword_set:
+            return 0.0
+        return len(self.keyword_set.intersection(resume_skills)) / len(self.keyword_set)
+
+    def keyword_match_score(self, resume_text: str) -> float:
+        """
+        Score the fraction of job keywords (with repeats) that appear in the resume text.
+
+        Args:
+            resume_text (str): Raw resume text.
+
+        Returns:
+            float: Keyword match score (0 to 1).
+        """
+        if not self.keywords:
+            return 0.0
+        resume_text = resume_text.lower()
+        matched = sum(count for keyword, count in self.keyword_counts.items() if keyword in resume_text)
+        return matched / len(self.keywords)
+
+    def missing_skills(self, resume_skills: Iterable[str]) -> List[str]:
+        """
+        List the distinct job keywords absent from the resume's skills.
+
+        Args:
+            resume_skills (iterable): Skills extracted from the resume; with a taxonomy,
+                also a bitset from resume_bits().
+
+        Returns:
+            list: Missing keywords, or canonical skill names when the profile has a taxonomy.
+        """
+        if self.taxonomy is not None:
+            resume_bits = self.resume_bits(resume_skills)
+            return [name for bit, name in self.skill_items if not resume_bits & bit]
+        return list(self.keyword_set.difference(resume_skills))
+
+
+# Example usage
+if __name__ == "__main__":
+    from data import load_stopwords
+
+    job_description = """
+    We are looking for a Data Scientist with skills in Python, Machine Learning, and Deep Learning.
+    Experience with data analysis and NLP is a plus.
+    """
+    profile = JobProfile(job_description, stopwords=load_stopwords())
+
+    print("Keywords:", profile.keywords)
+    print("Skill Match Score:", profile.skill_match_score(["python", "nlp"]))
+    print("Keyword Match Score:", profile.keyword_match_score("Python developer with NLP experience"))
+
+    from .taxonomy import get_skill_taxonomy
+
+    role_profile = JobProfile.for_role("Data Scientist", get_skill_taxonomy())
+    print("Role Skill Match Score:", role_profile.skill_match_score(["python", "ML", "Natural Language Processing"]))
+    print("Role Missing Skills:", role_profile.missing_skills(["python", "ML"]))
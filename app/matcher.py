@@ -1,16 +1,46 @@
+from typing import Iterable, Optional, Union
+from utils.instrumentation import instrumented
+from .job_profile import JobProfile, extract_keywords
+from .sections import sections_of
+
+
 class ResumeMatcher:
     """Class to match resumes to job descriptions and calculate compatibility scores."""
 
-    def __init__(self, extracted_data: dict, job_description: str):
+    KEYWORD_MODES = ("exact", "tfidf", "bm25")
+
+    def __init__(self, extracted_data: dict, job_description: Union[str, JobProfile], corpus_stats=None,
+                 sections: Optional[Iterable[str]] = None):
         """
         Initialize the ResumeMatcher.
 
         Args:
             extracted_data (dict): Extracted information from the resume.
-            job_description (str): Text of the job description.
+            job_description (str or JobProfile): Text of the job description,
+                or a JobProfile prebuilt once and shared across resumes.
+            corpus_stats (CorpusStats, optional): Statistics fit over the resume corpus,
+                required for the "tfidf" and "bm25" keyword modes.
+            sections (iterable, optional): Only match keywords against these resume
+                sections, e.g. ("summary", "experience", "skills"); the whole text is
+                used if none of them are found (default: the whole text).
         """
         self.extracted_data = extracted_data
-        self.job_description = job_description
+        self.job_profile = JobProfile.coerce(job_description)
+        self.job_description = self.job_profile.text
+        self.corpus_stats = corpus_stats
+        self.sections = tuple(sections) if sections is not None else None
+
+    def resume_text(self) -> str:
+        """
+        Return the resume text keyword matching runs on.
+
+        Returns:
+            str: The text of the selected sections, or the whole text.
+        """
+        text = self.extracted_data.get("text", "")
+        if self.sections is None:
+            return text
+        return sections_of(self.extracted_data).text_of(self.sections) or text
 
     def calculate_skill_match_score(self) -> float:
         """
@@ -19,14 +49,7 @@ class ResumeMatcher:
         Returns:
             float: Skill match score (0 to 1).
         """
-        resume_skills = set(self.extracted_data.get("skills", []))
-        job_skills = set(self.extract_keywords(self.job_description))
-        
-        if not job_skills:
-            return 0.0
-        
-        matched_skills = resume_skills.intersection(job_skills)
-        return len(matched_skills) / len(job_skills)
+        return self.job_profile.skill_match_score(self.extracted_data.get("skills", []))
 
     def calculate_keyword_match_score(self) -> float:
         """
@@ -35,28 +58,61 @@ class ResumeMatcher:
         Returns:
             float: Keyword match score (0 to 1).
         """
-        resume_text = self.extracted_data.get("text", "").lower()
-        job_keywords = self.extract_keywords(self.job_description)
+        return self.job_profile.keyword_match_score(self.resume_text())
+
+    def calculate_tfidf_match_score(self) -> float:
+        """
+        Calculate the TF-IDF cosine similarity between the resume text and job description.
 
-        if not job_keywords:
-            return 0.0
+        Returns:
+            float: TF-IDF match score (0 to 1).
+        """
+        return self._require_corpus_stats("tfidf").tfidf_similarity(self.resume_text(), self.job_description)
 
-        matched_keywords = [kw for kw in job_keywords if kw in resume_text]
-        return len(matched_keywords) / len(job_keywords)
+    def calculate_bm25_match_score(self) -> float:
+        """
+        Calculate the normalized BM25 score of the resume text for the job description.
 
-    def calculate_total_match_score(self, skill_weight=0.7, keyword_weight=0.3) -> float:
+        Returns:
+            float: BM25 match score (0 to 1).
+        """
+        return self._require_corpus_stats("bm25").bm25_score(self.resume_text(), self.job_description)
+
+    def _require_corpus_stats(self, mode: str):
+        """Return the corpus statistics, failing clearly if none were given."""
+        if self.corpus_stats is None:
+            raise ValueError(f"The {mode} keyword mode needs corpus_stats; fit them with CorpusStats.fit().")
+        return self.corpus_stats
+
+    @instrumented("match")
+    def calculate_total_match_score(self, skill_weight=0.7, keyword_weight=0.3, keyword_mode="exact",
+                                    keyword_score: Optional[float] = None) -> float:
         """
         Calculate the total compatibility score.
 
         Args:
             skill_weight (float): Weight for skill matching (default: 0.7).
             keyword_weight (float): Weight for keyword matching (default: 0.3).
+            keyword_mode (str): "exact" for substring keyword matching, or "tfidf"/"bm25"
+                for corpus-weighted matching (default: "exact").
+            keyword_score (float, optional): Exact keyword score computed elsewhere, e.g.
+                by streaming.KeywordStream when the text is not kept in memory.
 
         Returns:
             float: Total match score (0 to 1).
         """
+        if keyword_mode not in self.KEYWORD_MODES:
+            raise ValueError(f"Unknown keyword mode: {keyword_mode}. Available modes: {', '.join(self.KEYWORD_MODES)}")
+
         skill_match_score = self.calculate_skill_match_score()
-        keyword_match_score = self.calculate_keyword_match_score()
+        if keyword_mode == "tfidf":
+            keyword_match_score = self.calculate_tfidf_match_score()
+        elif keyword_mode == "bm25":
+            keyword_match_score = self.calculate_bm25_match_score()
+        elif keyword_score is not None:
+            keyword_match_score = keyword_score
+        else:
+            keyword_match_score = self.calculate_keyword_match_score()
 
         total_score = (skill_weight * skill_match_score) + (keyword_weight * keyword_match_score)
         return round(total_score, 2)
@@ -72,7 +128,7 @@ class ResumeMatcher:
         Returns:
             list: List of keywords.
         """
-        return [word.strip().lower() for word in text.split() if len(word) > 2]
+        return extract_keywords(text)
 
 
 # Example usage
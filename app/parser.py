@@ -1,5 +1,107 @@
-import textract
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
+from typing import Iterator, Optional
+from utils.instrumentation import instrumented
+from utils.text_cache import get_default_text_cache
+
+
+@lru_cache(maxsize=None)
+def is_installed(module_name: str) -> bool:
+    """
+    Check whether an optional backend library is installed without importing it.
+
+    The backends import their libraries on first use, so importing this module
+    (and the scoring code that shares its package) stays fast.
+
+    Args:
+        module_name (str): Top-level module name, e.g. "pdfminer".
+
+    Returns:
+        bool: True if the module can be imported.
+    """
+    return find_spec(module_name) is not None
+
+
+class TextractBackend:
+    """Extraction backend that shells out to external tools through textract."""
+
+    name = "textract"
+
+    @staticmethod
+    def is_available(suffix: str) -> bool:
+        """Return True if this backend can handle files with the given suffix."""
+        return is_installed("textract")
+
+    @staticmethod
+    def iter_pages(file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+        """
+        Yield the document text. textract cannot stream, so the whole text is one chunk.
+
+        Args:
+            file_path (Path): Path to the resume file.
+            max_pages (int, optional): Ignored; textract always processes every page.
+
+        Yields:
+            str: Extracted text.
+        """
+        import textract
+
+        yield textract.process(str(file_path)).decode('utf-8')
+
+
+class NativeBackend:
+    """In-process extraction backend using pdfminer.six for PDF and python-docx for DOCX."""
+
+    name = "native"
+
+    @staticmethod
+    def is_available(suffix: str) -> bool:
+        """Return True if this backend can handle files with the given suffix."""
+        if suffix == '.pdf':
+            return is_installed("pdfminer")
+        if suffix == '.docx':
+            return is_installed("docx")
+        return False
+
+    @classmethod
+    def iter_pages(cls, file_path: Path, max_pages: Optional[int] = None) -> Iterator[str]:
+        """
+        Yield the document text one page at a time.
+
+        Args:
+            file_path (Path): Path to the resume file.
+            max_pages (int, optional): Stop after this many PDF pages (default: no limit).
+
+        Yields:
+            str: Text of each PDF page, or of the DOCX body followed by each table.
+        """
+        if file_path.suffix.lower() == '.pdf':
+            yield from cls._iter_pdf_pages(file_path, max_pages)
+        else:
+            yield from cls._iter_docx_parts(file_path)
+
+    @staticmethod
+    def _iter_pdf_pages(file_path: Path, max_pages: Optional[int]) -> Iterator[str]:
+        """Yield the text of each PDF page as pdfminer lays it out."""
+        from pdfminer.high_level import extract_pages
+        from pdfminer.layout import LTTextContainer
+
+        for page in extract_pages(str(file_path), maxpages=max_pages or 0):
+            yield "".join(element.get_text() for element in page if isinstance(element, LTTextContainer))
+
+    @staticmethod
+    def _iter_docx_parts(file_path: Path) -> Iterator[str]:
+        """Yield the paragraph text of a DOCX body, then the text of each table."""
+        import docx
+
+        document = docx.Document(str(file_path))
+        yield "\n".join(paragraph.text for paragraph in document.paragraphs)
+        for table in document.tables:
+            yield "\n".join(
+                "\t".join(cell.text for cell in row.cells)
+                for row in table.rows
+            )
 
 
 class ResumeParser:
@@ -7,15 +109,36 @@ class ResumeParser:
 
     SUPPORTED_FORMATS = ('.pdf', '.docx')
 
-    def __init__(self, file_path: str):
+    # Bump whenever extraction output changes so cached text is re-extracted
+    PARSER_VERSION = "1"
+
+    BACKENDS = {
+        TextractBackend.name: TextractBackend,
+        NativeBackend.name: NativeBackend,
+    }
+
+    def __init__(self, file_path: str, cache=None, use_cache: bool = True,
+                 backend: str = "auto", max_pages: Optional[int] = None):
         """
         Initialize the ResumeParser.
 
         Args:
             file_path (str): Path to the resume file.
+            cache (TextCache, optional): Cache for extracted text (default: the shared cache).
+            use_cache (bool): Set to False to bypass the cache entirely (default: True).
+            backend (str): "native", "textract", or "auto" to prefer the in-process
+                native backend when its libraries are installed (default: "auto").
+            max_pages (int, optional): Only extract the first pages of large PDFs
+                (native backend only; default: no limit).
         """
         self.file_path = Path(file_path)
         self.validate_file()
+        self.backend = self.select_backend(backend, self.file_path.suffix.lower())
+        self.max_pages = max_pages
+        if use_cache:
+            self.cache = cache if cache is not None else get_default_text_cache()
+        else:
+            self.cache = None
 
     def validate_file(self):
         """Validate the file format."""
@@ -27,19 +150,68 @@ class ResumeParser:
                 f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
             )
 
+    @classmethod
+    def select_backend(cls, name: str, suffix: str):
+        """
+        Resolve a backend name to a backend class for the given file suffix.
+
+        Args:
+            name (str): "native", "textract" or "auto".
+            suffix (str): Lowercased file extension, e.g. ".pdf".
+
+        Returns:
+            type: The backend class.
+        """
+        if name == "auto":
+            for candidate in (NativeBackend, TextractBackend):
+                if candidate.is_available(suffix):
+                    return candidate
+            raise ImportError("No text extraction backend installed; install pdfminer.six and python-docx, or textract.")
+        if name not in cls.BACKENDS:
+            raise ValueError(f"Unknown backend: {name}. Available backends: auto, {', '.join(cls.BACKENDS)}")
+        backend = cls.BACKENDS[name]
+        if not backend.is_available(suffix):
+            raise ImportError(f"The {name} backend cannot handle {suffix} files; its libraries are not installed.")
+        return backend
+
+    def _cache_version(self) -> str:
+        """Return the cache version string for this parser configuration."""
+        return f"{self.PARSER_VERSION}:{self.backend.name}:{self.max_pages or 'all'}"
+
+    @instrumented("parse", size=lambda parser: parser.file_path.stat().st_size)
     def extract_text(self) -> str:
         """
-        Extract text from the resume file.
+        Extract text from the resume file, reusing cached text for identical files.
 
         Returns:
             str: Extracted text.
         """
+        if self.cache is None:
+            return self._extract_text()
+
+        key = self.cache.make_key(str(self.file_path), self._cache_version())
+        text = self.cache.get(key)
+        if text is None:
+            text = self._extract_text()
+            self.cache.put(key, text)
+        return text
+
+    def iter_pages(self) -> Iterator[str]:
+        """
+        Stream the resume text page by page without consulting the cache.
+
+        Yields:
+            str: Text of each page (or the whole document for backends that cannot stream).
+        """
         try:
-            text = textract.process(str(self.file_path))
-            return text.decode('utf-8').strip()
+            yield from self.backend.iter_pages(self.file_path, self.max_pages)
         except Exception as e:
             raise RuntimeError(f"Failed to extract text from {self.file_path}: {e}")
 
+    def _extract_text(self) -> str:
+        """Extract text from the resume file without consulting the cache."""
+        return "\n".join(self.iter_pages()).strip()
+
 
 # Example usage
 if __name__ == "__main__":
@@ -51,4 +223,4 @@ if __name__ == "__main__":
         text = parser.extract_text()
         print(f"Extracted text from {file_path}:\n{text[:500]}")  # Print first 500 characters
     except Exception as e:
-        print(f"Error: {e}")
\ No newline at end of file
+        print(f"Error: {e}")
@@ -0,0 +1,144 @@
+import threading
+from typing import Callable, NamedTuple, Optional, Union
+
+from .parser import ResumeParser
+from .extractor import ResumeExtractor
+from .scorer import ResumeScorer
+from .recommender import ResumeRecommender
+from .matcher import ResumeMatcher
+from .job_profile import JobProfile
+from .sections import SKILL_SECTIONS
+from .taxonomy import SkillTaxonomy
+
+STAGES = ("parse", "extract", "score", "recommend")
+
+# Skills the desktop app has always looked for
+DEFAULT_SKILL_KEYWORDS = ["Python", "Machine Learning", "Data Analysis", "NLP"]
+
+
+class AnalysisCancelled(Exception):
+    """Raised when an analysis is cancelled between pipeline stages."""
+
+
+class ScoreWeights(NamedTuple):
+    """Weights blending the sub-scores into ResumeScorer's total score and ResumeMatcher's match score."""
+
+    skill_weight: float = 0.6
+    structure_weight: float = 0.4
+    match_skill_weight: float = 0.7
+    keyword_weight: float = 0.3
+
+
+def analyze_resume(file_path: str, job_description: Union[str, JobProfile], skill_keywords: Optional[list] = None,
+                   use_cache: bool = True, progress: Optional[Callable[[str, int, int], None]] = None,
+                   cancel_event: Optional[threading.Event] = None, use_sections: bool = False,
+                   taxonomy: Optional[SkillTaxonomy] = None, weights: Optional[ScoreWeights] = None) -> dict:
+    """
+    Run the full parse, extract, score and recommend pipeline for one resume.
+
+    Args:
+        file_path (str): Path to the resume file.
+        job_description (str or JobProfile): Job description text or a prebuilt profile.
+        skill_keywords (list, optional): Skills to look for (default: DEFAULT_SKILL_KEYWORDS).
+        use_cache (bool): Reuse cached extracted text (default: True).
+        progress (callable, optional): Called as progress(stage, index, total) before each stage.
+        cancel_event (threading.Event, optional): When set, the analysis stops before the next stage.
+        use_sections (bool): Segment the resume, search only SKILL_SECTIONS for skills and
+            score structure on the real sections (default: False).
+        taxonomy (SkillTaxonomy, optional): Find every taxonomy skill, under any of its
+            synonyms, instead of skill_keywords, and score skills as canonical IDs.
+            A prebuilt JobProfile keeps its own taxonomy.
+        weights (ScoreWeights, optional): Score weights (default: the scorer and matcher defaults).
+
+    Returns:
+        dict: "extracted_data", "skill_score", "structure_score", "total_score",
+            "match_score" and "recommendations".
+    """
+    skill_keywords = skill_keywords if skill_keywords is not None else DEFAULT_SKILL_KEYWORDS
+
+    def enter(stage: str):
+        if cancel_event is not None and cancel_event.is_set():
+            raise AnalysisCancelled(f"Analysis cancelled before the {stage} stage.")
+        if progress is not None:
+            progress(stage, STAGES.index(stage), len(STAGES))
+
+    enter("parse")
+    resume_text = ResumeParser(file_path, use_cache=use_cache).extract_text()
+
+    enter("extract")
+    extracted_data = extract_resume(resume_text, skill_keywords, use_sections, taxonomy)
+
+    enter("score")
+    job_profile = JobProfile.coerce(job_description, taxonomy=taxonomy)
+    result = score_extracted(extracted_data, job_profile, weights)
+
+    enter("recommend")
+    result["recommendations"] = ResumeRecommender(extracted_data, job_profile).get_recommendations()
+    return result
+
+
+def extract_resume(resume_text: str, skill_keywords: list, use_sections: bool = False,
+                   taxonomy: Optional[SkillTaxonomy] = None) -> dict:
+    """
+    Extract the resume fields the pipeline scores.
+
+    Args:
+        resume_text (str): Parsed resume text.
+        skill_keywords (list): Skills to look for.
+        use_sections (bool): Search only SKILL_SECTIONS for skills and record the sections (default: False).
+        taxonomy (SkillTaxonomy, optional): Find taxonomy skills instead of skill_keywords.
+
+    Returns:
+        dict: "name", "email", "phone" and "skills", plus "sections" when use_sections is set.
+    """
+    extractor = ResumeExtractor(resume_text)
+    contact = extractor.extract_contact()
+    skill_sections = SKILL_SECTIONS if use_sections else None
+    if taxonomy is not None:
+        skills = taxonomy.extract(extractor.section_text(skill_sections))
+    else:
+        skills = extractor.extract_skills(skill_keywords, sections=skill_sections)
+    extracted_data = {
+        "name": extractor.extract_name(),
+        "email": contact["email"],
+        "phone": contact["phone"],
+        "skills": skills,
+    }
+    if use_sections:
+        extracted_data["sections"] = extractor.extract_sections()
+    return extracted_data
+
+
+def score_extracted(extracted_data: dict, job_profile: JobProfile, weights: Optional[ScoreWeights] = None) -> dict:
+    """
+    Score extracted resume fields against a job profile.
+
+    Args:
+        extracted_data (dict): Extracted name, email, phone and skills.
+        job_profile (JobProfile): The job to score against.
+        weights (ScoreWeights, optional): Score weights (default: the scorer and matcher defaults).
+
+    Returns:
+        dict: "extracted_data", "skill_score", "structure_score", "total_score" and "match_score".
+    """
+    weights = weights if weights is not None else ScoreWeights()
+    scorer = ResumeScorer(extracted_data, job_profile, weights.skill_weight, weights.structure_weight)
+    matcher = ResumeMatcher(extracted_data, job_profile)
+    return {
+        "extracted_data": extracted_data,
+        "skill_score": scorer.score_skills(),
+        "structure_score": scorer.score_structure(),
+        "total_score": scorer.calculate_total_score(),
+        "match_score": matcher.calculate_total_match_score(weights.match_skill_weight, weights.keyword_weight),
+    }
+
+
+# Example usage
+if __name__ == "__main__":
+    job_description = "We are looking for a Data Scientist with skills in Python and NLP."
+    analysis = analyze_resume(
+        "data/sample_resumes/John-Smith.docx",
+        job_description,
+        progress=lambda stage, index, total: print(f"[{index + 1}/{total}] {stage}"),
+    )
+    print(analysis)
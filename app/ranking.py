@@ -0,0 +1,193 @@
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+from scipy import sparse
+
+from utils.instrumentation import instrumented
+from .job_profile import JobProfile
+from .scorer import ResumeScorer
+from .skill_matcher import get_skill_matcher
+
+# Above this many keywords one Aho-Corasick pass per text beats repeated substring checks
+SUBSTRING_SCAN_THRESHOLD = 64
+
+
+def skill_matrix(skill_lists: Sequence[Sequence[str]], vocabulary: Dict[str, int]) -> sparse.csr_matrix:
+    """
+    Build a binary resume x skill matrix.
+
+    Args:
+        skill_lists (sequence): Extracted skills of each resume.
+        vocabulary (dict): Mapping of skill string (or taxonomy skill ID) to column index.
+
+    Returns:
+        scipy.sparse.csr_matrix: 1 where a resume lists the column's skill.
+    """
+    indptr = [0]
+    indices = []
+    for skills in skill_lists:
+        indices.extend({vocabulary[skill] for skill in skills if skill in vocabulary})
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.float64)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(skill_lists), len(vocabulary)))
+
+
+def keyword_matrix(texts: Sequence[str], keywords: Sequence[str]) -> sparse.csr_matrix:
+    """
+    Build a binary resume x keyword matrix using ResumeMatcher's substring semantics.
+
+    Args:
+        texts (sequence): Raw resume texts.
+        keywords (sequence): Distinct lowercase keywords, one per column.
+
+    Returns:
+        scipy.sparse.csr_matrix: 1 where the keyword occurs anywhere in the lowercased text.
+    """
+    indptr = [0]
+    indices = []
+    if len(keywords) > SUBSTRING_SCAN_THRESHOLD:
+        columns = {keyword: column for column, keyword in enumerate(keywords)}
+        matcher = get_skill_matcher(keywords, word_boundaries=False)
+        for text in texts:
+            indices.extend(columns[keyword] for keyword in matcher.match(text))
+            indptr.append(len(indices))
+    else:
+        columns = list(enumerate(keywords))
+        for text in texts:
+            lowered = text.lower()
+            indices.extend([column for column, keyword in columns if keyword in lowered])
+            indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.float64)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(texts), len(keywords)))
+
+
+def round_scores(scores: np.ndarray) -> np.ndarray:
+    """Round scores to two decimals exactly as Python's round() does."""
+    return np.array([round(score, 2) for score in scores.tolist()], dtype=np.float64)
+
+
+class RankingEngine:
+    """Score and rank many extracted resumes against one job description at once."""
+
+    def __init__(self, job_description: Union[str, JobProfile], skill_weight: float = 0.6,
+                 structure_weight: float = 0.4, match_skill_weight: float = 0.7, keyword_weight: float = 0.3):
+        """
+        Initialize the RankingEngine.
+
+        Args:
+            job_description (str or JobProfile): Job description text or a prebuilt profile.
+            skill_weight (float): ResumeScorer skill weight (default: 0.6).
+            structure_weight (float): ResumeScorer structure weight (default: 0.4).
+            match_skill_weight (float): ResumeMatcher skill weight (default: 0.7).
+            keyword_weight (float): ResumeMatcher keyword weight (default: 0.3).
+        """
+        self.job_profile = JobProfile.coerce(job_description)
+        self.skill_weight = skill_weight
+        self.structure_weight = structure_weight
+        self.match_skill_weight = match_skill_weight
+        self.keyword_weight = keyword_weight
+
+        taxonomy = self.job_profile.taxonomy
+        if taxonomy is not None:
+            # Columns are the canonical skill IDs the job asks for
+            skill_ids = taxonomy.skill_ids_of(self.job_profile.skill_bits)
+            self.skill_vocabulary = {skill_id: column for column, skill_id in enumerate(skill_ids)}
+        else:
+            self.skill_vocabulary = {skill: column for column, skill in enumerate(sorted(self.job_profile.keyword_set))}
+        self.keywords = list(self.job_profile.keyword_counts)
+        self.keyword_counts = np.array([self.job_profile.keyword_counts[keyword] for keyword in self.keywords], dtype=np.float64)
+
+    @instrumented("rank.score")
+    def score(self, resumes: Sequence[dict]) -> Dict[str, np.ndarray]:
+        """
+        Compute every score for a batch of resumes.
+
+        Args:
+            resumes (sequence): Extracted data dicts, as passed to ResumeScorer/ResumeMatcher.
+
+        Returns:
+            dict: Arrays of "skill", "keyword" and "structure" sub-scores plus the rounded
+                "total_score" (ResumeScorer.calculate_total_score) and "match_score"
+                (ResumeMatcher.calculate_total_match_score), one entry per resume.
+        """
+        n_resumes = len(resumes)
+        n_skills = len(self.skill_vocabulary)
+        n_keywords = int(self.keyword_counts.sum())
+
+        if n_skills:
+            skill_lists = [resume.get("skills", []) for resume in resumes]
+            if self.job_profile.taxonomy is not None:
+                skill_lists = [self.job_profile.taxonomy.skill_ids(skills) for skills in skill_lists]
+            skills = skill_matrix(skill_lists, self.skill_vocabulary)
+            skill_scores = np.asarray(skills.sum(axis=1)).ravel() / n_skills
+        else:
+            skill_scores = np.zeros(n_resumes)
+
+        if n_keywords:
+            keywords = keyword_matrix([resume.get("text", "") for resume in resumes], self.keywords)
+            keyword_scores = keywords.dot(self.keyword_counts) / n_keywords
+        else:
+            keyword_scores = np.zeros(n_resumes)
+
+        # Same checks as ResumeScorer, including real sections when resumes carry them
+        structure_scores = np.array([ResumeScorer.structure_score(resume) for resume in resumes], dtype=np.float64)
+
+        return {
+            "skill": skill_scores,
+            "keyword": keyword_scores,
+            "structure": structure_scores,
+            "total_score": round_scores((self.skill_weight * skill_scores) + (self.structure_weight * structure_scores)),
+            "match_score": round_scores((self.match_skill_weight * skill_scores) + (self.keyword_weight * keyword_scores)),
+        }
+
+    def rank(self, resumes: Sequence[dict], top_k: int = 10, by: str = "match_score") -> List[dict]:
+        """
+        Rank resumes by one of the rounded scores.
+
+        Args:
+            resumes (sequence): Extracted data dicts.
+            top_k (int): Number of resumes to return (default: 10).
+            by (str): "match_score" or "total_score" (default: "match_score").
+
+        Returns:
+            list: Top resumes as dicts with their input "index" and every score,
+                best first; ties keep input order.
+        """
+        return self.top_k(self.score(resumes), top_k=top_k, by=by)
+
+    @staticmethod
+    def top_k(scores: Dict[str, np.ndarray], top_k: int = 10, by: str = "match_score") -> List[dict]:
+        """
+        Select the best resumes from scores already computed by score().
+
+        Args:
+            scores (dict): Output of score().
+            top_k (int): Number of resumes to return (default: 10).
+            by (str): "match_score" or "total_score" (default: "match_score").
+
+        Returns:
+            list: Top resumes as dicts with their input "index" and every score,
+                best first; ties keep input order.
+        """
+        if by not in ("match_score", "total_score"):
+            raise ValueError(f"Cannot rank by {by}; use 'match_score' or 'total_score'.")
+        order = np.argsort(-scores[by], kind="stable")[:top_k]
+        return [
+            {"index": int(index), **{name: float(values[index]) for name, values in scores.items()}}
+            for index in order
+        ]
+
+
+# Example usage
+if __name__ == "__main__":
+    resumes = [
+        {"name": "John Doe", "email": "john@example.com", "skills": ["python", "nlp"],
+         "text": "John Doe is skilled in Python and NLP."},
+        {"name": "Jane Roe", "phone": "(123) 456-7890", "skills": ["java"],
+         "text": "Jane Roe builds Java services."},
+    ]
+    job_description = "We are looking for a Data Scientist with python and nlp experience."
+
+    engine = RankingEngine(job_description)
+    for row in engine.rank(resumes, top_k=2):
+        print(row)
@@ -1,16 +1,24 @@
+from typing import Union
+from utils.instrumentation import instrumented
+from .job_profile import JobProfile, extract_keywords
+from .scorer import ResumeScorer
+
+
 class ResumeRecommender:
     """Class to provide recommendations for improving resumes."""
 
-    def __init__(self, extracted_data: dict, job_description: str):
+    def __init__(self, extracted_data: dict, job_description: Union[str, JobProfile]):
         """
         Initialize the ResumeRecommender.
 
         Args:
             extracted_data (dict): Extracted information from the resume.
-            job_description (str): Text of the job description for comparison.
+            job_description (str or JobProfile): Text of the job description for comparison,
+                or a JobProfile prebuilt once and shared across resumes.
         """
         self.extracted_data = extracted_data
-        self.job_description = job_description
+        self.job_profile = JobProfile.coerce(job_description)
+        self.job_description = self.job_profile.text
 
     def recommend_missing_sections(self) -> list:
         """
@@ -19,9 +27,8 @@ class ResumeRecommender:
         Returns:
             list: List of missing sections.
         """
-        required_sections = ["name", "email", "phone", "skills"]
-        missing_sections = [section for section in required_sections if not self.extracted_data.get(section)]
-        return missing_sections
+        # The checks ResumeScorer.score_structure() counts, so a perfect structure score has nothing missing
+        return [name for name, passed in ResumeScorer.structure_checks(self.extracted_data) if not passed]
 
     def recommend_skills(self) -> list:
         """
@@ -30,10 +37,7 @@ class ResumeRecommender:
         Returns:
             list: List of suggested skills to add.
         """
-        resume_skills = set(self.extracted_data.get("skills", []))
-        job_skills = set(self.extract_keywords(self.job_description))
-        missing_skills = job_skills - resume_skills
-        return list(missing_skills)
+        return self.job_profile.missing_skills(self.extracted_data.get("skills", []))
 
     def recommend_formatting(self) -> list:
         """
@@ -56,6 +60,7 @@ class ResumeRecommender:
 
         return recommendations
 
+    @instrumented("recommend")
     def get_recommendations(self) -> dict:
         """
         Combine all recommendations into a single output.
@@ -80,7 +85,7 @@ class ResumeRecommender:
         Returns:
             list: List of keywords.
         """
-        return [word.strip().lower() for word in text.split() if len(word) > 2]
+        return extract_keywords(text)
 
 
 # Example usage
@@ -1,18 +1,31 @@
+from typing import Union
+from utils.instrumentation import instrumented
+from .job_profile import JobProfile, extract_keywords
+
+
 class ResumeScorer:
     """Class to score resumes based on predefined criteria."""
 
-    def __init__(self, extracted_data: dict, job_description: str, skill_weight: float = 0.6, structure_weight: float = 0.4):
+    REQUIRED_SECTIONS = ("name", "email", "phone", "skills")
+
+    # Checked instead of the "skills" key when the extracted data carries real sections
+    CONTACT_FIELDS = ("name", "email", "phone")
+    RESUME_SECTIONS = ("experience", "education", "skills")
+
+    def __init__(self, extracted_data: dict, job_description: Union[str, JobProfile], skill_weight: float = 0.6, structure_weight: float = 0.4):
         """
         Initialize the ResumeScorer.
 
         Args:
             extracted_data (dict): Extracted information from the resume.
-            job_description (str): Text of the job description for comparison.
+            job_description (str or JobProfile): Text of the job description for comparison,
+                or a JobProfile prebuilt once and shared across resumes.
             skill_weight (float): Weight assigned to skill matching (default: 0.6).
             structure_weight (float): Weight assigned to resume structure (default: 0.4).
         """
         self.extracted_data = extracted_data
-        self.job_description = job_description
+        self.job_profile = JobProfile.coerce(job_description)
+        self.job_description = self.job_profile.text
         self.skill_weight = skill_weight
         self.structure_weight = structure_weight
 
@@ -23,14 +36,7 @@ class ResumeScorer:
         Returns:
             float: Skill match score (0 to 1).
         """
-        resume_skills = set(self.extracted_data.get("skills", []))
-        job_skills = set(self.extract_keywords(self.job_description))
-        
-        if not job_skills:
-            return 0.0
-        
-        matched_skills = resume_skills.intersection(job_skills)
-        return len(matched_skills) / len(job_skills)
+        return self.job_profile.skill_match_score(self.extracted_data.get("skills", []))
 
     def score_structure(self) -> float:
         """
@@ -39,10 +45,48 @@ class ResumeScorer:
         Returns:
             float: Structural score (0 to 1).
         """
-        required_sections = ["name", "email", "phone", "skills"]
-        found_sections = [section for section in required_sections if self.extracted_data.get(section)]
-        return len(found_sections) / len(required_sections)
+        return self.structure_score(self.extracted_data)
+
+    @classmethod
+    def structure_checks(cls, extracted_data: dict) -> list:
+        """
+        List the structural checks a resume passes or fails.
+
+        Without segmentation the checks are the REQUIRED_SECTIONS keys of the
+        extracted data. When it carries "sections" (ResumeExtractor.extract_sections()),
+        the contact fields are checked along with the RESUME_SECTIONS actually
+        present in the document.
+
+        Args:
+            extracted_data (dict): Extracted information from the resume.
+
+        Returns:
+            list: (name, passed) per check; a document section is named e.g. "experience section".
+        """
+        sections = extracted_data.get("sections")
+        if sections is None:
+            return [(section, bool(extracted_data.get(section))) for section in cls.REQUIRED_SECTIONS]
+        found = {section[0] for section in sections}
+        return (
+            [(field, bool(extracted_data.get(field))) for field in cls.CONTACT_FIELDS]
+            + [(f"{section} section", section in found) for section in cls.RESUME_SECTIONS]
+        )
+
+    @classmethod
+    def structure_score(cls, extracted_data: dict) -> float:
+        """
+        Score structural completeness of extracted data without building a scorer.
+
+        Args:
+            extracted_data (dict): Extracted information from the resume.
+
+        Returns:
+            float: Fraction of structure_checks() passed (0 to 1).
+        """
+        checks = cls.structure_checks(extracted_data)
+        return sum(passed for _, passed in checks) / len(checks)
 
+    @instrumented("score")
     def calculate_total_score(self) -> float:
         """
         Calculate the overall score for the resume.
@@ -66,7 +110,7 @@ class ResumeScorer:
         Returns:
             list: List of keywords.
         """
-        return [word.strip().lower() for word in text.split() if len(word) > 2]
+        return extract_keywords(text)
 
 # Example usage
 if __name__ == "__main__":
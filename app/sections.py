@@ -0,0 +1,231 @@
+import re
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple
+
+# Canonical section names and the heading words that identify them, checked in order
+# so that e.g. "PROJECT EXPERIENCE" is a projects section, not an experience section
+SECTION_KEYWORDS = (
+    ("education", ("education", "academic", "coursework", "degree")),
+    ("projects", ("project",)),
+    ("skills", ("skill", "competenc", "technologies", "expertise", "proficienc")),
+    ("certifications", ("certific", "licens")),
+    ("experience", ("experience", "employment", "work history", "career")),
+    ("summary", ("summary", "objective", "profile", "about me")),
+    ("awards", ("award", "honor", "achievement")),
+    ("publications", ("publication",)),
+    ("languages", ("language",)),
+    ("activities", ("activit", "volunteer", "leadership", "involvement", "interest", "hobb")),
+    ("references", ("reference",)),
+)
+
+# Headings recognised in any letter case, alone on a line or followed by a colon
+# and content, e.g. "Skills: Python, NLP"; other headings must be in capitals
+KNOWN_HEADINGS = frozenset((
+    "summary", "professional summary", "profile", "objective", "about me",
+    "experience", "work experience", "professional experience", "employment", "employment history", "work history",
+    "education", "academic background",
+    "skills", "technical skills", "core competencies", "competencies", "expertise",
+    "projects", "certifications", "licenses", "awards", "honors", "publications",
+    "languages", "activities", "interests", "hobbies", "volunteering", "references",
+))
+
+# Longer lines are body text, never headings
+MAX_HEADING_LENGTH = 60
+MAX_HEADING_WORDS = 5
+
+# Cheap prefilter for heading lines: lines with capitals but no lowercase letters, or
+# lines starting with a known heading; segment() checks each candidate properly
+HEADING_CANDIDATE_PATTERN = re.compile(
+    r"^[^\S\n]*(?:[^a-z\n]*[A-Z][^a-z\n]*|(?i:"
+    + "|".join(sorted(map(re.escape, KNOWN_HEADINGS), key=len, reverse=True))
+    + r")[^\n]*)$",
+    re.MULTILINE,
+)
+
+# Sections whose text is worth searching for skills, for ResumeExtractor.extract_skills(sections=...)
+SKILL_SECTIONS = ("summary", "skills", "experience", "projects", "certifications")
+
+
+class Section(NamedTuple):
+    """Offsets of one section in the resume text; the text itself is not copied."""
+
+    name: str
+    start: int
+    body_start: int
+    end: int
+
+
+@lru_cache(maxsize=4096)
+def classify_heading(heading: str) -> str:
+    """
+    Map a heading to its canonical section name.
+
+    Args:
+        heading (str): Heading text, e.g. "RELEVANT WORK EXPERIENCE".
+
+    Returns:
+        str: Canonical section name, or None if the heading is not recognised.
+    """
+    heading = heading.lower()
+    for name, keywords in SECTION_KEYWORDS:
+        if any(keyword in heading for keyword in keywords):
+            return name
+    return None
+
+
+class ResumeSections:
+    """A resume split into named sections, stored as offsets into the original text."""
+
+    def __init__(self, text: str, sections: List[Section]):
+        """
+        Initialize the ResumeSections. Use segment() or from_list() rather than calling this directly.
+
+        Args:
+            text (str): The raw resume text.
+            sections (list): Sections in order of appearance.
+        """
+        self.text = text
+        self.sections = sections
+
+    @classmethod
+    def segment(cls, text: str) -> "ResumeSections":
+        """
+        Find the section headings of a resume in one regex pass over its text.
+
+        Everything before the first heading is the "header" section. A section
+        runs until the next heading, so repeated headings yield several sections
+        with the same name.
+
+        Args:
+            text (str): The raw resume text.
+
+        Returns:
+            ResumeSections: The segmented resume.
+        """
+        headings = []
+        for line in HEADING_CANDIDATE_PATTERN.finditer(text):
+            stripped = line.group().strip()
+            if not stripped:
+                continue
+            name = None
+            body_start = line.end() + 1
+            candidate = stripped.rstrip(":").strip()
+            if (len(stripped) <= MAX_HEADING_LENGTH and len(candidate.split()) <= MAX_HEADING_WORDS
+                    and (candidate.isupper() or candidate.lower() in KNOWN_HEADINGS)):
+                name = classify_heading(candidate)
+            elif ":" in stripped:
+                prefix = stripped.split(":", 1)[0].strip()
+                if prefix.lower() in KNOWN_HEADINGS:
+                    name = classify_heading(prefix)
+                    body_start = text.index(":", line.start()) + 1
+            if name is not None:
+                headings.append((name, line.start(), min(body_start, len(text))))
+
+        sections = []
+        if not headings or text[:headings[0][1]].strip():
+            sections.append(Section("header", 0, 0, headings[0][1] if headings else len(text)))
+        for index, (name, start, body_start) in enumerate(headings):
+            end = headings[index + 1][1] if index + 1 < len(headings) else len(text)
+            sections.append(Section(name, start, min(body_start, end), end))
+        return cls(text, sections)
+
+    def names(self) -> List[str]:
+        """Return the distinct section names in order of appearance."""
+        return list(dict.fromkeys(section.name for section in self.sections))
+
+    def __contains__(self, name: str) -> bool:
+        """Return True if the resume has a section with this name."""
+        return any(section.name == name for section in self.sections)
+
+    def find(self, names: Iterable[str]) -> List[Section]:
+        """
+        Return the sections with any of the given names, in order of appearance.
+
+        Args:
+            names (iterable): Canonical section names.
+
+        Returns:
+            list: Matching sections.
+        """
+        names = set(names)
+        return [section for section in self.sections if section.name in names]
+
+    def text_of(self, names: Iterable[str]) -> str:
+        """
+        Return the body text of the named sections, joined by newlines.
+
+        Args:
+            names (iterable): Canonical section names.
+
+        Returns:
+            str: The section bodies, or an empty string if none are present.
+        """
+        return "\n".join(self.text[section.body_start:section.end] for section in self.find(names))
+
+    def to_list(self) -> List[list]:
+        """
+        Return the sections in a JSON-friendly form, for storing in extracted data.
+
+        Returns:
+            list: [name, start, body_start, end] per section.
+        """
+        return [list(section) for section in self.sections]
+
+    @classmethod
+    def from_list(cls, text: str, items: Iterable[Iterable]) -> "ResumeSections":
+        """
+        Rebuild sections stored with to_list().
+
+        Args:
+            text (str): The raw resume text the offsets refer to.
+            items (iterable): [name, start, body_start, end] per section.
+
+        Returns:
+            ResumeSections: The sections.
+        """
+        return cls(text, [Section(*item) for item in items])
+
+
+def segment(text: str) -> ResumeSections:
+    """Split a resume into sections; see ResumeSections.segment()."""
+    return ResumeSections.segment(text)
+
+
+def sections_of(extracted_data: dict) -> ResumeSections:
+    """
+    Return the sections of extracted resume data.
+
+    Args:
+        extracted_data (dict): Extracted data with the raw "text" and, optionally,
+            "sections" stored by ResumeExtractor.extract_sections().
+
+    Returns:
+        ResumeSections: The stored sections, or the text segmented now.
+    """
+    text = extracted_data.get("text", "")
+    stored = extracted_data.get("sections")
+    if stored is not None:
+        return ResumeSections.from_list(text, stored)
+    return ResumeSections.segment(text)
+
+
+# Example usage
+if __name__ == "__main__":
+    sample_text = """John Doe
+johndoe@example.com | (123) 456-7890
+
+SUMMARY
+Data scientist with five years of experience.
+
+WORK EXPERIENCE
+Acme Corp - Built NLP pipelines in Python.
+
+Education
+B.Sc. Computer Science
+
+Skills: Python, Machine Learning, NLP
+"""
+    resume = segment(sample_text)
+    for section in resume.sections:
+        print(section.name, repr(sample_text[section.body_start:section.end][:40]))
+    print("Skill text:", repr(resume.text_of(SKILL_SECTIONS)))
@@ -0,0 +1,332 @@
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True if a character counts as a word character for regex \\b."""
+    return char.isalnum() or char == "_"
+
+
+def _lower(text: str) -> str:
+    """
+    Lowercase text without changing its length so offsets stay valid.
+
+    Args:
+        text (str): Input text.
+
+    Returns:
+        str: Lowercased text with one character per input character.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters (e.g. "İ") expand when lowercased; leave those untouched
+    return "".join(char.lower() if len(char.lower()) == 1 else char for char in text)
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton that finds many keywords in a single pass over a text."""
+
+    def __init__(self, keywords: Iterable[str], word_boundaries: bool = True):
+        """
+        Build the automaton for a keyword vocabulary.
+
+        Matching is case-insensitive. With word boundaries enabled a keyword only
+        matches where ``re.search(rf"\\b{re.escape(keyword)}\\b", text, re.IGNORECASE)``
+        would; without them any substring occurrence matches. Empty keywords never match.
+
+        Args:
+            keywords (iterable): Keywords to match, in the order results are reported.
+            word_boundaries (bool): Require regex word boundaries around matches (default: True).
+        """
+        self.keywords = list(keywords)
+        self.word_boundaries = word_boundaries
+
+        # Keywords that only differ in case share one pattern
+        self._patterns = []
+        self._pattern_keywords = []
+        pattern_ids = {}
+        for keyword in self.keywords:
+            pattern = _lower(keyword)
+            if not pattern:
+                continue
+            if pattern not in pattern_ids:
+                pattern_ids[pattern] = len(self._patterns)
+                self._patterns.append(pattern)
+                self._pattern_keywords.append([])
+            self._pattern_keywords[pattern_ids[pattern]].append(keyword)
+        self._lengths = [len(pattern) for pattern in self._patterns]
+        self._build()
+
+    def _build(self):
+        """Build the goto, failure and output tables."""
+        goto = [{}]
+        outputs = [[]]
+        for pattern_id, pattern in enumerate(self._patterns):
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(pattern_id)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                outputs[next_state].extend(outputs[fail[next_state]])
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(output) for output in outputs]
+
+    def _is_boundary(self, text: str, position: int) -> bool:
+        """Return True if a regex word boundary sits at the given position."""
+        before = position > 0 and _is_word_char(text[position - 1])
+        after = position < len(text) and _is_word_char(text[position])
+        return before != after
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Scan a text once and yield every keyword occurrence.
+
+        Args:
+            text (str): Text to scan.
+
+        Yields:
+            tuple: (pattern id, start offset, end offset) for each occurrence.
+        """
+        goto, fail, outputs, lengths = self._goto, self._fail, self._outputs, self._lengths
+        root = goto[0]
+        check_boundaries = self.word_boundaries
+        state = 0
+        for index, char in enumerate(_lower(text)):
+            if not state and char not in root:
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not outputs[state]:
+                continue
+            end = index + 1
+            for pattern_id in outputs[state]:
+                start = end - lengths[pattern_id]
+                if check_boundaries and not (self._is_boundary(text, start) and self._is_boundary(text, end)):
+                    continue
+                yield pattern_id, start, end
+
+    def stream(self) -> "MatchStream":
+        """
+        Start an incremental scan of a text that arrives in chunks.
+
+        Returns:
+            MatchStream: Feed it chunks with feed() and call finish() at the end.
+        """
+        return MatchStream(self)
+
+    def match_chunks(self, chunks: Iterable[str]) -> List[str]:
+        """
+        List the keywords that occur in a text given as chunks, as match() would on the joined text.
+
+        Args:
+            chunks (iterable): Consecutive pieces of the text, e.g. pages.
+
+        Returns:
+            list: Matched keywords in vocabulary order.
+        """
+        stream = self.stream()
+        for chunk in chunks:
+            stream.feed(chunk)
+        stream.finish()
+        return stream.matched_keywords()
+
+    def find_all(self, text: str) -> Dict[str, List[Tuple[int, int]]]:
+        """
+        Find the offsets of every keyword occurrence in a text.
+
+        Args:
+            text (str): Text to scan.
+
+        Returns:
+            dict: Mapping of each matched keyword to a list of (start, end) offsets.
+        """
+        offsets = {}
+        for pattern_id, start, end in self.iter_matches(text):
+            offsets.setdefault(pattern_id, []).append((start, end))
+        return {
+            keyword: spans
+            for pattern_id, spans in offsets.items()
+            for keyword in self._pattern_keywords[pattern_id]
+        }
+
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        Count the occurrences of every matched keyword in a text.
+
+        Args:
+            text (str): Text to scan.
+
+        Returns:
+            dict: Mapping of each matched keyword to its number of occurrences.
+        """
+        return {keyword: len(spans) for keyword, spans in self.find_all(text).items()}
+
+    def match(self, text: str) -> List[str]:
+        """
+        List the keywords that occur in a text.
+
+        Args:
+            text (str): Text to scan.
+
+        Returns:
+            list: Matched keywords in vocabulary order.
+        """
+        found = {pattern_id for pattern_id, _, _ in self.iter_matches(text)}
+        matched = {keyword for pattern_id in found for keyword in self._pattern_keywords[pattern_id]}
+        return [keyword for keyword in self.keywords if keyword in matched]
+
+
+class MatchStream:
+    """Incremental Aho-Corasick scan over text chunks, with matches spanning chunk boundaries."""
+
+    def __init__(self, matcher: SkillMatcher):
+        """
+        Initialize the MatchStream. Use SkillMatcher.stream() rather than calling this directly.
+
+        Args:
+            matcher (SkillMatcher): The matcher whose automaton is run.
+        """
+        self.matcher = matcher
+        self.offset = 0
+        self.found = set()
+        self._state = 0
+        # The last characters seen, enough to check the boundary before any pattern
+        self._tail = ""
+        self._tail_size = max(matcher._lengths, default=0) + 1
+        # Matches ending at the end of the last chunk, waiting for the next character
+        self._pending = []
+
+    def feed(self, chunk: str) -> List[Tuple[int, int, int]]:
+        """
+        Scan the next chunk of text.
+
+        Only the last few characters of earlier chunks are kept, so memory does
+        not grow with the length of the text.
+
+        Args:
+            chunk (str): Text following everything fed so far.
+
+        Returns:
+            list: (pattern id, start, end) of the occurrences confirmed by this chunk,
+                with offsets into the whole text.
+        """
+        if not chunk:
+            return []
+        matcher = self.matcher
+        goto, fail, outputs, lengths = matcher._goto, matcher._fail, matcher._outputs, matcher._lengths
+        root = goto[0]
+        window = self._tail + chunk
+        base = self.offset - len(self._tail)
+        matches = []
+
+        # The first character of this chunk settles the boundary after pending matches
+        for pattern_id, start, end in self._pending:
+            if matcher._is_boundary(window, end - base):
+                matches.append((pattern_id, start, end))
+        self._pending = []
+
+        check_boundaries = matcher.word_boundaries
+        state = self._state
+        for index, char in enumerate(_lower(chunk), len(self._tail)):
+            if not state and char not in root:
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not outputs[state]:
+                continue
+            end = index + 1
+            for pattern_id in outputs[state]:
+                start = end - lengths[pattern_id]
+                if check_boundaries:
+                    if not matcher._is_boundary(window, start):
+                        continue
+                    if end == len(window):
+                        self._pending.append((pattern_id, base + start, base + end))
+                        continue
+                    if not matcher._is_boundary(window, end):
+                        continue
+                matches.append((pattern_id, base + start, base + end))
+        self._state = state
+
+        self._tail = window[-self._tail_size:]
+        self.offset += len(chunk)
+        self.found.update(pattern_id for pattern_id, _, _ in matches)
+        return matches
+
+    def finish(self) -> List[Tuple[int, int, int]]:
+        """
+        End the text, settling matches that end at its last character.
+
+        Returns:
+            list: (pattern id, start, end) of the occurrences confirmed at the end.
+        """
+        matches = [
+            match for match in self._pending
+            if self.matcher._is_boundary(self._tail, len(self._tail))
+        ]
+        self._pending = []
+        self.found.update(pattern_id for pattern_id, _, _ in matches)
+        return matches
+
+    def matched_keywords(self) -> List[str]:
+        """
+        List the keywords confirmed so far, in vocabulary order.
+
+        Returns:
+            list: Matched keywords.
+        """
+        matcher = self.matcher
+        matched = {keyword for pattern_id in self.found for keyword in matcher._pattern_keywords[pattern_id]}
+        return [keyword for keyword in matcher.keywords if keyword in matched]
+
+
+@lru_cache(maxsize=32)
+def _cached_matcher(keywords: Tuple[str, ...], word_boundaries: bool) -> SkillMatcher:
+    """Build and memoize a matcher for a keyword tuple."""
+    return SkillMatcher(keywords, word_boundaries=word_boundaries)
+
+
+def get_skill_matcher(keywords: Iterable[str], word_boundaries: bool = True) -> SkillMatcher:
+    """
+    Return a cached matcher for a keyword vocabulary, building it on first use.
+
+    Args:
+        keywords (iterable): Keywords to match.
+        word_boundaries (bool): Require regex word boundaries around matches (default: True).
+
+    Returns:
+        SkillMatcher: Matcher shared by every caller using the same vocabulary.
+    """
+    return _cached_matcher(tuple(keywords), word_boundaries)
+
+
+# Example usage
+if __name__ == "__main__":
+    text = "Skills: Python, Machine Learning, machine learning pipelines, C++ and Node.js"
+    matcher = get_skill_matcher(["Python", "Machine Learning", "Learning", "Java", "Node.js"])
+
+    print("Matched:", matcher.match(text))
+    print("Offsets:", matcher.find_all(text))
+    print("Counts:", matcher.count(text))
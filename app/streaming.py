@@ -0,0 +1,300 @@
+from typing import Iterable, Iterator, Optional, Union
+
+from .extractor import HEADER_WINDOW, PHONE_PATTERN, ResumeExtractor, iter_email_spans
+from .job_profile import JobProfile
+from .matcher import ResumeMatcher
+from .parser import ResumeParser
+from .pipeline import DEFAULT_SKILL_KEYWORDS
+from .recommender import ResumeRecommender
+from .scorer import ResumeScorer
+from .skill_matcher import get_skill_matcher
+
+# Longest email address or phone number the contact stream reports exactly; longer
+# matches may be cut where a chunk ends
+MAX_CONTACT_LENGTH = 256
+
+# Characters of text after the header that NER looks at per call when the header has no name
+NAME_SCAN_WINDOW = 20000
+
+
+def iter_chunks(pages: Iterable[str], max_chunk: int = 1 << 16) -> Iterator[str]:
+    """
+    Turn parser pages into text chunks of bounded size.
+
+    Pages are separated by newlines exactly as ResumeParser.extract_text joins
+    them, and long pages are split, so consumers see the extracted text in
+    pieces of at most max_chunk characters.
+
+    Args:
+        pages (iterable): Page texts, e.g. from ResumeParser.iter_pages().
+        max_chunk (int): Largest chunk yielded (default: 64 KiB of characters).
+
+    Yields:
+        str: Consecutive pieces of the text.
+    """
+    for index, page in enumerate(pages):
+        if index:
+            yield "\n"
+        for start in range(0, len(page), max_chunk):
+            yield page[start:start + max_chunk]
+
+
+class ContactStream:
+    """Email addresses and phone numbers found incrementally, as ResumeExtractor.extract_contact would."""
+
+    def __init__(self):
+        """Initialize an empty stream."""
+        self.emails = {}
+        self.phones = {}
+        self._buffer = ""
+        self._offset = 0
+        # Offsets into the whole text where the next email/phone search starts
+        self._email_floor = 0
+        self._phone_floor = 0
+
+    def feed(self, chunk: str, final: bool = False):
+        """
+        Search the next chunk, holding back matches too close to its end to be complete.
+
+        Args:
+            chunk (str): Text following everything fed so far.
+            final (bool): This is the end of the text (default: False).
+        """
+        window = self._buffer + chunk
+        base = self._offset - len(self._buffer)
+        # Matches ending this close to the window's end may continue in the next chunk
+        limit = len(window) if final else len(window) - MAX_CONTACT_LENGTH
+
+        for start, end in iter_email_spans(window, self._email_floor - base):
+            if end > limit:
+                break
+            self.emails.setdefault(window[start:end], None)
+            self._email_floor = base + end
+        for match in PHONE_PATTERN.finditer(window, self._phone_floor - base):
+            if match.end() > limit:
+                break
+            self.phones.setdefault(match.group(), None)
+            self._phone_floor = base + match.end()
+
+        # Keep enough text for any held-back match, and never search text twice
+        keep_from = max(0, len(window) - 2 * MAX_CONTACT_LENGTH)
+        self._buffer = window[keep_from:]
+        self._offset = base + len(window)
+        self._email_floor = max(self._email_floor, base + keep_from)
+        self._phone_floor = max(self._phone_floor, base + keep_from)
+
+    def finish(self):
+        """End the text, settling the matches held back at its end."""
+        self.feed("", final=True)
+        self._buffer = ""
+
+    def to_dict(self) -> dict:
+        """
+        Return the contact details found.
+
+        Returns:
+            dict: "email", "phone", "emails" and "phones", as ResumeExtractor.extract_contact().
+        """
+        emails = list(self.emails)
+        phones = list(self.phones)
+        return {
+            "email": emails[0] if emails else None,
+            "phone": phones[0] if phones else None,
+            "emails": emails,
+            "phones": phones,
+        }
+
+
+class KeywordStream:
+    """ResumeMatcher's exact keyword score computed incrementally with one automaton pass."""
+
+    def __init__(self, job_profile: JobProfile):
+        """
+        Initialize the KeywordStream.
+
+        Args:
+            job_profile (JobProfile): The job whose keywords are looked for.
+        """
+        self.job_profile = job_profile
+        self._stream = get_skill_matcher(list(job_profile.keyword_counts), word_boundaries=False).stream()
+
+    def feed(self, chunk: str):
+        """Scan the next chunk of text."""
+        self._stream.feed(chunk)
+
+    def finish(self):
+        """End the text."""
+        self._stream.finish()
+
+    def score(self) -> float:
+        """
+        Return the fraction of job keywords (with repeats) found, as JobProfile.keyword_match_score.
+
+        Returns:
+            float: Keyword match score (0 to 1).
+        """
+        keywords = self.job_profile.keywords
+        if not keywords:
+            return 0.0
+        counts = self.job_profile.keyword_counts
+        return sum(counts[keyword] for keyword in self._stream.matched_keywords()) / len(keywords)
+
+
+class NameStream:
+    """The candidate's name from the header, falling back to later text one window at a time."""
+
+    def __init__(self, nlp=None):
+        """
+        Initialize the NameStream.
+
+        Args:
+            nlp (spacy.language.Language, optional): Pipeline to use for NER.
+        """
+        self.extractor = ResumeExtractor("", nlp=nlp)
+        self.name = None
+        self._buffer = ""
+        self._header_done = False
+
+    @property
+    def done(self) -> bool:
+        """Return True once a name was found; later chunks are then ignored."""
+        return self.name is not None
+
+    def _search(self, text: str):
+        """Run NER over one window of text, keeping the first person found."""
+        if text:
+            self.name = self.extractor._first_person(self.extractor.nlp(text))
+
+    def feed(self, chunk: str):
+        """Buffer the next chunk, running NER whenever a full window is available."""
+        if self.done:
+            return
+        self._buffer += chunk
+        if not self._header_done:
+            if len(self._buffer) <= HEADER_WINDOW:
+                return
+            header = ResumeExtractor.header(self._buffer)
+            self._search(header)
+            self._buffer = self._buffer[len(header):]
+            self._header_done = True
+        while not self.done and len(self._buffer) > NAME_SCAN_WINDOW:
+            # Cut at a line break so no entity is split between windows
+            window = ResumeExtractor.header(self._buffer, NAME_SCAN_WINDOW)
+            self._search(window)
+            self._buffer = self._buffer[len(window):]
+
+    def finish(self):
+        """Search whatever text is still buffered."""
+        if not self.done:
+            self._search(self._buffer)
+        self._buffer = ""
+
+
+def extract_chunks(chunks: Iterable[str], skill_keywords: Optional[list] = None,
+                   job_profile: Optional[JobProfile] = None, nlp=None) -> dict:
+    """
+    Extract resume fields from text chunks in one pass, without holding the whole text.
+
+    Memory is bounded by the largest chunk plus the NER window, whatever the
+    length of the document. Skills, emails and phones match what the
+    whole-text extractors find. NER sees the header first, like
+    ResumeExtractor.extract_name, then later text in NAME_SCAN_WINDOW pieces.
+
+    Args:
+        chunks (iterable): Consecutive pieces of the text, e.g. from iter_chunks().
+        skill_keywords (list, optional): Skills to look for (default: DEFAULT_SKILL_KEYWORDS).
+        job_profile (JobProfile, optional): Also compute the exact keyword score for this job.
+        nlp (spacy.language.Language, optional): Pipeline to use for NER.
+
+    Returns:
+        dict: "name", "email", "phone", "skills", plus "keyword_score" when a job profile is given.
+    """
+    skill_keywords = skill_keywords if skill_keywords is not None else DEFAULT_SKILL_KEYWORDS
+    skills = get_skill_matcher(skill_keywords).stream()
+    contact = ContactStream()
+    name = NameStream(nlp=nlp)
+    keywords = KeywordStream(job_profile) if job_profile is not None else None
+
+    for chunk in chunks:
+        skills.feed(chunk)
+        contact.feed(chunk)
+        name.feed(chunk)
+        if keywords is not None:
+            keywords.feed(chunk)
+    for stream in (skills, contact, name, keywords):
+        if stream is not None:
+            stream.finish()
+
+    details = contact.to_dict()
+    extracted_data = {
+        "name": name.name,
+        "email": details["email"],
+        "phone": details["phone"],
+        "skills": skills.matched_keywords(),
+    }
+    if keywords is not None:
+        extracted_data["keyword_score"] = keywords.score()
+    return extracted_data
+
+
+def analyze_stream(file_path: str, job_description: Union[str, JobProfile], skill_keywords: Optional[list] = None,
+                   backend: str = "auto", max_pages: Optional[int] = None, nlp=None) -> dict:
+    """
+    Run the analysis pipeline on a resume streamed page by page, for very large files.
+
+    The text cache is bypassed, since caching needs the whole text. Fields and
+    scores equal pipeline.analyze_resume's, except that the keyword part of
+    match_score is computed over the streamed text, as it is for ingested
+    records that keep their text.
+
+    Args:
+        file_path (str): Path to the resume file.
+        job_description (str or JobProfile): Job description text or a prebuilt profile.
+        skill_keywords (list, optional): Skills to look for (default: DEFAULT_SKILL_KEYWORDS).
+        backend (str): ResumeParser backend; "native" streams PDFs page by page (default: "auto").
+        max_pages (int, optional): Only read the first pages of large PDFs.
+        nlp (spacy.language.Language, optional): Pipeline to use for NER.
+
+    Returns:
+        dict: The fields returned by pipeline.analyze_resume.
+    """
+    parser = ResumeParser(file_path, use_cache=False, backend=backend, max_pages=max_pages)
+    job_profile = JobProfile.coerce(job_description)
+    return score_chunks(iter_chunks(parser.iter_pages()), job_profile, skill_keywords, nlp=nlp)
+
+
+def score_chunks(chunks: Iterable[str], job_profile: JobProfile, skill_keywords: Optional[list] = None,
+                 nlp=None) -> dict:
+    """
+    Extract and score a resume given as text chunks.
+
+    Args:
+        chunks (iterable): Consecutive pieces of the text.
+        job_profile (JobProfile): The job to score against.
+        skill_keywords (list, optional): Skills to look for (default: DEFAULT_SKILL_KEYWORDS).
+        nlp (spacy.language.Language, optional): Pipeline to use for NER.
+
+    Returns:
+        dict: "extracted_data", "skill_score", "structure_score", "total_score",
+            "match_score" and "recommendations".
+    """
+    fields = extract_chunks(chunks, skill_keywords, job_profile, nlp=nlp)
+    keyword_score = fields.pop("keyword_score")
+    scorer = ResumeScorer(fields, job_profile)
+    return {
+        "extracted_data": fields,
+        "skill_score": scorer.score_skills(),
+        "structure_score": scorer.score_structure(),
+        "total_score": scorer.calculate_total_score(),
+        "match_score": ResumeMatcher(fields, job_profile).calculate_total_match_score(keyword_score=keyword_score),
+        "recommendations": ResumeRecommender(fields, job_profile).get_recommendations(),
+    }
+
+
+# Example usage
+if __name__ == "__main__":
+    analysis = analyze_stream(
+        "data/sample_resumes/John-Smith.docx",
+        "We are looking for a Data Scientist with skills in Python and NLP.",
+    )
+    print(analysis)
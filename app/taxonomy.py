@@ -0,0 +1,353 @@
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# Bump whenever normalization or the compiled layout changes so stale binaries are rebuilt
+TAXONOMY_VERSION = "1"
+
+DEFAULT_COMPILED_PATH = "output/cache/skill_taxonomy.pickle"
+
+# Most skill strings remembered per taxonomy, so arbitrary input cannot grow the memo without bound
+MAX_MEMOIZED_SURFACES = 65536
+
+# Joiners dropped so "Node.js"/"NodeJS" and "Scikit-learn"/"scikitlearn" meet
+JOINER_PATTERN = re.compile(r"[.\-_'’]")
+# Anything else that is not a letter, digit, "+" or "#" separates words ("C++", "C#" survive)
+SEPARATOR_PATTERN = re.compile(r"[^\w+#]+|_")
+
+
+def normalize_skill(surface: str) -> str:
+    """
+    Reduce a skill's surface form to the key it is looked up by.
+
+    Args:
+        surface (str): Skill as written, e.g. "Node.js", "NodeJS" or "C++".
+
+    Returns:
+        str: Lowercased words without joiners, e.g. "nodejs", "nodejs", "c++".
+    """
+    return " ".join(SEPARATOR_PATTERN.sub(" ", JOINER_PATTERN.sub("", surface.lower())).split())
+
+
+def _count_ones(bits: int) -> int:
+    """Return the number of set bits of an int, for Pythons before 3.10."""
+    return bin(bits).count("1")
+
+
+# Number of skills in a bitset; Python 3.10+ counts bits natively
+popcount = getattr(int, "bit_count", _count_ones)
+
+
+class SkillTaxonomy:
+    """Canonical skills with synonyms, integer IDs and per-role bitsets."""
+
+    def __init__(self, skills: List[str], ids: Dict[str, int], roles: Dict[str, int]):
+        """
+        Initialize the SkillTaxonomy. Use build() or load() rather than calling this directly.
+
+        Args:
+            skills (list): Canonical skill names; a skill's ID is its index.
+            ids (dict): Normalized surface form (canonical name or synonym) to skill ID.
+            roles (dict): Role name to bitset of its skill IDs.
+        """
+        self.skills = skills
+        self.ids = ids
+        self.roles = roles
+        self.max_words = max((key.count(" ") + 1 for key in ids), default=0)
+        # Extracted skills repeat across resumes, so their IDs are remembered as written
+        self._surface_ids = {}
+
+    @classmethod
+    def build(cls, job_keywords: Dict[str, List[str]], synonyms: Optional[Dict[str, List[str]]] = None) -> "SkillTaxonomy":
+        """
+        Compile a taxonomy from role skill lists and a synonym table.
+
+        Args:
+            job_keywords (dict): Role name to skill names, as in data/job_keywords.json.
+            synonyms (dict, optional): Canonical skill name to alternative names,
+                as in data/skill_synonyms.json.
+
+        Returns:
+            SkillTaxonomy: The compiled taxonomy.
+        """
+        skills = []
+        ids = {}
+
+        def add(canonical: str) -> int:
+            key = normalize_skill(canonical)
+            if key not in ids:
+                ids[key] = len(skills)
+                skills.append(canonical)
+            return ids[key]
+
+        # Synonyms first, so a role listing an alias ("Database") gets the canonical ID
+        for canonical, aliases in (synonyms or {}).items():
+            skill_id = add(canonical)
+            for alias in aliases:
+                ids.setdefault(normalize_skill(alias), skill_id)
+
+        roles = {}
+        for role, role_skills in job_keywords.items():
+            bits = 0
+            for skill in role_skills:
+                bits |= 1 << add(skill)
+            roles[role] = bits
+        ids.pop("", None)
+        return cls(skills, ids, roles)
+
+    @classmethod
+    def load(cls, keywords_path: str = "data/job_keywords.json", synonyms_path: str = "data/skill_synonyms.json",
+             compiled_path: Optional[str] = DEFAULT_COMPILED_PATH) -> "SkillTaxonomy":
+        """
+        Load the compiled taxonomy, rebuilding it from JSON only when the sources changed.
+
+        Args:
+            keywords_path (str): Role skill lists.
+            synonyms_path (str): Synonym table; skipped if the file doesn't exist.
+            compiled_path (str, optional): Binary cache of the compiled taxonomy; None to always build.
+
+        Returns:
+            SkillTaxonomy: The taxonomy.
+        """
+        import json
+
+        with open(keywords_path, "rb") as file:
+            keywords_bytes = file.read()
+        synonyms_bytes = b"{}"
+        if os.path.exists(synonyms_path):
+            with open(synonyms_path, "rb") as file:
+                synonyms_bytes = file.read()
+        digest = hashlib.sha256(
+            TAXONOMY_VERSION.encode("utf-8") + b"\0" + keywords_bytes + b"\0" + synonyms_bytes
+        ).hexdigest()
+
+        if compiled_path:
+            taxonomy = cls.load_compiled(compiled_path, digest)
+            if taxonomy is not None:
+                return taxonomy
+
+        taxonomy = cls.build(json.loads(keywords_bytes), json.loads(synonyms_bytes))
+        if compiled_path:
+            taxonomy.save(compiled_path, digest)
+        return taxonomy
+
+    def save(self, path: str, digest: str = ""):
+        """
+        Write the compiled taxonomy to a binary file.
+
+        Args:
+            path (str): Output file.
+            digest (str): Fingerprint of the sources, checked by load_compiled().
+        """
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": TAXONOMY_VERSION, "digest": digest,
+                   "skills": self.skills, "ids": self.ids, "roles": self.roles}
+        # Write to a temporary file first so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, target)
+
+    @classmethod
+    def load_compiled(cls, path: str, digest: Optional[str] = None) -> Optional["SkillTaxonomy"]:
+        """
+        Read a taxonomy written by save().
+
+        Args:
+            path (str): Binary file.
+            digest (str, optional): Expected source fingerprint; a mismatch counts as a miss.
+
+        Returns:
+            SkillTaxonomy: The taxonomy, or None if the file is missing, unreadable or stale.
+        """
+        try:
+            with open(path, "rb") as file:
+                payload = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if payload.get("version") != TAXONOMY_VERSION or (digest is not None and payload.get("digest") != digest):
+            return None
+        return cls(payload["skills"], payload["ids"], payload["roles"])
+
+    def skill_id(self, surface: str) -> Optional[int]:
+        """
+        Look up the ID of a skill or synonym.
+
+        Args:
+            surface (str): Skill as written.
+
+        Returns:
+            int: Skill ID, or None for unknown skills.
+        """
+        return self.ids.get(normalize_skill(surface))
+
+    def canonical(self, surface: str) -> Optional[str]:
+        """
+        Return the canonical name of a skill or synonym.
+
+        Args:
+            surface (str): Skill as written, e.g. "sklearn".
+
+        Returns:
+            str: Canonical name, e.g. "Scikit-learn", or None for unknown skills.
+        """
+        skill_id = self.skill_id(surface)
+        return self.skills[skill_id] if skill_id is not None else None
+
+    def skill_ids(self, surfaces: Iterable[str]) -> List[int]:
+        """
+        Look up the IDs of many skills; unknown skills are skipped.
+
+        Args:
+            surfaces (iterable): Skills as written.
+
+        Returns:
+            list: Skill IDs, in input order.
+        """
+        found = []
+        for surface in surfaces:
+            try:
+                skill_id = self._surface_ids[surface]
+            except KeyError:
+                skill_id = self.ids.get(normalize_skill(surface))
+                if len(self._surface_ids) < MAX_MEMOIZED_SURFACES:
+                    self._surface_ids[surface] = skill_id
+            if skill_id is not None:
+                found.append(skill_id)
+        return found
+
+    def bitset(self, surfaces: Iterable[str]) -> int:
+        """
+        Encode skills as a bitset of their IDs; unknown skills are ignored.
+
+        Args:
+            surfaces (iterable): Skills as written.
+
+        Returns:
+            int: Bitset with bit i set for skill ID i.
+        """
+        bits = 0
+        for skill_id in self.skill_ids(surfaces):
+            bits |= 1 << skill_id
+        return bits
+
+    @staticmethod
+    def skill_ids_of(bits: int) -> List[int]:
+        """
+        Decode a bitset into skill IDs, in ascending order.
+
+        Args:
+            bits (int): Bitset of skill IDs.
+
+        Returns:
+            list: Skill IDs.
+        """
+        ids = []
+        while bits:
+            lowest = bits & -bits
+            ids.append(lowest.bit_length() - 1)
+            bits ^= lowest
+        return ids
+
+    def names(self, bits: int) -> List[str]:
+        """
+        Decode a bitset into canonical skill names, in ID order.
+
+        Args:
+            bits (int): Bitset of skill IDs.
+
+        Returns:
+            list: Canonical names.
+        """
+        return [self.skills[skill_id] for skill_id in self.skill_ids_of(bits)]
+
+    def find_ids(self, text: str) -> List[int]:
+        """
+        Find the skills mentioned in free text.
+
+        The text is normalized like skill names and every run of up to
+        max_words words is looked up, so "NodeJS", "node.js" and "Node.js"
+        are all found, as are symbols such as "C++" that regex word boundaries miss.
+
+        Args:
+            text (str): Free text, e.g. a resume or job description.
+
+        Returns:
+            list: Skill IDs in order of first mention.
+        """
+        words = normalize_skill(text).split()
+        found = {}
+        for start in range(len(words)):
+            for length in range(1, min(self.max_words, len(words) - start) + 1):
+                skill_id = self.ids.get(" ".join(words[start:start + length]))
+                if skill_id is not None:
+                    found.setdefault(skill_id, None)
+        return list(found)
+
+    def extract(self, text: str) -> List[str]:
+        """
+        Return the canonical names of the skills mentioned in free text, in order of first mention.
+
+        Args:
+            text (str): Free text.
+
+        Returns:
+            list: Canonical skill names.
+        """
+        return [self.skills[skill_id] for skill_id in self.find_ids(text)]
+
+    def text_bitset(self, text: str) -> int:
+        """Return the bitset of the skills mentioned in free text."""
+        bits = 0
+        for skill_id in self.find_ids(text):
+            bits |= 1 << skill_id
+        return bits
+
+    def role_skills(self, role: str) -> List[str]:
+        """
+        Return the canonical skills of a role.
+
+        Args:
+            role (str): Role name from the job keywords file.
+
+        Returns:
+            list: Canonical names, in ID order.
+        """
+        return self.names(self.roles[role])
+
+    def surface_forms(self) -> List[str]:
+        """Return every canonical name followed by the other normalized forms that map to a skill."""
+        canonical_keys = {normalize_skill(skill) for skill in self.skills}
+        return list(self.skills) + [key for key in self.ids if key not in canonical_keys]
+
+
+_default_taxonomy = None
+_default_taxonomy_lock = threading.Lock()
+
+
+def get_skill_taxonomy() -> SkillTaxonomy:
+    """Return the process-wide taxonomy, loading the compiled form on first use."""
+    global _default_taxonomy
+    with _default_taxonomy_lock:
+        if _default_taxonomy is None:
+            _default_taxonomy = SkillTaxonomy.load()
+        return _default_taxonomy
+
+
+# Example usage
+if __name__ == "__main__":
+    taxonomy = get_skill_taxonomy()
+    for surface in ("Node.js", "NodeJS", "node js", "C++", "sklearn", "Database", "Cobol"):
+        print(f"{surface!r:>12} -> {taxonomy.canonical(surface)}")
+
+    resume_bits = taxonomy.text_bitset("Built REST APIs in NodeJS and C++; ML with sklearn.")
+    role_bits = taxonomy.roles["Software Engineer"]
+    print("Matched:", taxonomy.names(resume_bits & role_bits))
+    print("Missing:", taxonomy.names(role_bits & ~resume_bits))
+    print(f"Coverage: {popcount(resume_bits & role_bits) / popcount(role_bits):.2f}")
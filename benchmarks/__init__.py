@@ -0,0 +1,4 @@
+# benchmarks/__init__.py
+
+# Throughput benchmarks; run each module from the repository root, e.g.
+#   python -m benchmarks.bench_extract_batch
@@ -0,0 +1,48 @@
+import argparse
+import json
+
+from app.async_pipeline import PipelineStats, analyze_batch
+from app.ingest import find_resume_files
+from app.pipeline import analyze_resume
+from benchmarks.common import SAMPLE_DIR, Timer
+from benchmarks.synthetic import synthetic_job_description
+
+
+def run(directory: str, repeat: int, parse_workers: int, use_processes: bool):
+    """
+    Compare sequential analyze_resume calls with the overlapped asyncio pipeline.
+
+    Text caching is disabled so both runs actually parse every file.
+
+    Args:
+        directory (str): Directory of resumes.
+        repeat (int): How many times to repeat the file list.
+        parse_workers (int): Files parsed at once by the asyncio pipeline.
+        use_processes (bool): Parse in worker processes instead of threads.
+    """
+    files = find_resume_files(directory) * repeat
+    job_description = synthetic_job_description()
+
+    with Timer() as sequential:
+        for file_path in files:
+            analyze_resume(file_path, job_description, use_cache=False)
+
+    stats = PipelineStats()
+    with Timer() as overlapped:
+        analyze_batch(files, job_description, stats=stats, use_cache=False,
+                      parse_workers=parse_workers, use_processes=use_processes)
+
+    print(f"files       {len(files)}")
+    print(f"sequential  {sequential.elapsed:.2f} s ({len(files) / sequential.elapsed:.1f} files/s)")
+    print(f"asyncio     {overlapped.elapsed:.2f} s ({len(files) / overlapped.elapsed:.1f} files/s)")
+    print(json.dumps(stats.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the asyncio batch pipeline.")
+    parser.add_argument("--directory", default=str(SAMPLE_DIR))
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--parse-workers", type=int, default=4)
+    parser.add_argument("--processes", action="store_true", help="Parse in worker processes.")
+    args = parser.parse_args()
+    run(args.directory, args.repeat, args.parse_workers, args.processes)
@@ -0,0 +1,84 @@
+import argparse
+import random
+
+import numpy as np
+
+from app.bulk_matching import BulkMatcher
+from app.job_profile import JobProfile
+from app.matcher import ResumeMatcher
+from benchmarks.common import Timer
+from benchmarks.synthetic import synthetic_job_description, synthetic_resumes
+from data import load_job_keywords
+
+
+def synthetic_jobs(count: int, seed: int = 0) -> list:
+    """Generate job descriptions spread across the roles in data/job_keywords.json."""
+    rng = random.Random(seed)
+    roles = list(load_job_keywords())
+    return [synthetic_job_description(rng.choice(roles), seed=seed + index) for index in range(count)]
+
+
+def run(n_jobs: int, n_resumes: int, top_k: int, block_size: int, workers: list, check: int):
+    """
+    Compare per-pair ResumeMatcher scoring with blocked bulk matching.
+
+    Args:
+        n_jobs (int): Job postings.
+        n_resumes (int): Candidate pool size.
+        top_k (int): Matches kept per resume and per job.
+        block_size (int): Resumes per block.
+        workers (list): Thread counts to try.
+        check (int): Resumes whose scores are checked against ResumeMatcher for every job.
+    """
+    jobs = synthetic_jobs(n_jobs)
+    resumes = synthetic_resumes(n_resumes)
+    profiles = [JobProfile(job) for job in jobs]
+    print(f"{n_jobs} jobs x {n_resumes} resumes = {n_jobs * n_resumes} pairs, top {top_k}, blocks of {block_size}")
+
+    # Per-pair objects with shared profiles, on a sample of resumes
+    sample = resumes[:check]
+    with Timer() as per_pair:
+        expected = np.array([
+            [ResumeMatcher(resume, profile).calculate_total_match_score() for profile in profiles]
+            for resume in sample
+        ])
+    print(f"{'per-pair matcher':<20} {len(sample) * n_jobs / per_pair.elapsed:>14,.0f} pairs/sec")
+
+    with Timer() as build:
+        matcher = BulkMatcher(profiles)
+    print(f"job matrices built in {build.elapsed * 1000:.1f} ms "
+          f"({len(matcher.skill_vocabulary)} skills, {len(matcher.keywords)} keywords)")
+
+    # Every sampled score matches ResumeMatcher, and the top-k agree with a full sort
+    _, block = next(matcher.iter_blocks(sample, block_size=len(sample)))
+    rounded = np.array([[round(score, 2) for score in row] for row in block.tolist()])
+    assert np.array_equal(rounded, expected), "bulk scores differ from ResumeMatcher"
+
+    with Timer() as encoding:
+        encoded = matcher.encode(resumes)
+    print(f"resume matrices built in {encoding.elapsed:.2f} s ({n_resumes / encoding.elapsed:,.0f} resumes/sec)")
+    for count in workers:
+        result = matcher.match(encoded, top_k=top_k, block_size=block_size, workers=count)
+        print(f"{'bulk, ' + str(count) + ' threads':<20} {result['pairs_per_sec']:>14,.0f} pairs/sec "
+              f"({result['seconds']:.2f} s)")
+
+    top = np.argsort(-block, axis=1, kind="stable")[:, :result["resume_jobs"].shape[1]]
+    assert np.array_equal(result["resume_jobs"][:len(sample)], top), "top jobs per resume differ from a full sort"
+    skills, keywords = encoded
+    scores = np.concatenate([matcher.score_block(skills[start:start + block_size], keywords[start:start + block_size])
+                             for start in range(0, n_resumes, block_size)])
+    top = np.argsort(-scores, axis=0, kind="stable")[:result["job_resumes"].shape[1]].T
+    assert np.array_equal(result["job_resumes"], top), "top resumes per job differ from a full sort"
+    print("Scores and rankings match ResumeMatcher.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark blocked many-jobs x many-resumes matching.")
+    parser.add_argument("--jobs", type=int, default=300)
+    parser.add_argument("--resumes", type=int, default=20000)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--block-size", type=int, default=2048)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--check", type=int, default=200)
+    args = parser.parse_args()
+    run(args.jobs, args.resumes, args.top_k, args.block_size, args.workers, args.check)
@@ -0,0 +1,97 @@
+import argparse
+import re
+
+from app.extractor import ResumeExtractor
+from benchmarks.common import Timer, load_sample_texts
+
+# The per-call patterns ResumeExtractor used before they were compiled at module level
+LEGACY_EMAIL = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+LEGACY_PHONE = r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"
+
+
+def legacy_contact(text: str) -> tuple:
+    """Find the first email and phone the way the original methods did, one scan each."""
+    email = re.search(LEGACY_EMAIL, text)
+    phone = re.search(LEGACY_PHONE, text)
+    return email.group() if email else None, phone.group() if phone else None
+
+
+def legacy_contact_all(text: str) -> tuple:
+    """Find every email and phone with the legacy patterns, one full scan each."""
+    emails = list(dict.fromkeys(re.findall(LEGACY_EMAIL, text)))
+    phones = list(dict.fromkeys(re.findall(LEGACY_PHONE, text)))
+    return emails, phones
+
+
+def first_contact(text: str) -> tuple:
+    """Find the first email and phone with the current methods."""
+    extractor = ResumeExtractor(text)
+    return extractor.extract_email(), extractor.extract_phone()
+
+
+def legacy_name(extractor: ResumeExtractor) -> str:
+    """Run NER over the whole text, as extract_name() did before header windows."""
+    return extractor._first_person(extractor.nlp(extractor.text))
+
+
+def long_resumes(pages: int) -> list:
+    """Repeat each sample resume to roughly the given number of pages."""
+    return ["\n".join([text] * pages) for text in load_sample_texts()]
+
+
+def best_of(func, texts: list, rounds: int) -> float:
+    """Return the best total time over several rounds, in milliseconds per text."""
+    best = float("inf")
+    for _ in range(rounds):
+        with Timer() as timer:
+            for text in texts:
+                func(text)
+        best = min(best, timer.elapsed)
+    return best / len(texts) * 1000
+
+
+def run(page_counts: list, rounds: int, include_ner: bool):
+    """
+    Compare legacy contact and name extraction with the current methods.
+
+    First-match lookups stop early, so they are compared separately from
+    extract_contact(), which must scan the whole text to return every match.
+
+    Args:
+        page_counts (list): Resume lengths to test, in sample-resume pages.
+        rounds (int): Timing rounds per measurement; the best is reported.
+        include_ner (bool): Also compare name extraction (needs the spaCy model).
+    """
+    print(f"{'pages':>6} {'chars':>9} {'legacy first ms':>16} {'first ms':>9} {'legacy all ms':>14} {'contact ms':>11}"
+          + (f" {'full NER ms':>12} {'header NER ms':>14}" if include_ner else ""))
+    for pages in page_counts:
+        texts = long_resumes(pages)
+        for text in texts:
+            contact = ResumeExtractor(text).extract_contact()
+            assert first_contact(text) == legacy_contact(text), "first email/phone differ"
+            assert (contact["emails"], contact["phones"]) == legacy_contact_all(text), "emails/phones differ"
+
+        line = (
+            f"{pages:>6} {sum(map(len, texts)) // len(texts):>9} "
+            f"{best_of(legacy_contact, texts, rounds):>16.3f} "
+            f"{best_of(first_contact, texts, rounds):>9.3f} "
+            f"{best_of(legacy_contact_all, texts, rounds):>14.3f} "
+            f"{best_of(lambda text: ResumeExtractor(text).extract_contact(), texts, rounds):>11.3f}"
+        )
+        if include_ner:
+            for text in texts:
+                assert ResumeExtractor(text).extract_name() == legacy_name(ResumeExtractor(text)), "names differ"
+            line += (
+                f" {best_of(lambda text: legacy_name(ResumeExtractor(text)), texts, 1):>12.1f}"
+                f" {best_of(lambda text: ResumeExtractor(text).extract_name(), texts, 1):>14.1f}"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark contact and name extraction on long resumes.")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--skip-ner", action="store_true", help="Skip name extraction, which needs the spaCy model.")
+    args = parser.parse_args()
+    run(args.pages, args.rounds, not args.skip_ner)
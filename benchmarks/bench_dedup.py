@@ -0,0 +1,84 @@
+import argparse
+import random
+
+from app.dedup import LSHIndex, MinHasher, similarity
+from app.extractor import ResumeExtractor
+from benchmarks.common import Timer
+from benchmarks.synthetic import synthetic_resumes
+from data import load_skill_keywords
+
+
+def lightly_edited(text: str, rng: random.Random, edits: int) -> str:
+    """Replace a few words and append a line, as a candidate updating a resume between applications."""
+    words = text.split()
+    for _ in range(edits):
+        words[rng.randrange(len(words))] = rng.choice(("led", "built", "managed", "designed", "improved"))
+    return " ".join(words) + "\nAvailable immediately."
+
+
+def run(originals: int, resubmission_rate: float, edits: int, threshold: float, seed: int):
+    """
+    Measure duplicate detection quality and cost on a corpus with planted resubmissions.
+
+    Args:
+        originals (int): Distinct synthetic resumes.
+        resubmission_rate (float): Expected lightly edited copies per original.
+        edits (int): Words replaced in each copy.
+        threshold (float): LSH similarity threshold.
+        seed (int): Random seed.
+    """
+    rng = random.Random(seed)
+    texts = [resume["text"] for resume in synthetic_resumes(originals, seed=seed)]
+    corpus = [(index, text) for index, text in enumerate(texts)]
+    for index, text in enumerate(texts):
+        copies = int(resubmission_rate) + (rng.random() < resubmission_rate % 1)
+        corpus.extend((index, lightly_edited(text, rng, edits)) for _ in range(copies))
+    rng.shuffle(corpus)
+    skill_keywords = load_skill_keywords()
+
+    hasher = MinHasher()
+    index = LSHIndex(num_perm=hasher.num_perm, threshold=threshold)
+    found = correct = 0
+    with Timer() as dedup:
+        for position, (source, text) in enumerate(corpus):
+            signature = hasher.signature(text)
+            match = index.find_duplicate(signature)
+            if match is None:
+                index.add(position, signature)
+            else:
+                found += 1
+                correct += corpus[match[0]][0] == source
+
+    planted = len(corpus) - len(texts)
+    # Extraction without NER, which would only widen the gap
+    with Timer() as extraction:
+        for _, text in corpus[:1000]:
+            extractor = ResumeExtractor(text)
+            extractor.extract_contact()
+            extractor.extract_skills(skill_keywords)
+    extract_ms = extraction.elapsed / min(len(corpus), 1000) * 1000
+
+    print(f"{len(corpus)} resumes ({len(texts)} originals, {planted} edited copies), threshold {threshold}")
+    print(f"duplicates found     {found} ({found / len(corpus):.1%} dedup ratio)")
+    print(f"recall / precision   {correct / planted if planted else 1:.3f} / {correct / found if found else 1:.3f}")
+    print(f"signature + lookup   {dedup.elapsed / len(corpus) * 1000:8.3f} ms/resume")
+    print(f"extraction (no NER)  {extract_ms:8.3f} ms/resume, {extract_ms * found / 1000:.2f} s saved")
+
+    # Pairwise comparison of every signature, which LSH avoids
+    signatures = [hasher.signature(text) for _, text in corpus[:500]]
+    with Timer() as brute:
+        for position, signature in enumerate(signatures):
+            for other in signatures[:position]:
+                similarity(signature, other)
+    print(f"pairwise lookup      {brute.elapsed / len(signatures) * 1000:8.3f} ms/resume at {len(signatures)} resumes")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark MinHash/LSH near-duplicate detection.")
+    parser.add_argument("--originals", type=int, default=5000)
+    parser.add_argument("--resubmission-rate", type=float, default=0.5)
+    parser.add_argument("--edits", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.originals, args.resubmission_rate, args.edits, args.threshold, args.seed)
@@ -0,0 +1,53 @@
+import argparse
+import os
+
+from app.extractor import ResumeExtractor
+from benchmarks.common import Timer, load_sample_texts
+from data import load_skill_keywords
+from models import get_registry, get_spacy_model
+
+
+def run(n_docs: int, process_counts: list, batch_size: int):
+    """
+    Compare per-document extraction with nlp.pipe batches at several process counts.
+
+    Args:
+        n_docs (int): Number of documents, cycled from the sample resumes.
+        process_counts (list): Values of n_process to benchmark.
+        batch_size (int): Batch size passed to nlp.pipe.
+    """
+    samples = load_sample_texts()
+    texts = [samples[i % len(samples)] for i in range(n_docs)]
+    skills = load_skill_keywords()
+
+    with Timer() as load:
+        get_spacy_model(components=ResumeExtractor.NAME_COMPONENTS)
+    print(f"Model load: {load.elapsed:.2f}s {get_registry().stats()}")
+
+    with Timer() as sequential:
+        for text in texts:
+            extractor = ResumeExtractor(text)
+            extractor.extract_name()
+            extractor.extract_email()
+            extractor.extract_phone()
+            extractor.extract_skills(skills)
+    print(f"{'sequential':>12}: {n_docs / sequential.elapsed:8.1f} docs/sec")
+
+    for n_process in process_counts:
+        with Timer() as batched:
+            records = ResumeExtractor.extract_batch(texts, skills, n_process=n_process, batch_size=batch_size)
+            count = sum(1 for _ in records)
+        print(f"{f'n_process={n_process}':>12}: {count / batched.elapsed:8.1f} docs/sec")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ResumeExtractor.extract_batch throughput.")
+    parser.add_argument("--docs", type=int, default=500, help="Number of documents to process.")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument(
+        "--processes", type=int, nargs="+",
+        default=sorted({1, 2, max(os.cpu_count() or 1, 1)}),
+        help="n_process values to benchmark.",
+    )
+    args = parser.parse_args()
+    run(args.docs, args.processes, args.batch_size)
@@ -0,0 +1,84 @@
+import argparse
+import subprocess
+import sys
+
+# Libraries that only text extraction and NER need
+HEAVY_MODULES = ("spacy", "thinc", "textract", "pdfminer", "docx")
+
+# Module -> (cumulative import budget in ms, whether it may pull in HEAVY_MODULES)
+BUDGETS = {
+    "app": (10, False),
+    "app.job_profile": (60, False),
+    "app.scorer": (60, False),
+    "app.matcher": (60, False),
+    "app.recommender": (60, False),
+    "app.extractor": (100, False),
+    "app.pipeline": (120, False),
+    "gui.main_window": (250, False),
+}
+
+
+def import_time(module: str) -> tuple:
+    """
+    Import a module in a fresh interpreter under -X importtime.
+
+    Args:
+        module (str): Dotted module name.
+
+    Returns:
+        tuple: Cumulative import time of the module in ms, and the heavy modules it loaded.
+    """
+    code = f"import sys, {module}; print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    microseconds = 0
+    for line in completed.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"; top-level entries are not indented
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2] == f" {module}":
+            microseconds = int(parts[1])
+    return microseconds / 1000, completed.stdout.split()
+
+
+def run(repeat: int, scale: float) -> list:
+    """
+    Check every module in BUDGETS against its import-time budget.
+
+    Each module is imported `repeat` times and the fastest run counts, so a
+    cold filesystem cache does not fail the check.
+
+    Args:
+        repeat (int): Fresh interpreters per module.
+        scale (float): Multiplier applied to every budget, for slower machines.
+
+    Returns:
+        list: Human-readable descriptions of each failure.
+    """
+    failures = []
+    print(f"{'module':<20} {'import ms':>10} {'budget ms':>10}  heavy modules")
+    for module, (budget_ms, heavy_allowed) in BUDGETS.items():
+        timings = [import_time(module) for _ in range(repeat)]
+        best_ms = min(ms for ms, _ in timings)
+        heavy = timings[-1][1]
+        budget_ms *= scale
+        print(f"{module:<20} {best_ms:>10.1f} {budget_ms:>10.1f}  {', '.join(heavy) or '-'}")
+        if best_ms > budget_ms:
+            failures.append(f"{module}: {best_ms:.1f} ms exceeds the {budget_ms:.1f} ms budget")
+        if heavy and not heavy_allowed:
+            failures.append(f"{module}: imports {', '.join(heavy)} eagerly")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check cold import times against per-module budgets.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget, e.g. 2 on slow CI machines.")
+    args = parser.parse_args()
+
+    failures = run(args.repeat, args.scale)
+    for failure in failures:
+        print(f"FAILED {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+    print("All modules within their import budgets.")
@@ -0,0 +1,46 @@
+import argparse
+
+from app.extractor import ResumeExtractor
+from benchmarks.common import Timer
+from benchmarks.synthetic import synthetic_resumes
+from utils import instrumentation
+
+
+def run(calls: int):
+    """
+    Measure the per-call cost of instrumented methods with instrumentation off and on.
+
+    Uses ResumeExtractor.extract_email on short texts, where the wrapper's
+    share of the total time is largest.
+
+    Args:
+        calls (int): Number of calls per measurement.
+    """
+    texts = [resume["text"][:200] for resume in synthetic_resumes(100, n_words=30)]
+    extractors = [ResumeExtractor(text) for text in texts]
+    undecorated = ResumeExtractor.extract_email.__wrapped__
+
+    def measure(method) -> float:
+        with Timer() as timer:
+            for index in range(calls):
+                method(extractors[index % len(extractors)])
+        return timer.elapsed / calls * 1e9
+
+    instrumentation.disable()
+    raw = measure(undecorated)
+    disabled = measure(ResumeExtractor.extract_email)
+    instrumentation.enable()
+    enabled = measure(ResumeExtractor.extract_email)
+    instrumentation.disable()
+    instrumentation.get_instrumentation().reset()
+
+    print(f"undecorated  {raw:8.0f} ns/call")
+    print(f"disabled     {disabled:8.0f} ns/call (+{disabled - raw:.0f} ns)")
+    print(f"enabled      {enabled:8.0f} ns/call (+{enabled - raw:.0f} ns)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure instrumentation overhead.")
+    parser.add_argument("--calls", type=int, default=200000)
+    args = parser.parse_args()
+    run(args.calls)
@@ -0,0 +1,52 @@
+import argparse
+
+from app.corpus_stats import CorpusStats
+from app.job_profile import JobProfile
+from app.matcher import ResumeMatcher
+from benchmarks.common import Timer
+from benchmarks.synthetic import synthetic_job_description, synthetic_role_resumes
+from data import load_job_keywords
+
+
+def run(n_resumes: int, top_k: int):
+    """
+    Compare exact, TF-IDF and BM25 keyword modes on latency and ranking precision.
+
+    Resumes are ranked on the keyword score alone (skill weight 0) so the modes
+    are compared directly. Precision@k is the share of the top-k resumes written
+    for the queried role, averaged over every role in data/job_keywords.json.
+
+    Args:
+        n_resumes (int): Size of the synthetic candidate pool.
+        top_k (int): Cut-off for precision.
+    """
+    resumes = synthetic_role_resumes(n_resumes)
+    with Timer() as fit:
+        stats = CorpusStats.fit(resume["text"] for resume in resumes)
+    print(f"Fit on {n_resumes} resumes: {fit.elapsed:.2f}s, {len(stats.vocabulary)} terms")
+
+    roles = list(load_job_keywords())
+    print(f"{'mode':<6} {'us/pair':>8} {f'precision@{top_k}':>13}")
+    for mode in ResumeMatcher.KEYWORD_MODES:
+        precision = 0.0
+        with Timer() as scoring:
+            for seed, role in enumerate(roles):
+                profile = JobProfile(synthetic_job_description(role, seed=seed))
+                scores = [
+                    ResumeMatcher(resume, profile, corpus_stats=stats).calculate_total_match_score(
+                        skill_weight=0.0, keyword_weight=1.0, keyword_mode=mode
+                    )
+                    for resume in resumes
+                ]
+                ranked = sorted(range(len(resumes)), key=lambda index: -scores[index])[:top_k]
+                precision += sum(resumes[index]["role"] == role for index in ranked) / top_k
+        pairs = len(roles) * len(resumes)
+        print(f"{mode:<6} {scoring.elapsed * 1e6 / pairs:>8.1f} {precision / len(roles):>13.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ResumeMatcher keyword modes.")
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--top-k", type=int, default=20)
+    args = parser.parse_args()
+    run(args.resumes, args.top_k)
@@ -0,0 +1,57 @@
+import argparse
+import multiprocessing
+import time
+
+from app.parser import ResumeParser
+from benchmarks.common import SAMPLE_DIR
+from utils.memory import peak_rss_bytes
+
+
+def _measure(file_path: str, backend: str, max_pages, results):
+    """Parse one file in a fresh process and report latency and peak RSS."""
+    try:
+        parser = ResumeParser(file_path, use_cache=False, backend=backend, max_pages=max_pages)
+        start = time.perf_counter()
+        text = parser.extract_text()
+        elapsed = time.perf_counter() - start
+    except Exception as e:
+        results.put({"error": str(e)})
+        return
+
+    # textract does its work in child processes, so count their peak too
+    peak = peak_rss_bytes(include_children=True)
+    results.put({"seconds": elapsed, "peak_rss_bytes": peak, "chars": len(text)})
+
+
+def run(backends: list, max_pages):
+    """
+    Compare per-file latency and peak RSS of each parser backend on the sample resumes.
+
+    Args:
+        backends (list): Backend names to benchmark.
+        max_pages (int, optional): Page limit passed to the parser.
+    """
+    files = [path for path in sorted(SAMPLE_DIR.iterdir()) if path.suffix.lower() in ResumeParser.SUPPORTED_FORMATS]
+    print(f"{'file':<22} {'backend':<9} {'latency ms':>10} {'peak RSS MB':>12} {'chars':>7}")
+    for path in files:
+        for backend in backends:
+            results = multiprocessing.Queue()
+            process = multiprocessing.Process(target=_measure, args=(str(path), backend, max_pages, results))
+            process.start()
+            result = results.get()
+            process.join()
+            if "error" in result:
+                print(f"{path.name:<22} {backend:<9} error: {result['error']}")
+                continue
+            print(
+                f"{path.name:<22} {backend:<9} {result['seconds'] * 1000:>10.1f} "
+                f"{result['peak_rss_bytes'] / 2 ** 20:>12.1f} {result['chars']:>7}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ResumeParser backends.")
+    parser.add_argument("--backends", nargs="+", default=["native", "textract"])
+    parser.add_argument("--max-pages", type=int, default=None)
+    args = parser.parse_args()
+    run(args.backends, args.max_pages)
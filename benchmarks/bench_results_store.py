@@ -0,0 +1,104 @@
+import argparse
+import json
+import random
+import tempfile
+
+from benchmarks.common import Timer
+from benchmarks.synthetic import synthetic_resumes
+from data import load_job_keywords
+from utils.file_utils import FileUtils
+from utils.results_store import ResultRow, ResultsStore
+
+
+def synthetic_rows(count: int, seed: int = 0) -> list:
+    """Generate stored-analysis rows with plausible scores spread across the catalog's roles."""
+    rng = random.Random(seed)
+    jobs = list(load_job_keywords())
+    # Extracted fields repeat every few thousand rows; only the scores matter to the store
+    resumes = synthetic_resumes(min(count, 5000), seed=seed)
+    return [
+        ResultRow.from_analysis(f"resumes/{index}.pdf", rng.choice(jobs), {
+            "extracted_data": resumes[index % len(resumes)],
+            "skill_score": round(rng.random(), 2),
+            "structure_score": round(rng.choice((0.33, 0.67, 1.0)), 2),
+            "total_score": round(rng.random(), 2),
+            "match_score": round(rng.random(), 2),
+            "recommendations": {"missing_sections": [], "skills_to_add": rng.sample(jobs, 2), "formatting_tips": []},
+        }, analyzed_at=1.7e9 + index)
+        for index in range(count)
+    ]
+
+
+def run(count: int, batch_size: int, legacy_count: int):
+    """
+    Measure results store writes and filtered reads against full scans.
+
+    Args:
+        count (int): Rows written.
+        batch_size (int): Rows per batched write.
+        legacy_count (int): Analyses written with FileUtils.save_results_to_file for comparison.
+    """
+    rows = synthetic_rows(count)
+    job = rows[0].job
+    print(f"{count} rows, batches of {batch_size}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        with Timer() as legacy:
+            for index, row in enumerate(rows[:legacy_count]):
+                FileUtils.save_results_to_file(row.to_analysis(), f"{directory}/{index}.txt")
+        print(f"{'text dumps':<28} {legacy_count / legacy.elapsed:>12,.0f} rows/sec")
+
+        single = ResultsStore(f"{directory}/single")
+        with Timer() as unbatched:
+            for row in rows[:legacy_count]:
+                single.append([row])
+        print(f"{'store, one row per write':<28} {legacy_count / unbatched.elapsed:>12,.0f} rows/sec")
+
+        store = ResultsStore(f"{directory}/store")
+        with Timer() as batched:
+            with store.writer(batch_size=batch_size) as writer:
+                for row in rows:
+                    writer.add(row)
+        print(f"{'store, batched':<28} {count / batched.elapsed:>12,.0f} rows/sec")
+        # A reader process does not hold every row; keeping them alive would slow garbage collection
+        del rows
+
+        # Reopening checks the files for torn writes
+        with Timer() as reopen:
+            store = ResultsStore(f"{directory}/store")
+        print(f"{'reopen':<28} {reopen.elapsed * 1000:>12.1f} ms")
+
+        filters = {"job": job, "min_scores": {"total_score": 0.7}}
+        with Timer() as indexed:
+            found = list(store.query(**filters))
+        print(f"{'filtered read (index)':<28} {indexed.elapsed * 1000:>12.1f} ms, {len(found)} rows")
+
+        with Timer() as scan:
+            scanned = []
+            with open(store.data_path, "r", encoding="utf-8") as file:
+                for line in file:
+                    data = json.loads(line)
+                    if data["job"] == job and data["total_score"] >= 0.7:
+                        scanned.append(ResultRow(**data))
+        print(f"{'filtered read (full scan)':<28} {scan.elapsed * 1000:>12.1f} ms ({scan.elapsed / indexed.elapsed:.1f}x)")
+        assert found == scanned, "indexed read differs from a full scan"
+
+        with Timer() as top:
+            best = list(store.query(job=job, order_by="match_score", limit=10))
+        print(f"{'top 10 by match (index)':<28} {top.elapsed * 1000:>12.1f} ms")
+        expected = sorted((row for row in store.query(job=job)), key=lambda row: -row.match_score)[:10]
+        assert best == expected, "top rows differ from sorting every row"
+
+        with Timer() as analytics:
+            scores = store.scores(job)
+        print(f"{'score columns for job':<28} {analytics.elapsed * 1000:>12.1f} ms, "
+              f"mean total {scores['total_score'].mean():.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the results store at scale.")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--legacy-rows", type=int, default=2000)
+    args = parser.parse_args()
+    run(args.rows, args.batch_size, args.legacy_rows)
@@ -0,0 +1,67 @@
+import argparse
+
+from app.extractor import ResumeExtractor
+from app.job_profile import JobProfile
+from app.matcher import ResumeMatcher
+from app.sections import SKILL_SECTIONS, segment
+from benchmarks.common import Timer, load_sample_texts
+from benchmarks.synthetic import synthetic_job_description, synthetic_skill_vocabulary
+
+# Sections keyword matching is restricted to in the comparison
+MATCH_SECTIONS = ("summary", "skills", "experience", "projects")
+
+
+def long_resume(text: str, pages: int) -> str:
+    """Pad a sample resume with repeated education and activity sections, as long academic CVs are."""
+    padding = segment(text).text_of(("education", "activities")) or text
+    extra = "".join(f"\nEDUCATION\n{padding}\nACTIVITIES\n{padding}" for _ in range(pages))
+    return text + extra
+
+
+def run(pages: int, vocabulary_size: int, rounds: int):
+    """
+    Compare whole-text and section-restricted skill extraction and keyword matching.
+
+    Args:
+        pages (int): Padding sections appended to each sample resume.
+        vocabulary_size (int): Number of skills searched for.
+        rounds (int): Repetitions per measurement.
+    """
+    texts = [long_resume(text, pages) for text in load_sample_texts()]
+    vocabulary = synthetic_skill_vocabulary(vocabulary_size)
+    job_profile = JobProfile(synthetic_job_description())
+    print(f"{len(texts)} resumes, mean {sum(map(len, texts)) // len(texts)} chars, {vocabulary_size} skills")
+
+    with Timer() as segmenting:
+        for _ in range(rounds):
+            for text in texts:
+                segment(text)
+
+    with Timer() as whole:
+        for _ in range(rounds):
+            for text in texts:
+                ResumeExtractor(text).extract_skills(vocabulary)
+                ResumeMatcher({"text": text}, job_profile).calculate_keyword_match_score()
+
+    with Timer() as restricted:
+        for _ in range(rounds):
+            for text in texts:
+                extractor = ResumeExtractor(text)
+                extractor.extract_skills(vocabulary, sections=SKILL_SECTIONS)
+                data = {"text": text, "sections": extractor.extract_sections()}
+                ResumeMatcher(data, job_profile, sections=MATCH_SECTIONS).calculate_keyword_match_score()
+
+    per_resume = 1000 / (rounds * len(texts))
+    print(f"segmentation         {segmenting.elapsed * per_resume:8.3f} ms/resume")
+    print(f"whole text           {whole.elapsed * per_resume:8.3f} ms/resume")
+    print(f"sections (incl. seg) {restricted.elapsed * per_resume:8.3f} ms/resume "
+          f"({whole.elapsed / restricted.elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark section-restricted extraction and matching.")
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--vocabulary-size", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    run(args.pages, args.vocabulary_size, args.rounds)
@@ -0,0 +1,81 @@
+import argparse
+import random
+import re
+import string
+
+from app.skill_matcher import SkillMatcher
+from benchmarks.common import Timer
+from data import load_skill_keywords
+
+
+def synthetic_vocabulary(size: int, seed: int = 0) -> list:
+    """
+    Build a skill vocabulary of the given size from the real taxonomy plus random terms.
+
+    Args:
+        size (int): Number of skills.
+        seed (int): Random seed.
+
+    Returns:
+        list: Skill keywords.
+    """
+    rng = random.Random(seed)
+    vocabulary = load_skill_keywords()[:size]
+    while len(vocabulary) < size:
+        words = rng.randint(1, 3)
+        vocabulary.append(" ".join(
+            "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+            for _ in range(words)
+        ))
+    return vocabulary
+
+
+def synthetic_resume(vocabulary: list, n_words: int = 1500, seed: int = 0) -> str:
+    """Build a resume-sized text sprinkled with skills from the vocabulary."""
+    rng = random.Random(seed)
+    filler = ["experience", "team", "developed", "managed", "project", "using", "with", "and", "the", "of"]
+    words = []
+    for _ in range(n_words):
+        words.append(rng.choice(vocabulary) if rng.random() < 0.05 else rng.choice(filler))
+    return " ".join(words)
+
+
+def regex_loop(text: str, vocabulary: list) -> list:
+    """The per-keyword regex loop ResumeExtractor.extract_skills used to run."""
+    return [skill for skill in vocabulary if re.search(rf"\b{re.escape(skill)}\b", text, re.IGNORECASE)]
+
+
+def run(sizes: list, repeats: int):
+    """
+    Compare the per-keyword regex loop with SkillMatcher as the vocabulary grows.
+
+    Args:
+        sizes (list): Vocabulary sizes to benchmark.
+        repeats (int): Number of scans per measurement.
+    """
+    print(f"{'vocabulary':>10} {'build ms':>9} {'regex ms/doc':>13} {'matcher ms/doc':>15} {'speedup':>8}")
+    for size in sizes:
+        vocabulary = synthetic_vocabulary(size)
+        text = synthetic_resume(vocabulary)
+
+        with Timer() as build:
+            matcher = SkillMatcher(vocabulary)
+        with Timer() as scan:
+            for _ in range(repeats):
+                found = matcher.match(text)
+        with Timer() as loop:
+            for _ in range(repeats):
+                expected = regex_loop(text, vocabulary)
+        assert found == expected, "SkillMatcher results differ from the regex loop"
+
+        regex_ms = loop.elapsed * 1000 / repeats
+        matcher_ms = scan.elapsed * 1000 / repeats
+        print(f"{size:>10} {build.elapsed * 1000:>9.1f} {regex_ms:>13.2f} {matcher_ms:>15.2f} {regex_ms / matcher_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark SkillMatcher against the per-keyword regex loop.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[73, 1000, 10000, 50000])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    run(args.sizes, args.repeats)
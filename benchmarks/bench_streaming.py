@@ -0,0 +1,153 @@
+import argparse
+import json
+import random
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterator
+
+from app.extractor import ResumeExtractor
+from app.job_profile import JobProfile
+from app.streaming import extract_chunks, iter_chunks
+from benchmarks.common import Timer
+from benchmarks.synthetic import FILLER_WORDS, synthetic_job_description, synthetic_skill_vocabulary
+from utils.memory import peak_rss_bytes
+
+MIB = 1 << 20
+
+
+def synthetic_pages(pages: int, words_per_page: int, seed: int = 0) -> Iterator[str]:
+    """
+    Generate the pages of a long portfolio resume one at a time.
+
+    Pages mix filler with skills, and some end with a contact line, so every
+    consumer has matches to find, including ones near page boundaries.
+
+    Args:
+        pages (int): Number of pages.
+        words_per_page (int): Words of body text per page.
+        seed (int): Random seed.
+
+    Yields:
+        str: Page text.
+    """
+    rng = random.Random(seed)
+    vocabulary = synthetic_skill_vocabulary(500, seed=seed)
+    yield "Jordan Example\njordan.example@example.com | (555) 010-2030\n"
+    for page in range(pages):
+        words = [rng.choice(vocabulary) if rng.random() < 0.03 else rng.choice(FILLER_WORDS)
+                 for _ in range(words_per_page)]
+        if page % 25 == 24:
+            words.append(f"reference{page}@example.org (555) {page % 1000:03d}-{rng.randint(0, 9999):04d}")
+        yield " ".join(words)
+
+
+def blank_pipeline():
+    """Return a blank spaCy pipeline, so NER costs memory but needs no model download."""
+    import spacy
+
+    nlp = spacy.blank("en")
+    nlp.max_length = 1 << 30
+    return nlp
+
+
+def measure(mode: str, pages: int, words_per_page: int, seed: int) -> dict:
+    """
+    Extract a synthetic document in this process and report time and memory.
+
+    Args:
+        mode (str): "whole" joins the pages as ResumeParser.extract_text does;
+            "stream" feeds them to streaming.extract_chunks.
+        pages (int): Number of pages.
+        words_per_page (int): Words of body text per page.
+        seed (int): Random seed.
+
+    Returns:
+        dict: Extracted fields, seconds, baseline and peak RSS in bytes.
+    """
+    vocabulary = synthetic_skill_vocabulary(500, seed=seed)
+    job_profile = JobProfile(synthetic_job_description(seed=seed))
+    nlp = blank_pipeline()
+    # Warm up every code path so its imports and caches count towards the baseline
+    extract_chunks(["warm up"], vocabulary, job_profile, nlp=nlp)
+    ResumeExtractor("warm up", nlp=nlp).extract_name()
+    baseline = peak_rss_bytes()
+
+    with Timer() as timer:
+        if mode == "whole":
+            text = "\n".join(synthetic_pages(pages, words_per_page, seed))
+            extractor = ResumeExtractor(text, nlp=nlp)
+            contact = extractor.extract_contact()
+            fields = {
+                "name": extractor.extract_name(),
+                "email": contact["email"],
+                "phone": contact["phone"],
+                "skills": extractor.extract_skills(vocabulary),
+                "keyword_score": job_profile.keyword_match_score(text),
+            }
+        else:
+            fields = extract_chunks(iter_chunks(synthetic_pages(pages, words_per_page, seed)),
+                                    vocabulary, job_profile, nlp=nlp)
+    return {"fields": fields, "seconds": timer.elapsed, "baseline": baseline, "peak": peak_rss_bytes()}
+
+
+def run_isolated(mode: str, pages: int, words_per_page: int, seed: int) -> dict:
+    """Run measure() in a fresh interpreter, so each mode's peak RSS is its own."""
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_streaming", "--child", mode,
+         "--pages", str(pages), "--words-per-page", str(words_per_page), "--seed", str(seed)],
+        capture_output=True, text=True, check=True, cwd=Path(__file__).resolve().parents[1],
+    )
+    return json.loads(completed.stdout)
+
+
+def run(pages: int, words_per_page: int, ceiling_mib: float, seed: int) -> list:
+    """
+    Compare peak memory of whole-text and streaming extraction on one large document.
+
+    Args:
+        pages (int): Number of pages.
+        words_per_page (int): Words of body text per page.
+        ceiling_mib (float): Largest peak RSS growth allowed for the streaming path, in MiB.
+        seed (int): Random seed.
+
+    Returns:
+        list: Human-readable descriptions of each failure.
+    """
+    whole = run_isolated("whole", pages, words_per_page, seed)
+    stream = run_isolated("stream", pages, words_per_page, seed)
+
+    print(f"{pages} pages of {words_per_page} words, ~{words_per_page * 7 * pages / MIB:.1f} MiB of text")
+    print(f"{'mode':<8} {'seconds':>8} {'RSS growth MiB':>15}")
+    for mode, result in (("whole", whole), ("stream", stream)):
+        growth = (result["peak"] - result["baseline"]) / MIB
+        print(f"{mode:<8} {result['seconds']:>8.2f} {growth:>15.1f}")
+
+    failures = []
+    if stream["fields"] != whole["fields"]:
+        failures.append(f"streamed fields differ: {stream['fields']} != {whole['fields']}")
+    stream_growth = (stream["peak"] - stream["baseline"]) / MIB
+    if stream["peak"] and stream_growth > ceiling_mib:
+        failures.append(f"streaming peak RSS grew {stream_growth:.1f} MiB, above the {ceiling_mib:.1f} MiB ceiling")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check that streaming extraction keeps peak memory bounded.")
+    parser.add_argument("--pages", type=int, default=600)
+    parser.add_argument("--words-per-page", type=int, default=1000)
+    parser.add_argument("--ceiling-mib", type=float, default=32.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--child", choices=("whole", "stream"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child, args.pages, args.words_per_page, args.seed)))
+        sys.exit(0)
+
+    failures = run(args.pages, args.words_per_page, args.ceiling_mib, args.seed)
+    for failure in failures:
+        print(f"FAILED {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+    print("Streaming extraction within its memory ceiling.")
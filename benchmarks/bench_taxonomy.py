@@ -0,0 +1,65 @@
+import argparse
+import tempfile
+from pathlib import Path
+
+from app.job_profile import JobProfile
+from app.taxonomy import SkillTaxonomy
+from benchmarks.common import Timer
+from benchmarks.synthetic import synthetic_resumes
+from data import load_job_keywords, load_skill_synonyms
+
+
+def run(count: int, rounds: int):
+    """
+    Compare taxonomy startup from JSON and from the compiled file, and string vs bitset skill scoring.
+
+    Each resume is scored and given missing skills against every role, as when
+    suggesting the roles a candidate fits best.
+
+    Args:
+        count (int): Number of synthetic resumes scored.
+        rounds (int): Repetitions per measurement.
+    """
+    job_keywords = load_job_keywords()
+    with Timer() as from_json:
+        for _ in range(rounds):
+            taxonomy = SkillTaxonomy.build(load_job_keywords(), load_skill_synonyms())
+
+    with tempfile.TemporaryDirectory() as directory:
+        compiled_path = str(Path(directory) / "taxonomy.pickle")
+        taxonomy.save(compiled_path)
+        with Timer() as from_binary:
+            for _ in range(rounds):
+                SkillTaxonomy.load_compiled(compiled_path)
+
+    print(f"{len(taxonomy.skills)} skills, {len(taxonomy.ids)} surface forms, {len(taxonomy.roles)} roles")
+    print(f"build from JSON      {from_json.elapsed / rounds * 1000:8.3f} ms")
+    print(f"load compiled        {from_binary.elapsed / rounds * 1000:8.3f} ms "
+          f"({from_json.elapsed / from_binary.elapsed:.1f}x)")
+
+    skill_lists = [resume["skills"] for resume in synthetic_resumes(count)]
+    string_profiles = [JobProfile(", ".join(skills)) for skills in job_keywords.values()]
+    role_profiles = [JobProfile.for_role(role, taxonomy) for role in job_keywords]
+
+    def time_profiles(profiles: list, method: str, encode) -> float:
+        with Timer() as timer:
+            for _ in range(rounds):
+                for skills in skill_lists:
+                    skills = encode(skills)
+                    for profile in profiles:
+                        getattr(profile, method)(skills)
+        return timer.elapsed
+
+    per_resume = 1_000_000 / (rounds * count)
+    print(f"{'us/resume, all roles':<22} {'strings':>9} {'bitsets':>9}")
+    for method in ("skill_match_score", "missing_skills"):
+        strings = time_profiles(string_profiles, method, lambda skills: skills)
+        bitsets = time_profiles(role_profiles, method, taxonomy.bitset)
+        print(f"{method:<22} {strings * per_resume:9.3f} {bitsets * per_resume:9.3f} ({strings / bitsets:.1f}x)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark compiled taxonomy loading and bitset skill scoring.")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    run(args.count, args.rounds)
@@ -0,0 +1,37 @@
+import time
+from pathlib import Path
+from typing import List
+
+from app.parser import ResumeParser
+
+SAMPLE_DIR = Path("data/sample_resumes")
+
+
+def load_sample_texts(sample_dir: Path = SAMPLE_DIR) -> List[str]:
+    """
+    Parse every supported resume in the sample directory.
+
+    Args:
+        sample_dir (Path): Directory holding sample resumes.
+
+    Returns:
+        list: Extracted text of each sample resume, sorted by file name.
+    """
+    texts = []
+    for path in sorted(sample_dir.iterdir()):
+        if path.suffix.lower() in ResumeParser.SUPPORTED_FORMATS:
+            texts.append(ResumeParser(str(path)).extract_text())
+    return texts
+
+
+class Timer:
+    """Context manager measuring wall-clock time in seconds."""
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        self.elapsed = 0.0
+        return self
+
+    def __exit__(self, *exc_info):
+        self.elapsed = time.perf_counter() - self.start
+        return False
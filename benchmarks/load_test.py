@@ -0,0 +1,79 @@
+import argparse
+import json
+import statistics
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import Timer
+from benchmarks.synthetic import synthetic_job_description, synthetic_resumes
+
+
+def percentile(values: list, fraction: float) -> float:
+    """Return the nearest-rank percentile of a list of numbers."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def post(url: str, body: dict, timeout: float) -> tuple:
+    """POST a JSON body and return (status, latency seconds)."""
+    data = json.dumps(body).encode("utf-8")
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with Timer() as timer:
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                response.read()
+                status = response.status
+        except urllib.error.HTTPError as e:
+            status = e.code
+        except OSError:
+            status = 0
+    return status, timer.elapsed
+
+
+def run(base_url: str, endpoint: str, requests: int, concurrency: int, timeout: float):
+    """
+    Fire requests at a running scoring service and report latency percentiles and throughput.
+
+    Args:
+        base_url (str): Service root, e.g. http://127.0.0.1:8000.
+        endpoint (str): "extract", "score", "match" or "recommend".
+        requests (int): Total number of requests.
+        concurrency (int): Requests in flight at once.
+        timeout (float): Per-request timeout in seconds.
+    """
+    job_description = synthetic_job_description()
+    resumes = synthetic_resumes(min(requests, 1000), n_words=300)
+    bodies = [
+        {"text": resumes[i % len(resumes)]["text"], "job_description": job_description}
+        for i in range(requests)
+    ]
+    url = f"{base_url.rstrip('/')}/{endpoint}"
+
+    with Timer() as wall, ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda body: post(url, body, timeout), bodies))
+
+    statuses = {}
+    for status, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+    latencies = [latency for status, latency in results if status == 200]
+    print(f"endpoint      {url}")
+    print(f"requests      {requests} at concurrency {concurrency}")
+    print(f"statuses      {json.dumps(statuses, sort_keys=True)}")
+    if latencies:
+        print(f"p50 latency   {percentile(latencies, 0.50) * 1000:.1f} ms")
+        print(f"p99 latency   {percentile(latencies, 0.99) * 1000:.1f} ms")
+        print(f"mean latency  {statistics.mean(latencies) * 1000:.1f} ms")
+    print(f"throughput    {len(latencies) / wall.elapsed:.1f} requests/s (successful)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load-test the HTTP scoring service started with 'python main.py serve'.")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--endpoint", default="match", choices=["extract", "score", "match", "recommend"])
+    parser.add_argument("-n", "--requests", type=int, default=2000)
+    parser.add_argument("-c", "--concurrency", type=int, default=32)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+    run(args.url, args.endpoint, args.requests, args.concurrency, args.timeout)
@@ -0,0 +1,254 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+from app.extractor import ResumeExtractor
+from app.job_profile import JobProfile
+from app.matcher import ResumeMatcher
+from app.parser import ResumeParser
+from app.recommender import ResumeRecommender
+from app.scorer import ResumeScorer
+from benchmarks.common import SAMPLE_DIR
+from benchmarks.synthetic import synthetic_job_description, synthetic_resumes, synthetic_skill_vocabulary
+from data import load_skill_keywords
+
+DEFAULT_OUTPUT = "output/benchmarks/latest.json"
+
+# Relative change beyond which a benchmark counts as a regression
+DEFAULT_TOLERANCE = 0.20
+
+# Slowdowns smaller than this many milliseconds per item are timer noise, not regressions
+NOISE_FLOOR_MS = 0.005
+
+# Items replayed under tracemalloc, which is too slow for the timed pass
+MEMORY_SAMPLE = 500
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of an ascending list."""
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def measure(func: Callable, items: Sequence, repeat: int = 1) -> dict:
+    """
+    Time func over every item, then replay a sample under tracemalloc for peak memory.
+
+    A few items are run first so caches and lazily built state don't count as latency.
+
+    Args:
+        func (callable): Called once per item.
+        items (sequence): Inputs.
+        repeat (int): Passes over the items in the timed run (default: 1).
+
+    Returns:
+        dict: Item count, p50/p95/p99/mean latency in ms, items/sec and peak traced memory.
+    """
+    for item in items[:50]:
+        func(item)
+
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            item_start = time.perf_counter()
+            func(item)
+            latencies.append(time.perf_counter() - item_start)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    for item in items[:MEMORY_SAMPLE]:
+        func(item)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "items": len(latencies),
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "mean_ms": sum(latencies) / len(latencies) * 1000,
+        "items_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "peak_traced_bytes": peak,
+    }
+
+
+def scoring_benchmarks(prefix: str, resumes: list, job_profile: JobProfile, repeat: int) -> dict:
+    """Benchmark score, recommend and match over extracted resumes."""
+    return {
+        f"{prefix}/score": measure(lambda resume: ResumeScorer(resume, job_profile).calculate_total_score(), resumes, repeat),
+        f"{prefix}/recommend": measure(lambda resume: ResumeRecommender(resume, job_profile).get_recommendations(), resumes, repeat),
+        f"{prefix}/match": measure(lambda resume: ResumeMatcher(resume, job_profile).calculate_total_match_score(), resumes, repeat),
+    }
+
+
+def extraction_benchmarks(prefix: str, texts: list, skill_keywords: list, include_ner: bool, repeat: int) -> dict:
+    """Benchmark the regex, skill and (optionally) NER extraction steps over raw texts."""
+    def contact(text: str) -> tuple:
+        extractor = ResumeExtractor(text)
+        return extractor.extract_email(), extractor.extract_phone()
+
+    results = {
+        f"{prefix}/extract.contact": measure(contact, texts, repeat),
+        f"{prefix}/extract.skills": measure(lambda text: ResumeExtractor(text).extract_skills(skill_keywords), texts, repeat),
+    }
+    if include_ner:
+        # Load the model outside the timed run
+        ResumeExtractor("").nlp
+        results[f"{prefix}/extract.name"] = measure(lambda text: ResumeExtractor(text).extract_name(), texts, repeat)
+    return results
+
+
+def run_suite(synthetic_count: int = 10000, vocabulary_size: int = 2000, sample_repeat: int = 20,
+              include_ner: bool = True) -> dict:
+    """
+    Run every stage benchmark on the sample corpus and a synthetic corpus.
+
+    Args:
+        synthetic_count (int): Number of generated resumes (default: 10000).
+        vocabulary_size (int): Skills searched for in the synthetic corpus (default: 2000).
+        sample_repeat (int): Passes over the sample resumes, which are few (default: 20).
+        include_ner (bool): Benchmark spaCy name extraction; needs the model installed (default: True).
+
+    Returns:
+        dict: "environment", "config" and "results" keyed by "corpus/stage".
+    """
+    job_profile = JobProfile(synthetic_job_description())
+    skill_keywords = load_skill_keywords()
+    results = {}
+
+    sample_files = sorted(
+        str(path) for path in SAMPLE_DIR.iterdir() if path.suffix.lower() in ResumeParser.SUPPORTED_FORMATS
+    )
+    results["sample/parse"] = measure(lambda path: ResumeParser(path, use_cache=False).extract_text(), sample_files, sample_repeat)
+    sample_texts = [ResumeParser(path, use_cache=False).extract_text() for path in sample_files]
+    results.update(extraction_benchmarks("sample", sample_texts, skill_keywords, include_ner, sample_repeat))
+    sample_resumes = []
+    for text in sample_texts:
+        extractor = ResumeExtractor(text)
+        sample_resumes.append({
+            "name": None,
+            "email": extractor.extract_email(),
+            "phone": extractor.extract_phone(),
+            "skills": extractor.extract_skills(skill_keywords),
+            "text": text,
+        })
+    results.update(scoring_benchmarks("sample", sample_resumes, job_profile, sample_repeat))
+
+    resumes = synthetic_resumes(synthetic_count)
+    vocabulary = synthetic_skill_vocabulary(vocabulary_size)
+    texts = [resume["text"] for resume in resumes]
+    # NER over the whole synthetic corpus would dominate the run, so it sees a slice
+    results.update(extraction_benchmarks("synthetic", texts, vocabulary, False, 1))
+    if include_ner:
+        results["synthetic/extract.name"] = measure(lambda text: ResumeExtractor(text).extract_name(), texts[:1000])
+    results.update(scoring_benchmarks("synthetic", resumes, job_profile, 1))
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": {
+            "synthetic_count": synthetic_count,
+            "vocabulary_size": vocabulary_size,
+            "sample_repeat": sample_repeat,
+            "include_ner": include_ner,
+        },
+        "results": results,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE,
+            noise_floor_ms: float = NOISE_FLOOR_MS) -> list:
+    """
+    Find benchmarks that got slower than the baseline.
+
+    A benchmark regresses when its median latency rises, or its throughput
+    falls, by more than the tolerance and by more than the noise floor per item.
+    Benchmarks missing from either side are skipped.
+
+    Args:
+        results (dict): Output of run_suite().
+        baseline (dict): A previous output of run_suite().
+        tolerance (float): Allowed relative change (default: 0.20).
+        noise_floor_ms (float): Smallest per-item slowdown reported (default: 0.005).
+
+    Returns:
+        list: Human-readable descriptions of each regression.
+    """
+    regressions = []
+    for name, current in results["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        slower_ms = current["p50_ms"] - previous["p50_ms"]
+        if current["p50_ms"] > previous["p50_ms"] * (1 + tolerance) and slower_ms > noise_floor_ms:
+            regressions.append(f"{name}: p50 {previous['p50_ms']:.3f} -> {current['p50_ms']:.3f} ms")
+        per_item_ms = 1000 / current["items_per_second"] - 1000 / previous["items_per_second"]
+        if current["items_per_second"] < previous["items_per_second"] * (1 - tolerance) and per_item_ms > noise_floor_ms:
+            regressions.append(
+                f"{name}: throughput {previous['items_per_second']:.1f} -> {current['items_per_second']:.1f} items/s"
+            )
+    return regressions
+
+
+def print_table(results: dict, baseline: Optional[dict] = None):
+    """Print one line per benchmark, with the change in median latency when a baseline is given."""
+    print(f"{'benchmark':<28} {'items':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'items/s':>10} {'peak KiB':>9} {'p50 vs base':>12}")
+    for name, stats in results["results"].items():
+        change = ""
+        previous = (baseline or {}).get("results", {}).get(name)
+        if previous and previous["p50_ms"]:
+            change = f"{(stats['p50_ms'] / previous['p50_ms'] - 1) * 100:+.1f}%"
+        print(
+            f"{name:<28} {stats['items']:>7} {stats['p50_ms']:>9.3f} {stats['p95_ms']:>9.3f} {stats['p99_ms']:>9.3f} "
+            f"{stats['items_per_second']:>10.1f} {stats['peak_traced_bytes'] / 1024:>9.1f} {change:>12}"
+        )
+
+
+def main():
+    """Run the suite, write the results and compare them with a baseline."""
+    parser = argparse.ArgumentParser(description="Benchmark every pipeline stage and flag regressions.")
+    parser.add_argument("--synthetic-count", type=int, default=10000)
+    parser.add_argument("--vocabulary-size", type=int, default=2000)
+    parser.add_argument("--sample-repeat", type=int, default=20)
+    parser.add_argument("--skip-ner", action="store_true", help="Skip spaCy name extraction.")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="Where to write the JSON results.")
+    parser.add_argument("--baseline", help="Results JSON from an earlier run to compare against.")
+    parser.add_argument("--save-baseline", help="Also write the results here, to serve as a future baseline.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed relative slowdown.")
+    args = parser.parse_args()
+
+    results = run_suite(args.synthetic_count, args.vocabulary_size, args.sample_repeat, not args.skip_ner)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    print_table(results, baseline)
+    for path in filter(None, (args.output, args.save_baseline)):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    print(f"Results written to {args.output}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import random
+from typing import List
+
+from data import load_job_keywords, load_skill_keywords
+
+FILLER_WORDS = [
+    "experience", "team", "developed", "managed", "project", "using", "with", "and",
+    "the", "of", "delivered", "built", "led", "improved", "analysis", "systems",
+]
+
+
+SKILL_QUALIFIERS = [
+    "Advanced", "Applied", "Cloud", "Distributed", "Enterprise", "Embedded",
+    "Realtime", "Scalable", "Secure", "Statistical", "Streaming", "Visual",
+]
+
+
+def synthetic_skill_vocabulary(size: int, seed: int = 0) -> List[str]:
+    """
+    Build a skill vocabulary larger than data/job_keywords.json.
+
+    The real skills come first, followed by qualified variants such as
+    "Streaming Python" until the requested size is reached.
+
+    Args:
+        size (int): Number of skills.
+        seed (int): Random seed.
+
+    Returns:
+        list: Distinct skill names.
+    """
+    rng = random.Random(seed)
+    base = load_skill_keywords()
+    vocabulary = list(base[:size])
+    seen = set(vocabulary)
+    while len(vocabulary) < size:
+        skill = f"{rng.choice(SKILL_QUALIFIERS)} {rng.choice(base)} {rng.randint(1, 99)}"
+        if skill not in seen:
+            seen.add(skill)
+            vocabulary.append(skill)
+    return vocabulary
+
+
+def synthetic_job_description(role: str = "Data Scientist", seed: int = 0) -> str:
+    """
+    Build a job description mentioning the skills of a role in data/job_keywords.json.
+
+    Args:
+        role (str): Role name from data/job_keywords.json.
+        seed (int): Random seed.
+
+    Returns:
+        str: Job description text.
+    """
+    rng = random.Random(seed)
+    skills = load_job_keywords()[role]
+    picked = rng.sample(skills, k=min(8, len(skills)))
+    return (
+        f"We are looking for a {role} with skills in {', '.join(picked[:-1])} and {picked[-1]}. "
+        f"Experience with {rng.choice(skills)} is a plus."
+    )
+
+
+def synthetic_resumes(count: int, seed: int = 0, n_words: int = 400) -> List[dict]:
+    """
+    Generate extracted-resume dicts with text, skills and contact fields.
+
+    Args:
+        count (int): Number of resumes.
+        seed (int): Random seed.
+        n_words (int): Approximate number of words of body text per resume.
+
+    Returns:
+        list: Dicts shaped like ResumeExtractor output plus "text".
+    """
+    rng = random.Random(seed)
+    vocabulary = load_skill_keywords()
+    resumes = []
+    for index in range(count):
+        skills = rng.sample(vocabulary, k=rng.randint(0, 12))
+        # Some resumes list skills lowercased, as the job-description keywords are
+        skills = [skill.lower() if rng.random() < 0.5 else skill for skill in skills]
+        body = [rng.choice(skills) if skills and rng.random() < 0.08 else rng.choice(FILLER_WORDS) for _ in range(n_words)]
+        resumes.append({
+            "name": f"Candidate {index}" if rng.random() < 0.9 else None,
+            "email": f"candidate{index}@example.com" if rng.random() < 0.9 else None,
+            "phone": f"(555) {index % 1000:03d}-{rng.randint(0, 9999):04d}" if rng.random() < 0.7 else None,
+            "skills": skills,
+            "text": f"Candidate {index}\nSkills: {', '.join(skills)}\n" + " ".join(body),
+        })
+    return resumes
+
+
+def synthetic_role_resumes(count: int, seed: int = 0, n_words: int = 300) -> List[dict]:
+    """
+    Generate extracted-resume dicts labelled with the role they were written for.
+
+    Most skills come from the resume's role in data/job_keywords.json and the rest
+    from other roles, so rankings can be checked against the "role" label.
+
+    Args:
+        count (int): Number of resumes.
+        seed (int): Random seed.
+        n_words (int): Approximate number of words of body text per resume.
+
+    Returns:
+        list: Dicts shaped like ResumeExtractor output plus "text" and "role".
+    """
+    rng = random.Random(seed)
+    roles = load_job_keywords()
+    vocabulary = load_skill_keywords()
+    resumes = []
+    for index in range(count):
+        role = rng.choice(list(roles))
+        skills = rng.sample(roles[role], k=rng.randint(2, 5)) + rng.sample(vocabulary, k=rng.randint(2, 6))
+        body = [rng.choice(skills) if rng.random() < 0.06 else rng.choice(FILLER_WORDS) for _ in range(n_words)]
+        resumes.append({
+            "role": role,
+            "name": f"Candidate {index}",
+            "email": f"candidate{index}@example.com",
+            "phone": None,
+            "skills": skills,
+            "text": f"Candidate {index}\nSkills: {', '.join(skills)}\n" + " ".join(body),
+        })
+    return resumes
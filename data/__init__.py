@@ -7,9 +7,22 @@ def load_job_keywords(file_path="data/job_keywords.json"):
     with open(file_path, "r") as file:
         return json.load(file)
 
+def load_skill_keywords(file_path="data/job_keywords.json"):
+    """Load every distinct skill from the job keywords file, in first-seen order."""
+    skills = {}
+    for role_skills in load_job_keywords(file_path).values():
+        for skill in role_skills:
+            skills.setdefault(skill, None)
+    return list(skills)
+
+def load_skill_synonyms(file_path="data/skill_synonyms.json"):
+    """Load the mapping of canonical skill names to their alternative names."""
+    with open(file_path, "r") as file:
+        return json.load(file)
+
 def load_stopwords(file_path="data/stopwords.txt"):
     """Load stopwords from the stopwords.txt file."""
     with open(file_path, "r") as file:
         return set(file.read().splitlines())
 
-__all__ = ["load_job_keywords", "load_stopwords"]
\ No newline at end of file
+__all__ = ["load_job_keywords", "load_skill_keywords", "load_skill_synonyms", "load_stopwords"]
\ No newline at end of file
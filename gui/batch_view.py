@@ -0,0 +1,132 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class BatchResultsView:
+    """Window listing one row per analyzed resume, sortable by any column."""
+
+    COLUMNS = (
+        ("file", "File", 220),
+        ("name", "Name", 150),
+        ("total_score", "Total", 60),
+        ("match_score", "Match", 60),
+        ("skill_score", "Skill", 60),
+        ("structure_score", "Structure", 70),
+        ("status", "Status", 120),
+    )
+    NUMERIC_COLUMNS = ("total_score", "match_score", "skill_score", "structure_score")
+
+    def __init__(self, parent, title: str = "Batch Results"):
+        """
+        Create the results window.
+
+        Args:
+            parent (tk.Widget): Parent window.
+            title (str): Window title.
+        """
+        self.window = tk.Toplevel(parent)
+        self.window.title(title)
+        self.window.geometry("900x500")
+
+        self.tree = ttk.Treeview(self.window, columns=[column for column, _, _ in self.COLUMNS], show="headings")
+        for column, heading, width in self.COLUMNS:
+            self.tree.heading(column, text=heading, command=lambda column=column: self.sort_by(column))
+            self.tree.column(column, width=width, anchor="w" if column not in self.NUMERIC_COLUMNS else "e")
+
+        scrollbar = ttk.Scrollbar(self.window, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        self.rows = {}
+        self.sort_column = None
+        self.sort_descending = True
+        self._needs_sort = False
+
+    def add_pending(self, file_path: str):
+        """
+        Add a placeholder row for a resume that is still queued.
+
+        Args:
+            file_path (str): Path to the resume file.
+        """
+        self._set_row(file_path, {"file": file_path, "status": "Queued"})
+
+    def update_result(self, file_path: str, result: dict):
+        """
+        Fill in the row of a finished resume.
+
+        Args:
+            file_path (str): Path to the resume file.
+            result (dict): Output of app.pipeline.analyze_resume().
+        """
+        values = {
+            "file": file_path,
+            "name": result["extracted_data"].get("name") or "",
+            "status": "Done",
+            **{column: f"{result[column]:.2f}" for column in self.NUMERIC_COLUMNS},
+        }
+        self._set_row(file_path, values)
+
+    def update_status(self, file_path: str, status: str):
+        """
+        Show a status such as an error message in a resume's row.
+
+        Args:
+            file_path (str): Path to the resume file.
+            status (str): Status text.
+        """
+        self._set_row(file_path, {"file": file_path, "status": status})
+
+    def _set_row(self, file_path: str, values: dict):
+        """Update or insert a row and mark the table for re-sorting."""
+        item = self.rows.get(file_path)
+        if item is None:
+            self.rows[file_path] = self.tree.insert("", "end", values=self._row_values(values))
+        else:
+            self.tree.item(item, values=self._row_values(values))
+        self._needs_sort = self.sort_column is not None
+
+    def _row_values(self, values: dict) -> list:
+        """Order a row's values to match the table columns."""
+        return [values.get(column, "") for column, _, _ in self.COLUMNS]
+
+    def sort_by(self, column: str):
+        """
+        Sort the table by a column, toggling the direction on repeated clicks.
+
+        Args:
+            column (str): Column identifier.
+        """
+        if self.sort_column == column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column = column
+            self.sort_descending = column in self.NUMERIC_COLUMNS
+        self._needs_sort = True
+        self.apply_sort()
+
+    def apply_sort(self):
+        """Reorder rows by the active sort column if rows changed since the last sort."""
+        if not self._needs_sort or self.sort_column is None:
+            return
+        column = self.sort_column
+
+        def key(item):
+            value = self.tree.set(item, column)
+            if column in self.NUMERIC_COLUMNS:
+                # Rows without a score yet always sink to the bottom
+                return (value != "", float(value) if value else 0.0)
+            return (True, value.lower())
+
+        items = sorted(self.tree.get_children(""), key=key, reverse=self.sort_descending)
+        if not self.sort_descending and column in self.NUMERIC_COLUMNS:
+            items = [item for item in items if self.tree.set(item, column)] + \
+                    [item for item in items if not self.tree.set(item, column)]
+        for position, item in enumerate(items):
+            self.tree.move(item, "", position)
+        self._needs_sort = False
+
+    def exists(self) -> bool:
+        """Return True while the window is open."""
+        return bool(self.window.winfo_exists())
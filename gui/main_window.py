@@ -1,37 +1,96 @@
+import os
+import queue
+import threading
 import tkinter as tk
-from tkinter import filedialog, messagebox
-from app.parser import ResumeParser
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from tkinter import filedialog, messagebox, ttk
 from app.extractor import ResumeExtractor
-from app.scorer import ResumeScorer
-from app.recommender import ResumeRecommender
-from app.matcher import ResumeMatcher
+from app.incremental import IncrementalAnalyzer
+from app.job_profile import JobProfile
+from app.pipeline import AnalysisCancelled, ScoreWeights
+from app.taxonomy import get_skill_taxonomy
+from models import get_spacy_model
+from utils.results_store import ResultRow, ResultsStore, get_default_results_store
+from .batch_view import BatchResultsView
+
+STAGE_LABELS = {
+    "parse": "Parsing resume",
+    "extract": "Extracting details",
+    "score": "Scoring",
+    "recommend": "Building recommendations",
+}
 
 
 class ResumeAnalyzerApp:
     """Main application window for the Resume Analyzer."""
 
-    def __init__(self, root):
+    POLL_INTERVAL_MS = 50
+
+    # Cap the events applied per poll so hundreds of finished rows never stall the UI
+    MAX_EVENTS_PER_POLL = 50
+
+    BATCH_WORKERS = min(4, os.cpu_count() or 1)
+
+    # Batch results buffered before each write to the results store
+    STORE_BATCH_SIZE = 50
+
+    def __init__(self, root, use_cache: bool = True, results_store: Optional[ResultsStore] = None):
         """
         Initialize the main window.
 
         Args:
             root (tk.Tk): The root Tkinter window.
+            use_cache (bool): Reuse previously extracted text for identical resume files (default: True).
+            results_store (ResultsStore, optional): Where every analysis is saved
+                (default: the store in output/results).
         """
         self.root = root
+        self.use_cache = use_cache
+        self.results_store = results_store if results_store is not None else get_default_results_store()
+        self.results_writer = self.results_store.writer(batch_size=self.STORE_BATCH_SIZE)
+        # Keeps every stage's results, so re-analyzing with a new job description or weights
+        # reruns only the stages that depend on them
+        self.analyzer = IncrementalAnalyzer(use_cache=use_cache)
+        self.weights = ScoreWeights()
         self.root.title("AI-Powered Resume Analyzer")
-        self.root.geometry("800x600")
+        self.root.geometry("800x700")
 
         # File path and job description variables
         self.resume_path = None
+        self.resume_paths = []
         self.job_description = None
+        # The job and resumes of the last analysis, re-blended when the weights change
+        self.analyzed_job = None
+        self.analyzed_paths = []
+
+        # Analysis runs on background threads; results come back through a queue
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.batch_executor = ThreadPoolExecutor(max_workers=self.BATCH_WORKERS)
+        self.events = queue.Queue()
+        self.analysis_future = None
+        self.batch_futures = []
+        self.batch_paths = []
+        self.batch_view = None
+        self.batch_total = 0
+        self.batch_finished = 0
+        self.cancel_event = None
+        # Set by the warm-up; until then analyses fall back to the default skill list
+        self.taxonomy = None
 
         # Create UI components
         self.create_widgets()
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
+        # Load the NLP model in the background while the user picks a resume
+        self.status_label.config(text="Loading language model...")
+        self.executor.submit(self._warm_up)
+        self.root.after(self.POLL_INTERVAL_MS, self._poll_events)
 
     def create_widgets(self):
         """Create and arrange UI components."""
         # File upload button
-        self.upload_button = tk.Button(self.root, text="Upload Resume", command=self.upload_resume, width=20)
+        self.upload_button = tk.Button(self.root, text="Upload Resumes", command=self.upload_resume, width=20)
         self.upload_button.pack(pady=20)
 
         # Job description input
@@ -40,9 +99,37 @@ class ResumeAnalyzerApp:
         self.job_desc_text = tk.Text(self.root, height=10, width=60)
         self.job_desc_text.pack(pady=10)
 
-        # Analyze button
-        self.analyze_button = tk.Button(self.root, text="Analyze", command=self.analyze_resume, width=20)
-        self.analyze_button.pack(pady=20)
+        # Analyze and cancel buttons
+        self.button_frame = tk.Frame(self.root)
+        self.button_frame.pack(pady=10)
+        self.analyze_button = tk.Button(self.button_frame, text="Analyze", command=self.analyze_resume, width=20)
+        self.analyze_button.pack(side="left", padx=5)
+        self.cancel_button = tk.Button(self.button_frame, text="Cancel", command=self.cancel_analysis, width=20, state="disabled")
+        self.cancel_button.pack(side="left", padx=5)
+
+        # Score weights; moving a slider re-blends the last results without re-running the analysis
+        self.weights_frame = tk.Frame(self.root)
+        self.weights_frame.pack(pady=5)
+        self.total_weight_scale = tk.Scale(
+            self.weights_frame, label="Total: skills vs. structure", from_=0.0, to=1.0, resolution=0.05,
+            orient="horizontal", length=250,
+        )
+        self.total_weight_scale.set(self.weights.skill_weight)
+        self.total_weight_scale.pack(side="left", padx=10)
+        self.match_weight_scale = tk.Scale(
+            self.weights_frame, label="Match: skills vs. keywords", from_=0.0, to=1.0, resolution=0.05,
+            orient="horizontal", length=250,
+        )
+        self.match_weight_scale.set(self.weights.match_skill_weight)
+        self.match_weight_scale.pack(side="left", padx=10)
+        for scale in (self.total_weight_scale, self.match_weight_scale):
+            scale.bind("<ButtonRelease-1>", lambda event: self.apply_weights())
+
+        # Progress through the pipeline stages
+        self.progress_bar = ttk.Progressbar(self.root, length=400, mode="determinate")
+        self.progress_bar.pack(pady=5)
+        self.status_label = tk.Label(self.root, text="")
+        self.status_label.pack()
 
         # Results display
         self.results_label = tk.Label(self.root, text="Results:", font=("Arial", 14))
@@ -51,17 +138,29 @@ class ResumeAnalyzerApp:
         self.results_text.pack(pady=10)
 
     def upload_resume(self):
-        """Handle resume file upload."""
-        file_path = filedialog.askopenfilename(
-            title="Select Resume",
+        """Handle resume file upload; selecting several files analyzes them as a batch."""
+        file_paths = filedialog.askopenfilenames(
+            title="Select Resumes",
             filetypes=(("PDF Files", "*.pdf"), ("DOCX Files", "*.docx"))
         )
-        if file_path:
-            self.resume_path = file_path
-            messagebox.showinfo("Resume Uploaded", f"Resume uploaded: {file_path}")
+        if file_paths:
+            self.resume_paths = list(file_paths)
+            self.resume_path = self.resume_paths[0]
+            if len(self.resume_paths) == 1:
+                messagebox.showinfo("Resume Uploaded", f"Resume uploaded: {self.resume_path}")
+            else:
+                messagebox.showinfo("Resumes Uploaded", f"{len(self.resume_paths)} resumes uploaded.")
+
+    def is_busy(self) -> bool:
+        """Return True while a single or batch analysis is running."""
+        single_running = self.analysis_future is not None and not self.analysis_future.done()
+        return single_running or self.batch_finished < self.batch_total
 
     def analyze_resume(self):
-        """Analyze the uploaded resume and job description."""
+        """Start analyzing the uploaded resumes and job description in the background."""
+        if self.is_busy():
+            return
+
         if not self.resume_path:
             messagebox.showerror("Error", "Please upload a resume.")
             return
@@ -71,48 +170,219 @@ class ResumeAnalyzerApp:
             messagebox.showerror("Error", "Please enter a job description.")
             return
 
+        self.cancel_event = threading.Event()
+        self.analyze_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.progress_bar.config(value=0)
+        # Tokenize the job description once; the worker threads also share one loaded model.
+        # The warm-up may set self.taxonomy at any moment, so the workers extract with the
+        # profile's taxonomy rather than reading it again.
+        job_profile = self.analyzer.job_profile(self.job_description, self.taxonomy)
+        self.analyzed_job = job_profile
+        self.analyzed_paths = list(self.resume_paths)
+        if len(self.resume_paths) > 1:
+            self._start_batch(self.resume_paths, job_profile)
+        else:
+            self.analysis_future = self.executor.submit(
+                self._run_analysis, self.resume_path, job_profile, self.cancel_event
+            )
+
+    def apply_weights(self):
+        """Read the weight sliders and re-blend the last analysis' scores with them."""
+        total_skill = self.total_weight_scale.get()
+        match_skill = self.match_weight_scale.get()
+        # Rounded so the default positions give exactly the default weights
+        self.weights = ScoreWeights(total_skill, round(1 - total_skill, 2), match_skill, round(1 - match_skill, 2))
+        if self.analyzed_job is None or self.is_busy():
+            return
+
+        # Only the final blend runs: sub-scores and recommendations come from the analyzer
+        results = self.analyzer.rescore(self.analyzed_job, self.weights)
+        if len(self.analyzed_paths) == 1:
+            if self.analyzed_paths[0] in results:
+                self._show_results(results[self.analyzed_paths[0]])
+        elif self.batch_view is not None and self.batch_view.exists():
+            for path in self.analyzed_paths:
+                if path in results:
+                    self.batch_view.update_result(path, results[path])
+            self.batch_view.apply_sort()
+        self.status_label.config(text="Scores updated for the new weights.")
+
+    def _start_batch(self, resume_paths: list, job_profile: JobProfile):
+        """Analyze many resumes on the worker pool, streaming rows into the batch view."""
+
+        if self.batch_view is None or not self.batch_view.exists():
+            self.batch_view = BatchResultsView(self.root)
+        for path in resume_paths:
+            self.batch_view.add_pending(path)
+
+        self.batch_paths = list(resume_paths)
+        self.batch_total = len(resume_paths)
+        self.batch_finished = 0
+        self.progress_bar.config(maximum=self.batch_total, value=0)
+        self.status_label.config(text=f"Analyzing 0/{self.batch_total} resumes...")
+        job_name = self.job_name(job_profile.text)
+        self.batch_futures = [
+            self.batch_executor.submit(self._run_batch_item, path, job_profile, job_name, self.cancel_event)
+            for path in resume_paths
+        ]
+
+    def _run_batch_item(self, resume_path: str, job_profile: JobProfile, job_name: str,
+                        cancel_event: threading.Event):
+        """Analyze one resume of a batch on a worker thread."""
         try:
-            # Parse and extract resume data
-            parser = ResumeParser(self.resume_path)
-            resume_text = parser.extract_text()
-            extractor = ResumeExtractor(resume_text)
-            extracted_data = {
-                "name": extractor.extract_name(),
-                "email": extractor.extract_email(),
-                "phone": extractor.extract_phone(),
-                "skills": extractor.extract_skills(skill_keywords=["Python", "Machine Learning", "Data Analysis", "NLP"])
-            }
-
-            # Score and recommend improvements
-            scorer = ResumeScorer(extracted_data, self.job_description)
-            recommender = ResumeRecommender(extracted_data, self.job_description)
-            matcher = ResumeMatcher(extracted_data, self.job_description)
-
-            skill_score = scorer.score_skills()
-            structure_score = scorer.score_structure()
-            total_score = scorer.calculate_total_score()
-            recommendations = recommender.get_recommendations()
-            match_score = matcher.calculate_total_match_score()
-
-            # Display results
-            self.results_text.config(state="normal")
-            self.results_text.delete("1.0", "end")
-            self.results_text.insert("end", f"Name: {extracted_data.get('name')}\n")
-            self.results_text.insert("end", f"Email: {extracted_data.get('email')}\n")
-            self.results_text.insert("end", f"Phone: {extracted_data.get('phone')}\n")
-            self.results_text.insert("end", f"Skills: {', '.join(extracted_data.get('skills', []))}\n")
-            self.results_text.insert("end", f"\nSkill Score: {skill_score:.2f}")
-            self.results_text.insert("end", f"\nStructure Score: {structure_score:.2f}")
-            self.results_text.insert("end", f"\nTotal Score: {total_score:.2f}")
-            self.results_text.insert("end", f"\nMatch Score: {match_score:.2f}")
-            self.results_text.insert("end", "\n\nRecommendations:\n")
-            self.results_text.insert("end", f"Missing Sections: {', '.join(recommendations['missing_sections'])}\n")
-            self.results_text.insert("end", f"Skills to Add: {', '.join(recommendations['skills_to_add'])}\n")
-            self.results_text.insert("end", f"Formatting Tips: {' '.join(recommendations['formatting_tips'])}\n")
-            self.results_text.config(state="disabled")
+            result = self.analyzer.analyze(resume_path, job_profile, taxonomy=job_profile.taxonomy, weights=self.weights,
+                                           cancel_event=cancel_event)
+            self.results_writer.add(ResultRow.from_analysis(resume_path, job_name, result))
+        except AnalysisCancelled:
+            self.events.put(("row_status", resume_path, "Cancelled"))
+        except Exception as e:
+            self.events.put(("row_status", resume_path, f"Error: {e}"))
+        else:
+            self.events.put(("row", resume_path, result))
+
+    def cancel_analysis(self):
+        """Ask the running analysis to stop before its next stage."""
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+            self.status_label.config(text="Cancelling...")
+        # Queued batch items that have not started can be dropped right away
+        for future, path in zip(self.batch_futures, self.batch_paths):
+            # cancel() is also True for a future cancelled by an earlier click, whose row is already counted
+            if not future.cancelled() and future.cancel():
+                self.events.put(("row_status", path, "Cancelled"))
+
+    def _run_analysis(self, resume_path: str, job_profile: JobProfile, cancel_event: threading.Event):
+        """Run the analysis pipeline on the worker thread, posting events for the Tk thread."""
+        def report(stage, index, total):
+            self.events.put(("progress", stage, index, total))
 
+        try:
+            result = self.analyzer.analyze(
+                resume_path,
+                job_profile,
+                taxonomy=job_profile.taxonomy,
+                weights=self.weights,
+                progress=report,
+                cancel_event=cancel_event,
+            )
+            self.results_store.add(resume_path, self.job_name(job_profile.text), result)
+        except AnalysisCancelled:
+            self.events.put(("cancelled",))
+        except Exception as e:
+            self.events.put(("error", e))
+        else:
+            self.events.put(("done", result))
+
+    def _warm_up(self):
+        """Load the NLP model and skill taxonomy on the worker thread so the first analysis starts quickly."""
+        try:
+            self.taxonomy = get_skill_taxonomy()
+            get_spacy_model(components=ResumeExtractor.NAME_COMPONENTS)
         except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {e}")
+            self.events.put(("warmup_failed", e))
+        else:
+            self.events.put(("ready",))
+
+    def _poll_events(self):
+        """Apply events posted by the worker threads; runs on the Tk thread via root.after."""
+        try:
+            for _ in range(self.MAX_EVENTS_PER_POLL):
+                event = self.events.get_nowait()
+                kind = event[0]
+                if kind in ("row", "row_status"):
+                    self._apply_batch_event(event)
+                elif kind == "progress":
+                    _, stage, index, total = event
+                    self.progress_bar.config(maximum=total, value=index)
+                    self.status_label.config(text=f"{STAGE_LABELS[stage]} ({index + 1}/{total})...")
+                elif kind == "done":
+                    self.progress_bar.config(value=self.progress_bar["maximum"])
+                    self.status_label.config(text="Analysis complete.")
+                    self._show_results(event[1])
+                    self._analysis_finished()
+                elif kind == "cancelled":
+                    self.status_label.config(text="Analysis cancelled.")
+                    self._analysis_finished()
+                elif kind == "error":
+                    self.status_label.config(text="Analysis failed.")
+                    self._analysis_finished()
+                    messagebox.showerror("Error", f"An error occurred: {event[1]}")
+                elif kind == "ready":
+                    self.status_label.config(text="Ready.")
+                elif kind == "warmup_failed":
+                    self.status_label.config(text=f"Language model failed to load: {event[1]}")
+        except queue.Empty:
+            pass
+        if self.batch_view is not None and self.batch_view.exists():
+            self.batch_view.apply_sort()
+        self.root.after(self.POLL_INTERVAL_MS, self._poll_events)
+
+    def _apply_batch_event(self, event: tuple):
+        """Update the batch view and progress for one finished resume."""
+        kind, path, payload = event
+        if self.batch_view is not None and self.batch_view.exists():
+            if kind == "row":
+                self.batch_view.update_result(path, payload)
+            else:
+                self.batch_view.update_status(path, payload)
+
+        self.batch_finished += 1
+        self.progress_bar.config(value=self.batch_finished)
+        if self.batch_finished < self.batch_total:
+            self.status_label.config(text=f"Analyzing {self.batch_finished}/{self.batch_total} resumes...")
+        else:
+            cancelled = self.cancel_event is not None and self.cancel_event.is_set()
+            self.status_label.config(text="Batch cancelled." if cancelled else "Batch analysis complete.")
+            self.batch_futures = []
+            self.executor.submit(self.results_writer.flush)
+            self._analysis_finished()
+
+    @staticmethod
+    def job_name(job_description: str) -> str:
+        """Name a job in the results store by the first line of its description, usually the title."""
+        first_line = next((line.strip() for line in job_description.splitlines() if line.strip()), "")
+        return first_line[:120]
+
+    def _analysis_finished(self):
+        """Re-enable the controls after an analysis ends."""
+        self.analyze_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+        self.cancel_event = None
+
+    def _show_results(self, result: dict):
+        """Display an analysis result in the results box."""
+        extracted_data = result["extracted_data"]
+        recommendations = result["recommendations"]
+
+        self.results_text.config(state="normal")
+        self.results_text.delete("1.0", "end")
+        self.results_text.insert("end", f"Name: {extracted_data.get('name')}\n")
+        self.results_text.insert("end", f"Email: {extracted_data.get('email')}\n")
+        self.results_text.insert("end", f"Phone: {extracted_data.get('phone')}\n")
+        self.results_text.insert("end", f"Skills: {', '.join(extracted_data.get('skills', []))}\n")
+        self.results_text.insert("end", f"\nSkill Score: {result['skill_score']:.2f}")
+        self.results_text.insert("end", f"\nStructure Score: {result['structure_score']:.2f}")
+        self.results_text.insert("end", f"\nTotal Score: {result['total_score']:.2f}")
+        self.results_text.insert("end", f"\nMatch Score: {result['match_score']:.2f}")
+        self.results_text.insert("end", "\n\nRecommendations:\n")
+        self.results_text.insert("end", f"Missing Sections: {', '.join(recommendations['missing_sections'])}\n")
+        self.results_text.insert("end", f"Skills to Add: {', '.join(recommendations['skills_to_add'])}\n")
+        self.results_text.insert("end", f"Formatting Tips: {' '.join(recommendations['formatting_tips'])}\n")
+        self.results_text.config(state="disabled")
+
+    def close(self):
+        """Cancel any running analysis and close the window."""
+        self.cancel_analysis()
+        # shutdown(cancel_futures=True) needs Python 3.9, so drop queued work here; the non-daemon
+        # workers then exit once their running item reaches its next cancel check
+        for future in [self.analysis_future, *self.batch_futures]:
+            if future is not None:
+                future.cancel()
+        self.executor.submit(self.results_writer.flush)
+        self.executor.shutdown(wait=False)
+        self.batch_executor.shutdown(wait=False)
+        self.root.destroy()
 
 
 # Main application loop
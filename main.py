@@ -1,13 +1,262 @@
-import tkinter as tk
-from gui.main_window import ResumeAnalyzerApp
+import argparse
+import json
+import sys
 
 
-def main():
-    """Main function to run the Resume Analyzer application."""
+def run_gui(args):
+    """Open the Tkinter Resume Analyzer window."""
+    import tkinter as tk
+    from gui.main_window import ResumeAnalyzerApp
+
     root = tk.Tk()
-    app = ResumeAnalyzerApp(root)
+    app = ResumeAnalyzerApp(root, use_cache=not args.no_cache)
     root.mainloop()
 
 
+def run_ingest(args):
+    """Parse a directory of resumes in bulk and write JSON Lines records."""
+    from app.ingest import IngestStats, ingest_directory
+    from data import load_skill_keywords
+
+    stats = IngestStats()
+    index = None
+    if args.index:
+        from app.index import ResumeIndex
+        index = ResumeIndex(args.index)
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        records = ingest_directory(
+            args.directory,
+            load_skill_keywords(args.skills_file),
+            workers=args.workers,
+            use_cache=not args.no_cache,
+            backend=args.backend,
+            include_text=args.include_text or index is not None,
+            stats=stats,
+            use_sections=args.sections,
+            dedup=args.dedup,
+            dedup_threshold=args.dedup_threshold,
+        )
+        for record in records:
+            if index is not None and "error" not in record:
+                index.add(record["file"], record)
+                if not args.include_text:
+                    record.pop("text")
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        if index is not None:
+            index.close()
+    print(json.dumps(stats.summary(), indent=2), file=sys.stderr)
+
+
+def run_search(args):
+    """Print the indexed resumes that best match a job description."""
+    from app.index import ResumeIndex
+
+    job_description = args.job_description
+    if job_description == "-":
+        job_description = sys.stdin.read()
+
+    index = ResumeIndex(args.index)
+    try:
+        for hit in index.search(job_description, top_k=args.top_k):
+            print(json.dumps(hit))
+    finally:
+        index.close()
+
+
+def run_corpus_stats(args):
+    """Fit TF-IDF/BM25 corpus statistics over ingested resume records."""
+    from app.corpus_stats import CorpusStats
+
+    def texts():
+        with open(args.records, "r", encoding="utf-8") as file:
+            for line in file:
+                record = json.loads(line)
+                if record.get("text"):
+                    yield record["text"]
+
+    stats = CorpusStats.fit(texts())
+    stats.save(args.output)
+    print(f"Fit {stats.n_documents} resumes, {len(stats.vocabulary)} terms -> {args.output}", file=sys.stderr)
+
+
+def run_match(args):
+    """Match every ingested resume against every role of a job catalog."""
+    from app.bulk_matching import BulkMatcher
+    from app.taxonomy import SkillTaxonomy
+    from data import load_job_keywords
+
+    with open(args.records, "r", encoding="utf-8") as file:
+        records = [record for record in map(json.loads, file) if "error" not in record]
+    # The compiled taxonomy is keyed by the catalog's contents, so another catalog is rebuilt, not mixed up
+    matcher = BulkMatcher.from_catalog(load_job_keywords(args.catalog), SkillTaxonomy.load(args.catalog))
+    try:
+        result = matcher.match(records, top_k=args.top_k, block_size=args.block_size, workers=args.workers)
+    except ValueError as e:
+        sys.exit(f"match: {e}")
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        if args.by_job:
+            for job, (indices, scores) in enumerate(zip(result["job_resumes"], result["job_scores"])):
+                resumes = [{"file": records[index].get("file"), "match_score": float(score)}
+                           for index, score in zip(indices, scores)]
+                output.write(json.dumps({"job": matcher.job_names[job], "resumes": resumes}) + "\n")
+        else:
+            for index, record in enumerate(records):
+                output.write(json.dumps({"file": record.get("file"), "jobs": matcher.top_jobs(result, index)}) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(
+        f"Matched {len(records)} resumes x {len(matcher)} jobs in {result['encode_seconds'] + result['seconds']:.2f} s "
+        f"({result['pairs_per_sec']:,.0f} pairs/sec scoring)",
+        file=sys.stderr,
+    )
+
+
+def score_bound(value: str) -> tuple:
+    """Parse a COLUMN=VALUE score filter, e.g. total_score=0.7."""
+    from utils.results_store import SCORE_COLUMNS
+
+    column, _, bound = value.partition("=")
+    if column not in SCORE_COLUMNS:
+        raise argparse.ArgumentTypeError(f"unknown score column {column!r} (choose from {', '.join(SCORE_COLUMNS)})")
+    try:
+        return column, float(bound)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected COLUMN=VALUE, e.g. total_score=0.7, not {value!r}")
+
+
+def run_results(args):
+    """Print stored analysis results passing the filters."""
+    from utils.results_store import ResultsStore
+
+    store = ResultsStore(args.store)
+    rows = store.query(job=args.job, min_scores=dict(args.min), max_scores=dict(args.max),
+                       order_by=args.order_by, limit=args.limit)
+    for row in rows:
+        print(json.dumps(row._asdict()))
+
+
+def run_serve(args):
+    """Start the HTTP scoring service."""
+    from data import load_skill_keywords
+    from service import create_app
+
+    skill_keywords = load_skill_keywords(args.skills_file) if args.skills_file else None
+    app = create_app(
+        skill_keywords=skill_keywords,
+        use_cache=not args.no_cache,
+        max_batch_size=args.batch_size,
+        max_wait_ms=args.batch_wait_ms,
+        max_queue_size=args.queue_size,
+    )
+    app.run(host=args.host, port=args.port, threaded=True)
+
+
+def main():
+    """Main function to run the Resume Analyzer application."""
+    parser = argparse.ArgumentParser(description="AI-Powered Resume Analyzer")
+    parser.add_argument("--no-cache", action="store_true", help="Always re-extract resume text instead of using the text cache.")
+    parser.add_argument("--metrics", help="Record per-stage timings and write them here on exit (.prom for Prometheus text, otherwise JSON).")
+    parser.add_argument("--profile", help="Capture a cProfile profile of the run, write it here and print a summary.")
+    parser.set_defaults(handler=run_gui)
+    commands = parser.add_subparsers(title="commands")
+
+    gui = commands.add_parser("gui", help="Open the desktop application (default).")
+    gui.set_defaults(handler=run_gui)
+
+    ingest = commands.add_parser("ingest", help="Parse every resume in a directory and stream JSON Lines.")
+    ingest.add_argument("directory", help="Directory of PDF/DOCX resumes.")
+    ingest.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    ingest.add_argument("-o", "--output", help="JSON Lines output file (default: stdout).")
+    ingest.add_argument("--skills-file", default="data/job_keywords.json", help="Job keywords JSON used for skill extraction.")
+    ingest.add_argument("--backend", default="auto", choices=["auto", "native", "textract"], help="Text extraction backend.")
+    # SUPPRESS keeps a --no-cache given before the subcommand from being reset here
+    ingest.add_argument("--no-cache", action="store_true", default=argparse.SUPPRESS,
+                        help="Always re-extract resume text instead of using the text cache.")
+    ingest.add_argument("--include-text", action="store_true", help="Include extracted text in each record.")
+    ingest.add_argument("--index", help="Also add parsed resumes to this resume index (SQLite file).")
+    ingest.add_argument("--sections", action="store_true", help="Record resume sections and only search skill-related sections for skills.")
+    ingest.add_argument("--dedup", action="store_true", help="Run name recognition once for near-duplicate resumes.")
+    ingest.add_argument("--dedup-threshold", type=float, default=0.8, help="Text similarity (0-1) at which resumes count as duplicates.")
+    ingest.set_defaults(handler=run_ingest)
+
+    search = commands.add_parser("search", help="Find indexed resumes that best match a job description.")
+    search.add_argument("job_description", help="Job description text, or - to read it from stdin.")
+    search.add_argument("--index", default="output/resume_index.sqlite3", help="Resume index (SQLite file).")
+    search.add_argument("-k", "--top-k", type=int, default=10, help="Number of resumes to return.")
+    search.set_defaults(handler=run_search)
+
+    corpus_stats = commands.add_parser("corpus-stats", help="Fit TF-IDF/BM25 statistics over ingested resumes.")
+    corpus_stats.add_argument("records", help="JSON Lines from 'ingest --include-text'.")
+    corpus_stats.add_argument("-o", "--output", default="output/corpus_stats", help="Directory for the statistics.")
+    corpus_stats.set_defaults(handler=run_corpus_stats)
+
+    match = commands.add_parser("match", help="Match ingested resumes against every role of a job catalog.")
+    match.add_argument("records", help="JSON Lines from 'ingest --include-text'.")
+    match.add_argument("--catalog", default="data/job_keywords.json", help="Job keywords JSON mapping roles to skills.")
+    match.add_argument("-k", "--top-k", type=int, default=10, help="Matches kept per resume and per job.")
+    match.add_argument("-w", "--workers", type=int, default=None, help="Threads scoring blocks (default: CPU count).")
+    match.add_argument("--block-size", type=int, default=2048, help="Resumes scored per block.")
+    match.add_argument("--by-job", action="store_true", help="Write the best resumes per job instead of the best jobs per resume.")
+    match.add_argument("-o", "--output", help="JSON Lines output file (default: stdout).")
+    match.set_defaults(handler=run_match)
+
+    from utils.results_store import SCORE_COLUMNS
+
+    results = commands.add_parser("results", help="Query stored analysis results.")
+    results.add_argument("--store", default="output/results", help="Results store directory.")
+    results.add_argument("--job", help="Only results for this job (the first line of its description in the GUI).")
+    results.add_argument("--min", type=score_bound, action="append", default=[], metavar="COLUMN=VALUE",
+                         help="Smallest score kept, e.g. total_score=0.7; repeatable.")
+    results.add_argument("--max", type=score_bound, action="append", default=[], metavar="COLUMN=VALUE",
+                         help="Largest score kept; repeatable.")
+    results.add_argument("--order-by", choices=SCORE_COLUMNS, help="Score column to sort by, highest first (default: write order).")
+    results.add_argument("-k", "--limit", type=int, default=None, help="Most rows printed.")
+    results.set_defaults(handler=run_results)
+
+    serve = commands.add_parser("serve", help="Run the HTTP scoring service.")
+    serve.add_argument("--host", default="127.0.0.1", help="Interface to bind.")
+    serve.add_argument("--port", type=int, default=8000, help="Port to listen on.")
+    serve.add_argument("--skills-file", help="Job keywords JSON used for skill extraction (default: the desktop app's skills).")
+    serve.add_argument("--batch-size", type=int, default=32, help="Most extraction requests per spaCy batch.")
+    serve.add_argument("--batch-wait-ms", type=float, default=10.0, help="How long a batch waits for more requests.")
+    serve.add_argument("--no-cache", action="store_true", default=argparse.SUPPRESS,
+                       help="Always re-extract resume text instead of using the text cache.")
+    serve.add_argument("--queue-size", type=int, default=256, help="Pending extraction requests before answering 503.")
+    serve.set_defaults(handler=run_serve)
+
+    args = parser.parse_args()
+    run_instrumented(args)
+
+
+def run_instrumented(args):
+    """Run the selected command, recording metrics or a profile when asked to."""
+    from utils import instrumentation
+
+    if args.metrics:
+        instrumentation.enable()
+    try:
+        if args.profile:
+            with instrumentation.profiled(args.profile) as profile:
+                args.handler(args)
+            print(profile["report"], file=sys.stderr)
+        else:
+            args.handler(args)
+    finally:
+        if args.metrics:
+            metrics = instrumentation.get_instrumentation()
+            exported = metrics.to_prometheus() if args.metrics.endswith(".prom") else metrics.to_json()
+            with open(args.metrics, "w", encoding="utf-8") as file:
+                file.write(exported)
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
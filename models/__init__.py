@@ -1,10 +1,11 @@
-# models/spacy_model/__init__.py
+# models/__init__.py
 
-# Optionally, load your spaCy model here or expose an interface for using the model
-import spacy
+# spaCy pipelines are loaded lazily and shared through a process-wide registry
+from .registry import DEFAULT_MODEL, ModelRegistry, get_registry, get_spacy_model
 
-def load_spacy_model(model_name="en_core_web_sm"):
-    """Load and return a spaCy model."""
-    return spacy.load(model_name)
 
-__all__ = ["load_spacy_model"]
\ No newline at end of file
+def load_spacy_model(model_name=DEFAULT_MODEL):
+    """Load and return a shared spaCy model."""
+    return get_spacy_model(model_name)
+
+__all__ = ["DEFAULT_MODEL", "ModelRegistry", "get_registry", "get_spacy_model", "load_spacy_model"]
@@ -0,0 +1,156 @@
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+from utils.memory import peak_rss_bytes
+
+
+DEFAULT_MODEL = "en_core_web_sm"
+
+
+class ModelRegistry:
+    """Process-wide, thread-safe cache of lazily loaded spaCy pipelines."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._models = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    @staticmethod
+    def _key(model_name: str, components: Optional[Iterable[str]]) -> Tuple[str, Optional[Tuple[str, ...]]]:
+        """Build the cache key for a model and an optional component subset."""
+        return model_name, tuple(sorted(set(components))) if components else None
+
+    def get(self, model_name: str = DEFAULT_MODEL, components: Optional[Iterable[str]] = None):
+        """
+        Return a shared pipeline, loading it on first use.
+
+        Args:
+            model_name (str): Name of the spaCy model package (default: en_core_web_sm).
+            components (iterable, optional): Pipeline components to keep, e.g. ("ner",).
+                All other components are removed so they cost neither time nor memory
+                at inference. Keep every component when omitted.
+
+        Returns:
+            spacy.language.Language: The loaded pipeline.
+        """
+        key = self._key(model_name, components)
+        nlp = self._hit(key)
+        if nlp is not None:
+            return nlp
+
+        # One lock per key so loading a large model doesn't block lookups of others
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            nlp = self._hit(key)
+            if nlp is None:
+                nlp, stats = self._load(key)
+                with self._lock:
+                    self._models[key] = nlp
+                    self._stats[key] = stats
+        return nlp
+
+    def _hit(self, key: Tuple[str, Optional[Tuple[str, ...]]]):
+        """Return a cached pipeline and count the hit, or None; atomic with respect to clear()."""
+        with self._lock:
+            nlp = self._models.get(key)
+            if nlp is not None:
+                self._stats[key]["hits"] += 1
+            return nlp
+
+    def _load(self, key: Tuple[str, Optional[Tuple[str, ...]]]):
+        """Load the pipeline for a cache key, returning it with its load statistics."""
+        import spacy
+
+        model_name, components = key
+        rss_before = peak_rss_bytes()
+        start = time.perf_counter()
+
+        nlp = spacy.load(model_name)
+        if components:
+            unknown = set(components) - set(nlp.pipe_names)
+            if unknown:
+                raise ValueError(
+                    f"Unknown components for {model_name}: {', '.join(sorted(unknown))}. "
+                    f"Available components: {', '.join(nlp.pipe_names)}"
+                )
+            for name in list(nlp.pipe_names):
+                if name not in components:
+                    nlp.remove_pipe(name)
+
+        stats = {
+            "model": model_name,
+            "components": list(nlp.pipe_names),
+            "load_seconds": time.perf_counter() - start,
+            "peak_rss_delta_bytes": max(peak_rss_bytes() - rss_before, 0),
+            "hits": 0,
+        }
+        return nlp, stats
+
+    def is_loaded(self, model_name: str = DEFAULT_MODEL, components: Optional[Iterable[str]] = None) -> bool:
+        """
+        Check whether a pipeline has already been loaded.
+
+        Args:
+            model_name (str): Name of the spaCy model package.
+            components (iterable, optional): Component subset, as passed to get().
+
+        Returns:
+            bool: True if the pipeline is cached, False otherwise.
+        """
+        return self._key(model_name, components) in self._models
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Return load-time and memory statistics for every loaded pipeline.
+
+        Returns:
+            dict: Mapping of "model[components]" labels to their statistics.
+        """
+        labels = {}
+        with self._lock:
+            items = [(key, dict(stats)) for key, stats in self._stats.items()]
+        for (model_name, components), stats in items:
+            label = f"{model_name}[{','.join(components)}]" if components else model_name
+            labels[label] = stats
+        return labels
+
+    def clear(self):
+        """Drop every cached pipeline so the next get() reloads it."""
+        with self._lock:
+            self._models.clear()
+            self._stats.clear()
+            self._key_locks.clear()
+
+
+_registry = ModelRegistry()
+
+
+def get_registry() -> ModelRegistry:
+    """Return the process-wide model registry."""
+    return _registry
+
+
+def get_spacy_model(model_name: str = DEFAULT_MODEL, components: Optional[Iterable[str]] = None):
+    """
+    Return a shared spaCy pipeline from the process-wide registry.
+
+    Args:
+        model_name (str): Name of the spaCy model package (default: en_core_web_sm).
+        components (iterable, optional): Pipeline components to keep, e.g. ("ner",).
+
+    Returns:
+        spacy.language.Language: The loaded pipeline.
+    """
+    return _registry.get(model_name, components)
+
+
+# Example usage
+if __name__ == "__main__":
+    nlp = get_spacy_model(components=("ner",))
+    get_spacy_model(components=("ner",))
+    print("Pipeline:", nlp.pipe_names)
+    print("Stats:", get_registry().stats())
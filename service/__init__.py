@@ -0,0 +1,7 @@
+# service/__init__.py
+
+# HTTP scoring service; each worker process builds its own app and spaCy pipeline
+from .batcher import MicroBatcher
+from .server import create_app
+
+__all__ = ["MicroBatcher", "create_app"]
@@ -0,0 +1,142 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional
+
+from app.extractor import ResumeExtractor
+
+
+class MicroBatcher:
+    """Collects concurrent extraction requests and runs them through nlp.pipe together."""
+
+    def __init__(self, skill_keywords: list, max_batch_size: int = 32, max_wait_ms: float = 10.0,
+                 max_queue_size: int = 256, nlp=None):
+        """
+        Start the batching thread.
+
+        Args:
+            skill_keywords (list): Default skills to look for when a request names none.
+            max_batch_size (int): Most requests handled by one nlp.pipe call (default: 32).
+            max_wait_ms (float): How long the first request of a batch waits for company (default: 10).
+            max_queue_size (int): Pending requests beyond which submit() rejects work (default: 256).
+            nlp (spacy.language.Language, optional): Pipeline to use (default: the registry's NER pipeline).
+        """
+        self.skill_keywords = list(skill_keywords)
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.nlp = nlp
+        self.requests = queue.Queue(maxsize=max_queue_size)
+        self.batches = 0
+        self.batched_requests = 0
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="extraction-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str, skill_keywords: Optional[list] = None) -> Future:
+        """
+        Queue a text for extraction.
+
+        Args:
+            text (str): Raw resume text.
+            skill_keywords (list, optional): Skills to look for (default: the batcher's skills).
+
+        Returns:
+            Future: Resolves to the extracted name, email, phone and skills.
+
+        Raises:
+            queue.Full: If the queue is at capacity; callers should shed load.
+            TypeError: If the skills are not all strings.
+        """
+        if self._closed.is_set():
+            raise RuntimeError("MicroBatcher is closed.")
+        if skill_keywords is not None and not all(isinstance(skill, str) for skill in skill_keywords):
+            raise TypeError("Skill keywords must be strings.")
+        future = Future()
+        skills = tuple(skill_keywords) if skill_keywords is not None else tuple(self.skill_keywords)
+        self.requests.put_nowait((text, skills, future))
+        return future
+
+    def _collect(self) -> list:
+        """Block for one request, then gather more until the batch is full or the wait expires."""
+        try:
+            batch = [self.requests.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.requests.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        """Process batches until closed."""
+        while not self._closed.is_set():
+            batch = self._collect()
+            if not batch:
+                continue
+            self.batches += 1
+            self.batched_requests += len(batch)
+
+            try:
+                self._dispatch(batch)
+            except Exception as e:
+                # A bad request must not kill the only thread serving every other one
+                self._fail(batch, e)
+
+    def _dispatch(self, batch: list):
+        """Group a batch by skill list and extract each group."""
+        # Requests with different skill lists share the batch but need separate pipe calls
+        groups = {}
+        for item in batch:
+            try:
+                groups.setdefault(item[1], []).append(item)
+            except TypeError as e:
+                self._fail([item], e)
+        for skills, items in groups.items():
+            # Requests whose callers gave up are dropped before doing any work
+            items = [item for item in items if item[2].set_running_or_notify_cancel()]
+            if items:
+                self._extract(items, list(skills))
+
+    @staticmethod
+    def _fail(items: list, error: Exception):
+        """Resolve the futures of items that have not finished with an error."""
+        for _, _, future in items:
+            if not future.done():
+                # Pending futures must be marked running before they can take a result
+                if future.running() or future.set_running_or_notify_cancel():
+                    future.set_exception(error)
+
+    def _extract(self, items: list, skill_keywords: list):
+        """Run one nlp.pipe call over the items and resolve their futures."""
+        texts = [text for text, _, _ in items]
+        try:
+            records = ResumeExtractor.extract_batch(texts, skill_keywords, batch_size=len(texts), nlp=self.nlp)
+            for (_, _, future), record in zip(items, records):
+                future.set_result(record)
+        except Exception as e:
+            self._fail(items, e)
+
+    def stats(self) -> dict:
+        """
+        Return batching statistics.
+
+        Returns:
+            dict: Queue depth, batches run and mean batch size.
+        """
+        return {
+            "queue_depth": self.requests.qsize(),
+            "batches": self.batches,
+            "mean_batch_size": round(self.batched_requests / self.batches, 2) if self.batches else 0.0,
+        }
+
+    def close(self):
+        """Stop the batching thread after the current batch."""
+        self._closed.set()
+        self._thread.join(timeout=5)
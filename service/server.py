@@ -0,0 +1,218 @@
+import math
+import os
+import queue
+import tempfile
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from typing import Optional
+
+from flask import Flask, jsonify, request
+from werkzeug.exceptions import BadRequest, GatewayTimeout, HTTPException, InternalServerError, ServiceUnavailable
+
+from app.extractor import ResumeExtractor
+from app.job_profile import JobProfile
+from app.matcher import ResumeMatcher
+from app.parser import ResumeParser
+from app.pipeline import DEFAULT_SKILL_KEYWORDS
+from app.recommender import ResumeRecommender
+from app.scorer import ResumeScorer
+from models import get_registry, get_spacy_model
+from utils.instrumentation import get_instrumentation
+from .batcher import MicroBatcher
+
+# Seconds a saturated service asks clients to wait before retrying
+RETRY_AFTER_SECONDS = 1
+
+
+@lru_cache(maxsize=256)
+def job_profile_for(job_description: str) -> JobProfile:
+    """Return a shared JobProfile so repeated requests for one job tokenize it once."""
+    return JobProfile(job_description)
+
+
+def create_app(skill_keywords: Optional[list] = None, use_cache: bool = True, nlp=None,
+               max_batch_size: int = 32, max_wait_ms: float = 10.0, max_queue_size: int = 256,
+               max_concurrent_parses: int = 4, request_timeout: float = 30.0) -> Flask:
+    """
+    Build the scoring service.
+
+    The spaCy pipeline is loaded here, once per worker process, so the first
+    request doesn't pay for it. Concurrent /extract requests are grouped into
+    single nlp.pipe calls by a MicroBatcher; when its queue or the parse slots
+    are full the service answers 503 instead of queueing without bound.
+
+    Args:
+        skill_keywords (list, optional): Skills to look for (default: the desktop app's skills).
+        use_cache (bool): Reuse cached extracted text for uploaded files (default: True).
+        nlp (spacy.language.Language, optional): Pipeline for NER (default: the registry's NER pipeline).
+        max_batch_size (int): Most extraction requests per nlp.pipe call (default: 32).
+        max_wait_ms (float): How long a batch waits to fill up (default: 10).
+        max_queue_size (int): Pending extraction requests before answering 503 (default: 256).
+        max_concurrent_parses (int): Uploads parsed at once before answering 503 (default: 4).
+        request_timeout (float): Seconds to wait for an extraction result before answering 504 (default: 30).
+
+    Returns:
+        Flask: The WSGI application.
+    """
+    if nlp is None:
+        nlp = get_spacy_model(components=ResumeExtractor.NAME_COMPONENTS)
+    skill_keywords = list(skill_keywords) if skill_keywords is not None else list(DEFAULT_SKILL_KEYWORDS)
+
+    app = Flask(__name__)
+    batcher = MicroBatcher(skill_keywords, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms,
+                           max_queue_size=max_queue_size, nlp=nlp)
+    parse_slots = threading.BoundedSemaphore(max_concurrent_parses)
+    app.config["BATCHER"] = batcher
+
+    def payload() -> dict:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            raise BadRequest("Expected a JSON object body.")
+        return data
+
+    def required(data: dict, key: str, kind=str):
+        value = data.get(key)
+        if not isinstance(value, kind):
+            raise BadRequest(f"Missing or invalid field: {key}")
+        return value
+
+    def number(data: dict, key: str, default: float) -> float:
+        try:
+            value = float(data.get(key, default))
+        except (TypeError, ValueError):
+            value = math.nan
+        if not math.isfinite(value):
+            raise BadRequest(f"Invalid number in field: {key}")
+        return value
+
+    def overloaded(message: str) -> ServiceUnavailable:
+        error = ServiceUnavailable(message)
+        error.retry_after = RETRY_AFTER_SECONDS
+        return error
+
+    def extract(text: str, skills: Optional[list]) -> dict:
+        if skills is not None and not (isinstance(skills, list) and all(isinstance(skill, str) for skill in skills)):
+            raise BadRequest("Missing or invalid field: skills")
+        try:
+            future = batcher.submit(text, skills)
+        except queue.Full:
+            raise overloaded("Extraction queue is full; retry later.")
+        try:
+            return future.result(timeout=request_timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise GatewayTimeout("Extraction timed out.")
+
+    def extracted_data(data: dict) -> dict:
+        # Scoring endpoints accept either extracted fields or raw text to extract first;
+        # the text is kept for keyword matching but not echoed back
+        if isinstance(data.get("extracted_data"), dict):
+            return data["extracted_data"]
+        text = required(data, "text")
+        return dict(extract(text, data.get("skills")), text=text)
+
+    def without_text(resume: dict) -> dict:
+        return {key: value for key, value in resume.items() if key != "text"}
+
+    @app.errorhandler(HTTPException)
+    def handle_http_error(error):
+        response = jsonify({"error": error.description})
+        response.status_code = error.code
+        if error.code == 503:
+            response.headers["Retry-After"] = str(RETRY_AFTER_SECONDS)
+        return response
+
+    @app.errorhandler(Exception)
+    def handle_unexpected_error(error):
+        # Clients always get JSON, even for failures no endpoint anticipated
+        app.logger.exception("Unhandled error")
+        return handle_http_error(InternalServerError(f"{type(error).__name__}: {error}"))
+
+    @app.route("/health", methods=["GET"])
+    def health():
+        return jsonify({
+            "status": "ok",
+            "models": get_registry().stats(),
+            "batcher": batcher.stats(),
+        })
+
+    @app.route("/metrics", methods=["GET"])
+    def metrics():
+        # Empty unless instrumentation was enabled, e.g. with 'main.py --metrics ... serve'
+        return get_instrumentation().to_prometheus(), 200, {"Content-Type": "text/plain; version=0.0.4"}
+
+    @app.route("/parse", methods=["POST"])
+    def parse():
+        upload = request.files.get("file")
+        if upload is None or not upload.filename:
+            raise BadRequest("Upload a resume as the 'file' form field.")
+        suffix = os.path.splitext(upload.filename)[1].lower()
+        if suffix not in ResumeParser.SUPPORTED_FORMATS:
+            raise BadRequest(f"Unsupported file format: {suffix}. Supported formats: {', '.join(ResumeParser.SUPPORTED_FORMATS)}")
+        if not parse_slots.acquire(blocking=False):
+            raise overloaded("Too many uploads being parsed; retry later.")
+        fd, tmp_path = tempfile.mkstemp(suffix=suffix)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                upload.save(file)
+            text = ResumeParser(tmp_path, use_cache=use_cache).extract_text()
+        except (RuntimeError, ValueError) as e:
+            # Corrupt or mislabelled uploads; missing backends stay server errors
+            raise BadRequest(f"Could not parse resume: {e}")
+        finally:
+            parse_slots.release()
+            os.remove(tmp_path)
+        return jsonify({"text": text})
+
+    @app.route("/extract", methods=["POST"])
+    def extract_fields():
+        data = payload()
+        return jsonify(extract(required(data, "text"), data.get("skills")))
+
+    @app.route("/score", methods=["POST"])
+    def score():
+        data = payload()
+        job_profile = job_profile_for(required(data, "job_description"))
+        resume = extracted_data(data)
+        scorer = ResumeScorer(resume, job_profile,
+                              skill_weight=number(data, "skill_weight", 0.6),
+                              structure_weight=number(data, "structure_weight", 0.4))
+        return jsonify({
+            "extracted_data": without_text(resume),
+            "skill_score": scorer.score_skills(),
+            "structure_score": scorer.score_structure(),
+            "total_score": scorer.calculate_total_score(),
+        })
+
+    @app.route("/recommend", methods=["POST"])
+    def recommend():
+        data = payload()
+        job_profile = job_profile_for(required(data, "job_description"))
+        resume = extracted_data(data)
+        return jsonify({
+            "extracted_data": without_text(resume),
+            "recommendations": ResumeRecommender(resume, job_profile).get_recommendations(),
+        })
+
+    @app.route("/match", methods=["POST"])
+    def match():
+        data = payload()
+        job_profile = job_profile_for(required(data, "job_description"))
+        resume = extracted_data(data)
+        matcher = ResumeMatcher(resume, job_profile)
+        try:
+            match_score = matcher.calculate_total_match_score(
+                skill_weight=number(data, "skill_weight", 0.7),
+                keyword_weight=number(data, "keyword_weight", 0.3),
+            )
+        except ValueError as e:
+            raise BadRequest(str(e))
+        return jsonify({"extracted_data": without_text(resume), "match_score": match_score})
+
+    return app
+
+
+# Example usage
+if __name__ == "__main__":
+    create_app().run(host="127.0.0.1", port=8000, threaded=True)
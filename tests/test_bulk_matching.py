@@ -0,0 +1,25 @@
+import numpy as np
+
+from app.bulk_matching import BulkMatcher
+from data import load_job_keywords
+
+CATALOG = load_job_keywords()
+
+
+def role_resumes() -> list:
+    """One resume per catalog role listing exactly that role's skills, one per line."""
+    return [{"skills": skills, "text": "\n".join(skills)} for skills in CATALOG.values()]
+
+
+def test_catalog_keyword_scores_count_the_roles_skills():
+    matcher = BulkMatcher.from_catalog(CATALOG, skill_weight=0.0, keyword_weight=1.0)
+    scores = matcher.score_block(*matcher.encode(role_resumes()))
+    # Only the role name is missing from each resume's text
+    assert (np.diag(scores) > 0.5).all()
+
+
+def test_catalog_match_ranks_each_role_first_for_its_own_resume():
+    matcher = BulkMatcher.from_catalog(CATALOG)
+    result = matcher.match(role_resumes(), top_k=1)
+    assert result["resume_jobs"][:, 0].tolist() == list(range(len(CATALOG)))
+    assert (result["resume_scores"][:, 0] > 0.7).all()
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Libraries that only text extraction, NER or bulk scoring need
+HEAVY_MODULES = ("spacy", "scipy", "numpy", "textract")
+
+
+def loaded_after_import(statement: str) -> list:
+    """Run an import statement in a fresh interpreter and return the heavy modules it loaded."""
+    code = f"import sys; {statement}; print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=ROOT)
+    return completed.stdout.split()
+
+
+def test_importing_app_loads_no_heavy_dependencies():
+    assert loaded_after_import("import app") == []
+
+
+@pytest.mark.parametrize("module", ["app.job_profile", "app.scorer", "app.matcher", "app.recommender"])
+def test_scoring_modules_load_no_heavy_dependencies(module):
+    assert loaded_after_import(f"import {module}") == []
+
+
+def test_scoring_exports_load_no_heavy_dependencies():
+    assert loaded_after_import("import app; app.ResumeScorer, app.ResumeMatcher, app.ResumeRecommender") == []
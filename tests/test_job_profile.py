@@ -0,0 +1,22 @@
+import pytest
+
+from app.job_profile import JobProfile
+from app.taxonomy import SkillTaxonomy
+from data import load_job_keywords
+
+CATALOG = load_job_keywords()
+TAXONOMY = SkillTaxonomy.build(CATALOG)
+
+
+@pytest.mark.parametrize("role", list(CATALOG))
+def test_role_keywords_carry_no_separators(role):
+    profile = JobProfile.for_role(role, TAXONOMY)
+    assert not [keyword for keyword in profile.keywords if keyword[-1] in ",:;" or keyword[0] in ",:;"]
+
+
+@pytest.mark.parametrize("role", list(CATALOG))
+def test_role_keywords_match_a_resume_listing_its_skills(role):
+    profile = JobProfile.for_role(role, TAXONOMY)
+    # Skills listed one per line, with no commas for a keyword to rely on
+    text = "\n".join(CATALOG[role])
+    assert profile.keyword_match_score(text) > 0.5
@@ -0,0 +1,19 @@
+import pytest
+
+from app.recommender import ResumeRecommender
+from app.scorer import ResumeScorer
+
+SECTIONS = [["header", 0, 10], ["skills", 10, 20], ["experience", 20, 30], ["education", 30, 40]]
+
+
+@pytest.mark.parametrize("extracted_data", [
+    {"name": "Jane Doe", "email": "jane@example.com", "phone": "555-010-2030", "skills": [], "sections": SECTIONS},
+    {"name": "Jane Doe", "email": "jane@example.com", "phone": "555-010-2030", "skills": ["python"]},
+    {"name": "Jane Doe", "skills": [], "sections": SECTIONS[:2]},
+    {"name": "Jane Doe", "skills": []},
+])
+def test_missing_sections_agree_with_structure_score(extracted_data):
+    missing = ResumeRecommender(extracted_data, "Python developer").recommend_missing_sections()
+    checks = ResumeScorer.structure_checks(extracted_data)
+    assert len(missing) == sum(not passed for _, passed in checks)
+    assert (ResumeScorer.structure_score(extracted_data) == 1.0) == (missing == [])
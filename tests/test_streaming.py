@@ -0,0 +1,21 @@
+from benchmarks.bench_streaming import MIB, run_isolated
+
+# A ~1.3 MiB document: joining and parsing it whole grows RSS by tens of MiB
+PAGES = 200
+WORDS_PER_PAGE = 1000
+CEILING_MIB = 32.0
+
+
+def test_streaming_extraction_stays_under_rss_ceiling():
+    # Each mode runs in a fresh interpreter, so the peak RSS is its own
+    stream = run_isolated("stream", PAGES, WORDS_PER_PAGE, seed=0)
+    growth = (stream["peak"] - stream["baseline"]) / MIB
+    assert growth < CEILING_MIB, f"streaming peak RSS grew {growth:.1f} MiB"
+
+
+def test_streaming_extraction_matches_whole_text():
+    whole = run_isolated("whole", PAGES, WORDS_PER_PAGE, seed=0)
+    stream = run_isolated("stream", PAGES, WORDS_PER_PAGE, seed=0)
+    assert stream["fields"] == whole["fields"]
+    assert stream["fields"]["email"] == "jordan.example@example.com"
+    assert stream["fields"]["skills"]
@@ -2,5 +2,7 @@
 
 # Import file utility functions for easy access
 from .file_utils import FileUtils
+from .text_cache import TextCache, get_default_text_cache
+from .instrumentation import Instrumentation, get_instrumentation
 
-__all__ = ["FileUtils"]
\ No newline at end of file
+__all__ = ["FileUtils", "TextCache", "get_default_text_cache", "Instrumentation", "get_instrumentation"]
\ No newline at end of file
@@ -0,0 +1,298 @@
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+# Prefix of every exported Prometheus metric
+METRIC_PREFIX = "resume_analyzer"
+
+
+class _NullStage:
+    """Context manager that does nothing; returned by stage() while instrumentation is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def add_bytes(self, count: int):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    """Context manager timing one execution of a stage."""
+
+    def __init__(self, instrumentation: "Instrumentation", name: str, size: int):
+        self.instrumentation = instrumentation
+        self.name = name
+        self.size = size
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.instrumentation.record(self.name, time.perf_counter() - self.start, self.size, failed=exc_type is not None)
+        return False
+
+    def add_bytes(self, count: int):
+        """Count bytes processed by this execution, when only known inside the block."""
+        self.size += count
+
+
+class Instrumentation:
+    """Opt-in per-stage wall time, call counts, bytes processed and event counters."""
+
+    def __init__(self, enabled: bool = False):
+        """
+        Initialize the Instrumentation.
+
+        Args:
+            enabled (bool): Start recording immediately (default: False).
+        """
+        self.enabled = enabled
+        self.stages = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def stage(self, name: str, size: int = 0):
+        """
+        Time a block of code as one call of a stage.
+
+        Nested stages are timed independently, so a parent's time includes its children's.
+
+        Args:
+            name (str): Stage name, e.g. "extract.name".
+            size (int): Bytes processed by the block, if known up front (default: 0).
+
+        Returns:
+            A context manager; a shared no-op when instrumentation is disabled.
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name, size)
+
+    def record(self, name: str, seconds: float, size: int = 0, failed: bool = False):
+        """
+        Fold one stage execution into the totals.
+
+        Args:
+            name (str): Stage name.
+            seconds (float): Wall time of the execution.
+            size (int): Bytes processed (default: 0).
+            failed (bool): The execution raised (default: False).
+        """
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = {"calls": 0, "errors": 0, "seconds": 0.0, "max_seconds": 0.0, "bytes": 0}
+            stats["calls"] += 1
+            stats["errors"] += failed
+            stats["seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+            stats["bytes"] += size
+
+    def increment(self, name: str, count: int = 1):
+        """
+        Add to an event counter such as "text_cache.hits".
+
+        Args:
+            name (str): Counter name.
+            count (int): Amount to add (default: 1).
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + count
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        with self._lock:
+            self.stages.clear()
+            self.counters.clear()
+
+    def collect(self) -> dict:
+        """
+        Return the raw totals recorded since the last collect() and forget them.
+
+        Worker processes send these to their parent, which folds them in with merge().
+
+        Returns:
+            dict: "stages" and "counters" in the form merge() accepts.
+        """
+        with self._lock:
+            collected = {"stages": self.stages, "counters": self.counters}
+            self.stages = {}
+            self.counters = {}
+        return collected
+
+    def merge(self, collected: dict):
+        """
+        Fold totals from collect() in another process into these.
+
+        Args:
+            collected (dict): "stages" and "counters" returned by collect().
+        """
+        with self._lock:
+            for name, other in collected["stages"].items():
+                stats = self.stages.get(name)
+                if stats is None:
+                    self.stages[name] = dict(other)
+                    continue
+                for key in ("calls", "errors", "seconds", "bytes"):
+                    stats[key] += other[key]
+                stats["max_seconds"] = max(stats["max_seconds"], other["max_seconds"])
+            for name, count in collected["counters"].items():
+                self.counters[name] = self.counters.get(name, 0) + count
+
+    def to_dict(self) -> dict:
+        """
+        Return a snapshot of the recorded metrics.
+
+        Returns:
+            dict: "stages" (calls, errors, seconds, mean/max seconds, bytes per stage) and "counters".
+        """
+        with self._lock:
+            stages = {}
+            for name, stats in sorted(self.stages.items()):
+                stages[name] = dict(stats, mean_seconds=stats["seconds"] / stats["calls"])
+            return {"stages": stages, "counters": dict(sorted(self.counters.items()))}
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Return the metrics snapshot as JSON."""
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_prometheus(self) -> str:
+        """
+        Return the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: One counter family per stage statistic, plus the event counters.
+        """
+        snapshot = self.to_dict()
+        families = (
+            ("stage_calls_total", "calls", "Executions of each stage."),
+            ("stage_errors_total", "errors", "Executions of each stage that raised."),
+            ("stage_seconds_total", "seconds", "Wall time spent in each stage."),
+            ("stage_bytes_total", "bytes", "Bytes processed by each stage."),
+        )
+        lines = []
+        for metric, key, help_text in families:
+            lines.append(f"# HELP {METRIC_PREFIX}_{metric} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{metric} counter")
+            for name, stats in snapshot["stages"].items():
+                lines.append(f'{METRIC_PREFIX}_{metric}{{stage="{name}"}} {stats[key]}')
+        lines.append(f"# HELP {METRIC_PREFIX}_events_total Counted events such as cache hits.")
+        lines.append(f"# TYPE {METRIC_PREFIX}_events_total counter")
+        for name, count in snapshot["counters"].items():
+            lines.append(f'{METRIC_PREFIX}_events_total{{event="{name}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+_instrumentation = Instrumentation()
+
+
+def get_instrumentation() -> Instrumentation:
+    """Return the process-wide instrumentation."""
+    return _instrumentation
+
+
+def enable():
+    """Start recording metrics in this process."""
+    _instrumentation.enabled = True
+
+
+def disable():
+    """Stop recording metrics; what was recorded is kept until reset()."""
+    _instrumentation.enabled = False
+
+
+def stage(name: str, size: int = 0):
+    """Time a block of code as one call of a stage; see Instrumentation.stage()."""
+    return _instrumentation.stage(name, size)
+
+
+def increment(name: str, count: int = 1):
+    """Add to an event counter; see Instrumentation.increment()."""
+    _instrumentation.increment(name, count)
+
+
+def instrumented(name: str, size: Optional[Callable[..., int]] = None):
+    """
+    Decorate a function so each call is timed as a stage.
+
+    While instrumentation is disabled the wrapper costs one attribute check.
+
+    Args:
+        name (str): Stage name.
+        size (callable, optional): Called with the function's arguments to get the
+            number of bytes it processes, e.g. ``lambda self, *_: len(self.text)``.
+
+    Returns:
+        callable: The decorator.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _instrumentation.enabled:
+                return func(*args, **kwargs)
+            with _Stage(_instrumentation, name, size(*args, **kwargs) if size is not None else 0):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def profiled(output_path: Optional[str] = None, sort: str = "cumulative", limit: int = 30):
+    """
+    Capture a cProfile profile of the enclosed block.
+
+    Args:
+        output_path (str, optional): Write raw pstats data here, for snakeviz or
+            pstats.Stats (default: don't write a file).
+        sort (str): Sort key for the text report (default: "cumulative").
+        limit (int): Number of functions in the text report (default: 30).
+
+    Yields:
+        dict: Receives a "report" text summary once the block exits.
+    """
+    # Only profiling runs pay for importing the profiler
+    import cProfile
+    import io
+    import pstats
+
+    profile = cProfile.Profile()
+    result = {}
+    profile.enable()
+    try:
+        yield result
+    finally:
+        profile.disable()
+        if output_path:
+            profile.dump_stats(output_path)
+        report = io.StringIO()
+        pstats.Stats(profile, stream=report).sort_stats(sort).print_stats(limit)
+        result["report"] = report.getvalue()
+
+
+# Example usage
+if __name__ == "__main__":
+    enable()
+
+    @instrumented("example.sum", size=lambda values: len(values) * 8)
+    def total(values):
+        return sum(values)
+
+    with stage("example.block"):
+        for _ in range(3):
+            total(list(range(1000)))
+    increment("example.events", 2)
+
+    print(get_instrumentation().to_json())
+    print(get_instrumentation().to_prometheus())
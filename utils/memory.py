@@ -0,0 +1,26 @@
+import sys
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+def peak_rss_bytes(include_children: bool = False) -> int:
+    """
+    Return the peak resident set size of the current process.
+
+    Args:
+        include_children (bool): Also consider terminated child processes, e.g. the
+            external tools textract runs (default: False).
+
+    Returns:
+        int: Peak RSS in bytes, or 0 if it cannot be measured on this platform.
+    """
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if include_children:
+        peak = max(peak, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
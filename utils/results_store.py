@@ -0,0 +1,415 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+
+# Scores stored in the binary index, so filters on them never parse a row
+SCORE_COLUMNS = ("skill_score", "structure_score", "total_score", "match_score")
+
+# One fixed-size index entry per row: where the row's JSON line is, which job it
+# was scored against (an index into the jobs file) and its scores
+INDEX_DTYPE = np.dtype([
+    ("offset", "<u8"),
+    ("length", "<u4"),
+    ("job", "<u4"),
+    ("skill_score", "<f8"),
+    ("structure_score", "<f8"),
+    ("total_score", "<f8"),
+    ("match_score", "<f8"),
+    ("analyzed_at", "<f8"),
+])
+
+
+def _optional_str(value, field: str) -> Optional[str]:
+    """Return value if it is a string or None, failing clearly otherwise."""
+    if value is not None and not isinstance(value, str):
+        raise TypeError(f"{field} must be a string or None, not {type(value).__name__}.")
+    return value
+
+
+def _str_list(values, field: str) -> List[str]:
+    """Return values as a list of strings, failing clearly otherwise."""
+    values = list(values or [])
+    for value in values:
+        if not isinstance(value, str):
+            raise TypeError(f"{field} must only contain strings, not {type(value).__name__}.")
+    return values
+
+
+class ResultRow(NamedTuple):
+    """One stored analysis: a resume's extracted fields, scores and recommendations for one job."""
+
+    file: str
+    job: str
+    name: Optional[str]
+    email: Optional[str]
+    phone: Optional[str]
+    skills: List[str]
+    skill_score: float
+    structure_score: float
+    total_score: float
+    match_score: float
+    missing_sections: List[str]
+    skills_to_add: List[str]
+    formatting_tips: List[str]
+    analyzed_at: float
+
+    @classmethod
+    def from_analysis(cls, file: str, job: str, analysis: dict, analyzed_at: Optional[float] = None) -> "ResultRow":
+        """
+        Build a row from a pipeline.analyze_resume() result, checking every field's type.
+
+        Args:
+            file (str): Path of the analyzed resume.
+            job (str): Job the resume was scored against, e.g. a title or requisition ID.
+            analysis (dict): Result of analyze_resume().
+            analyzed_at (float, optional): Unix time of the analysis (default: now).
+
+        Returns:
+            ResultRow: The typed row.
+        """
+        extracted_data = analysis["extracted_data"]
+        recommendations = analysis.get("recommendations", {})
+        return cls(
+            file=str(file),
+            job=str(job),
+            name=_optional_str(extracted_data.get("name"), "name"),
+            email=_optional_str(extracted_data.get("email"), "email"),
+            phone=_optional_str(extracted_data.get("phone"), "phone"),
+            skills=_str_list(extracted_data.get("skills"), "skills"),
+            skill_score=float(analysis["skill_score"]),
+            structure_score=float(analysis["structure_score"]),
+            total_score=float(analysis["total_score"]),
+            match_score=float(analysis["match_score"]),
+            missing_sections=_str_list(recommendations.get("missing_sections"), "missing_sections"),
+            skills_to_add=_str_list(recommendations.get("skills_to_add"), "skills_to_add"),
+            formatting_tips=_str_list(recommendations.get("formatting_tips"), "formatting_tips"),
+            analyzed_at=float(time.time() if analyzed_at is None else analyzed_at),
+        )
+
+    def to_analysis(self) -> dict:
+        """
+        Rebuild the analyze_resume()-shaped result, e.g. to display a stored analysis again.
+
+        Returns:
+            dict: "extracted_data", the scores and "recommendations".
+        """
+        return {
+            "extracted_data": {"name": self.name, "email": self.email, "phone": self.phone, "skills": self.skills},
+            **{column: getattr(self, column) for column in SCORE_COLUMNS},
+            "recommendations": {
+                "missing_sections": self.missing_sections,
+                "skills_to_add": self.skills_to_add,
+                "formatting_tips": self.formatting_tips,
+            },
+        }
+
+
+class ResultsStore:
+    """Append-only store of analysis results: JSON Lines rows plus a binary index of their scores."""
+
+    DEFAULT_DIR = "output/results"
+
+    def __init__(self, directory: str = DEFAULT_DIR):
+        """
+        Initialize the ResultsStore, creating its files on first use.
+
+        The directory holds results.jsonl (one row per line, readable with any
+        JSON Lines tool), results.idx (an INDEX_DTYPE entry per row) and
+        jobs.jsonl (the distinct job names, one per line). Rows written by a
+        crashed process without their index entry are dropped on open. Writes
+        from several threads are safe; from several processes they are not.
+
+        Args:
+            directory (str): Directory holding the store's files.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.data_path = self.directory / "results.jsonl"
+        self.index_path = self.directory / "results.idx"
+        self.jobs_path = self.directory / "jobs.jsonl"
+        self._lock = threading.Lock()
+        self._recover()
+        self.jobs = []
+        self._job_ids = {}
+        if self.jobs_path.exists():
+            with open(self.jobs_path, "r", encoding="utf-8") as file:
+                for line in file:
+                    job = json.loads(line)
+                    self._job_ids[job] = len(self.jobs)
+                    self.jobs.append(job)
+
+    def _recover(self):
+        """Truncate the files to the last row fully written to both."""
+        data_size = self.data_path.stat().st_size if self.data_path.exists() else 0
+        index_size = self.index_path.stat().st_size if self.index_path.exists() else 0
+        entries = index_size // INDEX_DTYPE.itemsize
+        if entries:
+            index = np.fromfile(self.index_path, dtype=INDEX_DTYPE, count=entries)
+            ends = index["offset"] + index["length"]
+            # Rows are appended in order, so the valid entries are a prefix
+            entries = int(np.searchsorted(ends, data_size, side="right"))
+        data_end = int(index["offset"][entries - 1] + index["length"][entries - 1]) if entries else 0
+        if index_size != entries * INDEX_DTYPE.itemsize:
+            os.truncate(self.index_path, entries * INDEX_DTYPE.itemsize)
+        if data_size != data_end:
+            os.truncate(self.data_path, data_end)
+
+    def __len__(self) -> int:
+        """Return the number of stored rows."""
+        if not self.index_path.exists():
+            return 0
+        return self.index_path.stat().st_size // INDEX_DTYPE.itemsize
+
+    def _job_id(self, job: str) -> int:
+        """Return a job's number, recording the job the first time it is seen; call with the lock held."""
+        job_id = self._job_ids.get(job)
+        if job_id is None:
+            with open(self.jobs_path, "a", encoding="utf-8") as file:
+                file.write(json.dumps(job) + "\n")
+            job_id = self._job_ids[job] = len(self.jobs)
+            self.jobs.append(job)
+        return job_id
+
+    def append(self, rows: Iterable[ResultRow]) -> int:
+        """
+        Write a batch of rows with one write per file.
+
+        Args:
+            rows (iterable): ResultRows, e.g. from ResultRow.from_analysis().
+
+        Returns:
+            int: Number of rows written.
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        lines = [(json.dumps(row._asdict(), separators=(",", ":")) + "\n").encode("utf-8") for row in rows]
+        with self._lock:
+            index = np.zeros(len(rows), dtype=INDEX_DTYPE)
+            index["length"] = [len(line) for line in lines]
+            index["job"] = [self._job_id(row.job) for row in rows]
+            for column in SCORE_COLUMNS + ("analyzed_at",):
+                index[column] = [getattr(row, column) for row in rows]
+            with open(self.data_path, "ab") as file:
+                start = file.tell()
+                file.write(b"".join(lines))
+            index["offset"] = start + np.concatenate(([0], np.cumsum(index["length"][:-1], dtype=np.uint64)))
+            # The index entry goes last, so a row only counts once both are on disk
+            with open(self.index_path, "ab") as file:
+                file.write(index.tobytes())
+        return len(rows)
+
+    def add(self, file: str, job: str, analysis: dict) -> ResultRow:
+        """
+        Store one analyze_resume() result.
+
+        Args:
+            file (str): Path of the analyzed resume.
+            job (str): Job the resume was scored against.
+            analysis (dict): Result of analyze_resume().
+
+        Returns:
+            ResultRow: The stored row.
+        """
+        row = ResultRow.from_analysis(file, job, analysis)
+        self.append([row])
+        return row
+
+    def writer(self, batch_size: int = 1000) -> "ResultsWriter":
+        """
+        Return a buffered writer that appends rows in batches.
+
+        Args:
+            batch_size (int): Rows buffered before each write (default: 1000).
+
+        Returns:
+            ResultsWriter: Use as a context manager so the last batch is flushed.
+        """
+        return ResultsWriter(self, batch_size)
+
+    def index(self) -> np.ndarray:
+        """
+        Map the index of every stored row without reading the rows themselves.
+
+        Returns:
+            numpy.ndarray: Read-only INDEX_DTYPE entries, one per row in write order.
+        """
+        entries = len(self)
+        if not entries:
+            return np.zeros(0, dtype=INDEX_DTYPE)
+        return np.memmap(self.index_path, dtype=INDEX_DTYPE, mode="r", shape=(entries,))
+
+    def select(self, job: Optional[str] = None, min_scores: Optional[Dict[str, float]] = None,
+               max_scores: Optional[Dict[str, float]] = None, order_by: Optional[str] = None,
+               limit: Optional[int] = None) -> np.ndarray:
+        """
+        Find the rows passing the filters using only the index.
+
+        Args:
+            job (str, optional): Only rows scored against this job.
+            min_scores (dict, optional): Score column -> smallest value kept, e.g. {"total_score": 0.7}.
+            max_scores (dict, optional): Score column -> largest value kept.
+            order_by (str, optional): Score column to sort by, highest first
+                (default: write order).
+            limit (int, optional): Keep at most this many rows.
+
+        Returns:
+            numpy.ndarray: Row numbers of the matching rows.
+        """
+        for column in list(min_scores or ()) + list(max_scores or ()) + ([order_by] if order_by else []):
+            if column not in SCORE_COLUMNS:
+                raise ValueError(f"Unknown score column: {column}. Available columns: {', '.join(SCORE_COLUMNS)}")
+        index = self.index()
+        mask = np.ones(len(index), dtype=bool)
+        if job is not None:
+            job_id = self._job_ids.get(job)
+            if job_id is None:
+                return np.zeros(0, dtype=np.int64)
+            mask &= index["job"] == job_id
+        for column, value in (min_scores or {}).items():
+            mask &= index[column] >= value
+        for column, value in (max_scores or {}).items():
+            mask &= index[column] <= value
+        rows = np.flatnonzero(mask)
+        if order_by is not None:
+            rows = rows[np.argsort(-index[order_by][rows], kind="stable")]
+        return rows[:limit] if limit is not None else rows
+
+    def read(self, rows: Iterable[int]) -> Iterator[ResultRow]:
+        """
+        Read rows by number, parsing only those rows.
+
+        Args:
+            rows (iterable): Row numbers, e.g. from select().
+
+        Yields:
+            ResultRow: Each row, in the order given.
+        """
+        index = self.index()
+        rows = np.asarray(list(rows) if not isinstance(rows, np.ndarray) else rows, dtype=np.int64)
+        if not len(rows):
+            return
+        with open(self.data_path, "rb") as file:
+            for offset, length in zip(index["offset"][rows].tolist(), index["length"][rows].tolist()):
+                file.seek(offset)
+                yield ResultRow(**json.loads(file.read(length).decode("utf-8")))
+
+    def query(self, job: Optional[str] = None, min_scores: Optional[Dict[str, float]] = None,
+              max_scores: Optional[Dict[str, float]] = None, order_by: Optional[str] = None,
+              limit: Optional[int] = None) -> Iterator[ResultRow]:
+        """
+        Read the rows passing the filters, e.g. query(job="Data Scientist", min_scores={"total_score": 0.7}).
+
+        Args:
+            job (str, optional): Only rows scored against this job.
+            min_scores (dict, optional): Score column -> smallest value kept.
+            max_scores (dict, optional): Score column -> largest value kept.
+            order_by (str, optional): Score column to sort by, highest first (default: write order).
+            limit (int, optional): Keep at most this many rows.
+
+        Yields:
+            ResultRow: The matching rows.
+        """
+        return self.read(self.select(job, min_scores, max_scores, order_by, limit))
+
+    def scores(self, job: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """
+        Return score columns for analytics, straight from the index.
+
+        Args:
+            job (str, optional): Only rows scored against this job.
+
+        Returns:
+            dict: Arrays of each score column and "analyzed_at", one entry per row.
+        """
+        index = self.index()
+        if job is not None:
+            index = index[self.select(job)]
+        return {column: np.array(index[column]) for column in SCORE_COLUMNS + ("analyzed_at",)}
+
+    def to_dataframe(self, **filters):
+        """
+        Load the rows passing the filters into a pandas DataFrame.
+
+        Args:
+            **filters: Arguments for select().
+
+        Returns:
+            pandas.DataFrame: One row per stored analysis, one column per ResultRow field.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(list(self.query(**filters)), columns=ResultRow._fields)
+
+
+class ResultsWriter:
+    """Buffer rows and append them to a ResultsStore in batches."""
+
+    def __init__(self, store: ResultsStore, batch_size: int = 1000):
+        """
+        Initialize the ResultsWriter.
+
+        Args:
+            store (ResultsStore): Store to write to.
+            batch_size (int): Rows buffered before each write.
+        """
+        self.store = store
+        self.batch_size = batch_size
+        self._rows = []
+        self._lock = threading.Lock()
+
+    def add(self, row: ResultRow):
+        """Buffer a row, writing the batch once it is full."""
+        with self._lock:
+            self._rows.append(row)
+            if len(self._rows) < self.batch_size:
+                return
+            rows, self._rows = self._rows, []
+        self.store.append(rows)
+
+    def flush(self):
+        """Write every buffered row."""
+        with self._lock:
+            rows, self._rows = self._rows, []
+        self.store.append(rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+        return False
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_default_results_store() -> ResultsStore:
+    """Return the process-wide results store, creating it on first use."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = ResultsStore()
+        return _default_store
+
+
+# Example usage
+if __name__ == "__main__":
+    store = ResultsStore("output/results/example")
+    analysis = {
+        "extracted_data": {"name": "John Doe", "email": "john@example.com", "phone": None, "skills": ["Python", "NLP"]},
+        "skill_score": 0.8, "structure_score": 0.67, "total_score": 0.75, "match_score": 0.62,
+        "recommendations": {"missing_sections": ["Phone"], "skills_to_add": ["sql"], "formatting_tips": []},
+    }
+    with store.writer() as writer:
+        writer.add(ResultRow.from_analysis("john_doe.pdf", "Data Scientist", analysis))
+
+    print("Stored rows:", len(store))
+    for row in store.query(job="Data Scientist", min_scores={"total_score": 0.7}):
+        print(row.name, row.total_score, row.skills)
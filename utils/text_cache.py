@@ -0,0 +1,191 @@
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+from .instrumentation import increment
+
+
+class TextCache:
+    """Size-bounded on-disk cache of extracted resume text, keyed by file content."""
+
+    DEFAULT_DIR = "output/cache/text"
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, cache_dir: str = DEFAULT_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the TextCache.
+
+        Args:
+            cache_dir (str): Directory holding cached text files.
+            max_bytes (int): Total size above which least recently used entries are evicted.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(file_path: str, version: str) -> str:
+        """
+        Build a cache key from a file's bytes and the parser version.
+
+        Args:
+            file_path (str): Path to the source file.
+            version (str): Parser version; bumping it invalidates older entries.
+
+        Returns:
+            str: Hex digest identifying the file content and parser version.
+        """
+        digest = hashlib.sha256(version.encode("utf-8") + b"\0")
+        with open(file_path, "rb") as file:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Return the file path of a cache entry."""
+        return self.cache_dir / key[:2] / f"{key}.txt"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up cached text.
+
+        Args:
+            key (str): Cache key from make_key().
+
+        Returns:
+            str: Cached text, or None on a miss.
+        """
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+            # Refresh the modification time so eviction treats this entry as recently used
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            increment("text_cache.misses")
+            return None
+        with self._lock:
+            self.hits += 1
+        increment("text_cache.hits")
+        return text
+
+    def put(self, key: str, text: str):
+        """
+        Store text in the cache, evicting old entries if the size limit is exceeded.
+
+        Args:
+            key (str): Cache key from make_key().
+            text (str): Extracted text to store.
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = text.encode("utf-8")
+
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+
+        with self._lock:
+            # Replacing an entry frees the old copy's bytes; the size is read before the swap
+            size = self._current_size()
+            try:
+                size -= path.stat().st_size
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, path)
+            self._size = size + len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> list:
+        """List (mtime, size, path) for every cache entry."""
+        entries = []
+        if not self.cache_dir.exists():
+            return entries
+        for path in self.cache_dir.glob("*/*.txt"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _current_size(self) -> int:
+        """Return the total cache size, scanning the directory only once."""
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._entries())
+        return self._size
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits its size limit."""
+        entries = sorted(self._entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            size -= entry_size
+            self.evictions += 1
+        self._size = size
+
+    def clear(self):
+        """Delete every cache entry."""
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._size = 0
+
+    def stats(self) -> dict:
+        """
+        Return hit/miss counters and the current cache size.
+
+        Returns:
+            dict: Cache statistics.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size_bytes": self._current_size(),
+                "max_bytes": self.max_bytes,
+            }
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_text_cache() -> TextCache:
+    """Return the process-wide text cache, creating it on first use."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = TextCache()
+        return _default_cache
+
+
+# Example usage
+if __name__ == "__main__":
+    cache = TextCache("output/cache/example", max_bytes=1024)
+    key = hashlib.sha256(b"example").hexdigest()
+
+    print("Before put:", cache.get(key))
+    cache.put(key, "John Doe\nPython, Machine Learning")
+    print("After put:", cache.get(key))
+    print("Stats:", cache.stats())